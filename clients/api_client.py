@@ -1,11 +1,21 @@
-from typing import Any
+from contextlib import contextmanager, asynccontextmanager
+from typing import Any, Generator, AsyncGenerator
 
 import allure
-from httpx import Client, URL, Response, QueryParams
+from httpx import Client, AsyncClient, URL, Response, QueryParams
 from httpx._types import RequestData, RequestFiles
 
+from tools.allure.steps import async_step
+from tools.http.rate_limit import rate_limiter
+from tools.metrics.latency import RequestTimer, latency_collector
+
 
 class APIClient:
+    """
+    Базовый клиент API: выполняет запросы через httpx.Client, собирает их задержки и соблюдает
+    ограничения запросов к серверу, общие для всех xdist-воркеров (tools/http/rate_limit.py).
+    """
+
     def __init__(self, client: Client):
         self.client = client
 
@@ -18,7 +28,11 @@ class APIClient:
         :param params: GET-параметры запроса (например, ?key=value).
         :return: Объект Response с данными ответа.
         """
-        return self.client.get(url, params=params)
+        with rate_limiter.limit("GET", url):
+            timer = RequestTimer()
+            response = self.client.get(url, params=params, extensions=timer.extensions)
+        latency_collector.record(response, timer)
+        return response
 
     @allure.step("Make POST request to {url}")
     def post(
@@ -37,7 +51,11 @@ class APIClient:
         :param files: Файлы для загрузки на сервер.
         :return: Объект Response с данными ответа.
         """
-        return self.client.post(url, json=json, data=data, files=files)
+        with rate_limiter.limit("POST", url):
+            timer = RequestTimer()
+            response = self.client.post(url, json=json, data=data, files=files, extensions=timer.extensions)
+        latency_collector.record(response, timer)
+        return response
 
     @allure.step("Make PATCH request to {url}")
     def patch(self, url: URL | str, json: Any | None = None) -> Response:
@@ -48,7 +66,11 @@ class APIClient:
         :param json: Данные для обновления в формате JSON.
         :return: Объект Response с данными ответа.
         """
-        return self.client.patch(url, json=json)
+        with rate_limiter.limit("PATCH", url):
+            timer = RequestTimer()
+            response = self.client.patch(url, json=json, extensions=timer.extensions)
+        latency_collector.record(response, timer)
+        return response
 
     @allure.step("Make DELETE request to {url}")
     def delete(self, url: URL | str) -> Response:
@@ -58,4 +80,121 @@ class APIClient:
         :param url: URL-адрес эндпоинта.
         :return: Объект Response с данными ответа.
         """
-        return self.client.delete(url)
+        with rate_limiter.limit("DELETE", url):
+            timer = RequestTimer()
+            response = self.client.delete(url, extensions=timer.extensions)
+        latency_collector.record(response, timer)
+        return response
+
+    @contextmanager
+    def stream(self, method: str, url: URL | str) -> Generator[Response, None, None]:
+        """
+        Выполняет потоковый запрос: тело ответа читается частями внутри блока with, не накапливаясь в памяти.
+        После чтения в метрики эндпоинта, помимо задержек, добавляется скорость чтения тела (throughput).
+
+        :param method: HTTP-метод запроса.
+        :param url: URL-адрес эндпоинта.
+        :return: Потоковый ответ, тело которого нужно прочитать внутри блока with.
+        """
+        with rate_limiter.limit(method, url):
+            timer = RequestTimer()
+            with self.client.stream(method, url, extensions=timer.extensions) as response:
+                yield response
+        timer.add_throughput(response)
+        latency_collector.record(response, timer)
+
+
+class AsyncAPIClient:
+    """
+    Асинхронный аналог APIClient, работающий поверх httpx.AsyncClient.
+
+    Позволяет выполнять сотни конкурентных запросов из одного процесса (например, одного xdist-воркера).
+    """
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    @async_step("Make GET request to {url}")
+    async def get(self, url: URL | str, params: QueryParams | None = None) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :return: Объект Response с данными ответа.
+        """
+        async with rate_limiter.async_limit("GET", url):
+            timer = RequestTimer()
+            response = await self.client.get(url, params=params, extensions=timer.async_extensions)
+        latency_collector.record(response, timer)
+        return response
+
+    @async_step("Make POST request to {url}")
+    async def post(
+            self,
+            url: URL | str,
+            json: Any | None = None,
+            data: RequestData | None = None,
+            files: RequestFiles | None = None
+    ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param data: Форматированные данные формы (например, application/x-www-form-urlencoded).
+        :param files: Файлы для загрузки на сервер.
+        :return: Объект Response с данными ответа.
+        """
+        async with rate_limiter.async_limit("POST", url):
+            timer = RequestTimer()
+            response = await self.client.post(
+                url, json=json, data=data, files=files, extensions=timer.async_extensions
+            )
+        latency_collector.record(response, timer)
+        return response
+
+    @async_step("Make PATCH request to {url}")
+    async def patch(self, url: URL | str, json: Any | None = None) -> Response:
+        """
+        Выполняет асинхронный PATCH-запрос (частичное обновление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные для обновления в формате JSON.
+        :return: Объект Response с данными ответа.
+        """
+        async with rate_limiter.async_limit("PATCH", url):
+            timer = RequestTimer()
+            response = await self.client.patch(url, json=json, extensions=timer.async_extensions)
+        latency_collector.record(response, timer)
+        return response
+
+    @async_step("Make DELETE request to {url}")
+    async def delete(self, url: URL | str) -> Response:
+        """
+        Выполняет асинхронный DELETE-запрос (удаление данных).
+
+        :param url: URL-адрес эндпоинта.
+        :return: Объект Response с данными ответа.
+        """
+        async with rate_limiter.async_limit("DELETE", url):
+            timer = RequestTimer()
+            response = await self.client.delete(url, extensions=timer.async_extensions)
+        latency_collector.record(response, timer)
+        return response
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: URL | str) -> AsyncGenerator[Response, None]:
+        """
+        Выполняет асинхронный потоковый запрос (см. `APIClient.stream`).
+
+        :param method: HTTP-метод запроса.
+        :param url: URL-адрес эндпоинта.
+        :return: Потоковый ответ, тело которого нужно прочитать внутри блока async with.
+        """
+        async with rate_limiter.async_limit(method, url):
+            timer = RequestTimer()
+            async with self.client.stream(method, url, extensions=timer.async_extensions) as response:
+                yield response
+        timer.add_throughput(response)
+        latency_collector.record(response, timer)
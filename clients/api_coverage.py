@@ -1,5 +1,101 @@
+import functools
+import inspect
+from contextvars import ContextVar
+from typing import Callable
+
+from httpx import Response, ResponseNotRead
 from swagger_coverage_tool import SwaggerCoverageTracker
+from swagger_coverage_tool.src.tools.types import EndpointName, ServiceKey, StatusCode
+from swagger_coverage_tool.src.tracker.models import EndpointCoverage
+
+# Шаблон эндпоинта (например, "/api/v1/users/{user_id}"), который вызывается в данный момент.
+# Используется для группировки метрик по эндпоинтам, а не по конкретным URL
+current_endpoint: ContextVar[str | None] = ContextVar("current_endpoint", default=None)
+
+
+def has_response_body(response: Response) -> bool:
+    # Тело потокового ответа (скачивание файла), прочитанное частями, недоступно через response.content
+    try:
+        return bool(response.content)
+    except ResponseNotRead:
+        return response.num_bytes_downloaded > 0
+
+
+class APICoverageTracker(SwaggerCoverageTracker):
+    """
+    Трекер покрытия, который умеет работать как с синхронными, так и с асинхронными методами клиентов.
+
+    Помимо сбора покрытия, на время вызова метода клиента публикует шаблон эндпоинта в `current_endpoint`.
+    Сбор покрытия можно отключить через `enabled` (например, для нагрузочных прогонов).
+    """
+
+    def __init__(self, service: str):
+        super().__init__(service=service)
+        self.enabled = True
+
+    def build_endpoint_coverage_for_httpx(self, endpoint: str, response: Response) -> EndpointCoverage | None:
+        # Базовая реализация вызывает request.read(), а потоковые тела (загрузка файлов) нельзя перечитать
+        # после отправки: файл уже закрыт, а большой файл пришлось бы прочитать в память целиком.
+        # Поэтому наличие тела запроса определяется по заголовкам
+        request = response.request
+        return EndpointCoverage(
+            name=EndpointName(endpoint),
+            method=request.method,
+            service=ServiceKey(self.service),
+            status_code=StatusCode(response.status_code),
+            query_parameters=request.url.params.keys(),
+            is_request_covered=request.headers.get("content-length", "0") != "0"
+                               or "transfer-encoding" in request.headers,
+            is_response_covered=has_response_body(response),
+        )
+
+    def save_coverage(self, endpoint: str, response: Response) -> None:
+        if not self.enabled:
+            return
+
+        if coverage := self.build_endpoint_coverage_for_httpx(endpoint, response):
+            self.storage.save(coverage)
+
+    def track_coverage_httpx(self, endpoint: str):
+        """
+        Декоратор для сбора покрытия эндпоинта.
+
+        :param endpoint: Шаблон эндпоинта (например, "/api/v1/users/{user_id}").
+        :return: Декоратор для метода клиента.
+        """
+
+        def wrapper(func: Callable):
+            signature = inspect.signature(func)
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def inner(*args, **kwargs):
+                    token = current_endpoint.set(str(endpoint))
+                    try:
+                        response = await func(*args, **kwargs)
+                    finally:
+                        current_endpoint.reset(token)
+
+                    self.save_coverage(endpoint, response)
+                    return response
+            else:
+                @functools.wraps(func)
+                def inner(*args, **kwargs):
+                    token = current_endpoint.set(str(endpoint))
+                    try:
+                        response = func(*args, **kwargs)
+                    finally:
+                        current_endpoint.reset(token)
+
+                    self.save_coverage(endpoint, response)
+                    return response
+
+            inner.__signature__ = signature
+            return inner
+
+        return wrapper
+
 
 # Инициализируем трекер для нашего сервиса "api-course"
 # ВАЖНО: 'api-course' должен точно совпадать с ключом `key` в SWAGGER_COVERAGE_SERVICES
-tracker = SwaggerCoverageTracker(service="api-course")
\ No newline at end of file
+tracker = APICoverageTracker(service="api-course")
@@ -1,11 +1,13 @@
 import allure
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
 # Добавили импорт моделей
 from clients.authentication.authentication_schema import LoginRequestSchema, RefreshRequestSchema, LoginResponseSchema
-from clients.public_http_builder import get_public_http_client
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
+from tools.allure.steps import async_step
 from tools.routes import APIRoutes
 
 
@@ -47,10 +49,10 @@ class AuthenticationClient(APIClient):
         )
 
     # Теперь используем pydantic-модель для аннотации
-    def login(self, request: LoginRequestSchema) -> LoginResponseSchema:
+    def login(self, request: LoginRequestSchema) -> ParsedResponse[LoginResponseSchema]:
         response = self.login_api(request)
-        # Инициализируем модель через валидацию JSON строки
-        return LoginResponseSchema.model_validate_json(response.text)
+        # Тело ответа разбирается лениво, при первом обращении к модели или JSON
+        return parse_response(response, LoginResponseSchema)
 
 
 def get_authentication_client() -> AuthenticationClient:
@@ -60,3 +62,50 @@ def get_authentication_client() -> AuthenticationClient:
     :return: Готовый к использованию AuthenticationClient.
     """
     return AuthenticationClient(client=get_public_http_client())
+
+
+class AsyncAuthenticationClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/authentication
+    """
+
+    @async_step("Authenticate user")
+    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/login")
+    async def login_api(self, request: LoginRequestSchema) -> Response:
+        """
+        Метод асинхронно выполняет аутентификацию пользователя.
+
+        :param request: Словарь с email и password.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/login",
+            json=request.model_dump(by_alias=True)
+        )
+
+    @async_step("Refresh authentication token")
+    @tracker.track_coverage_httpx(f"{APIRoutes.AUTHENTICATION}/refresh")
+    async def refresh_api(self, request: RefreshRequestSchema) -> Response:
+        """
+        Метод асинхронно обновляет токен авторизации.
+
+        :param request: Словарь с refreshToken.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(
+            f"{APIRoutes.AUTHENTICATION}/refresh",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def login(self, request: LoginRequestSchema) -> ParsedResponse[LoginResponseSchema]:
+        response = await self.login_api(request)
+        return parse_response(response, LoginResponseSchema)
+
+
+def get_async_authentication_client() -> AsyncAuthenticationClient:
+    """
+    Функция создаёт экземпляр AsyncAuthenticationClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncAuthenticationClient.
+    """
+    return AsyncAuthenticationClient(client=get_async_public_http_client())
@@ -0,0 +1,178 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from http import HTTPStatus
+from typing import Generator, AsyncGenerator
+
+from httpx import Auth, Request, Response
+
+from clients.authentication.authentication_client import get_authentication_client, get_async_authentication_client
+from clients.authentication.authentication_schema import (
+    LoginRequestSchema,
+    LoginResponseSchema,
+    RefreshRequestSchema,
+    TokenSchema
+)
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("TOKEN_AUTH")
+
+
+def get_token_expiration(token: str) -> float | None:
+    """
+    Извлекает время истечения токена (claim `exp`) из JWT без проверки подписи.
+
+    :param token: Access token в формате JWT.
+    :return: Unix-время истечения токена или None, если его не удалось определить.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)  # Восстанавливаем padding base64
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+
+
+class TokenAuth(Auth):
+    """
+    Аутентификация httpx по Bearer-токену с отслеживанием времени жизни токена.
+
+    - Токен обновляется заранее через /authentication/refresh, за `token_refresh_margin` секунд до истечения.
+    - Конкурентные обновления схлопываются в одно (single-flight).
+    - При ответе 401 токен принудительно обновляется и запрос повторяется один раз.
+    - Если refresh не удался, выполняется повторный логин.
+    """
+
+    def __init__(self, login_request: LoginRequestSchema, token: TokenSchema | None = None):
+        """
+        :param login_request: Email и пароль пользователя для (повторного) логина.
+        :param token: Уже полученные токены пользователя, если они есть.
+        """
+        self.login_request = login_request
+
+        self._token: TokenSchema | None = None
+        self._expires_at: float | None = None
+        self._lock = threading.Lock()
+        self._async_lock: asyncio.Lock | None = None
+
+        if token:
+            self._set_token(token)
+
+    @property
+    def token(self) -> TokenSchema | None:
+        return self._token
+
+    def _set_token(self, token: TokenSchema) -> None:
+        self._token = token
+        self._expires_at = get_token_expiration(token.access_token)
+
+    def _is_token_fresh(self) -> bool:
+        """
+        Проверяет, что токен есть и не истечет в ближайшие `token_refresh_margin` секунд.
+        Если время истечения неизвестно, токен считается действительным до первого ответа 401.
+        """
+        if self._token is None:
+            return False
+
+        if self._expires_at is None:
+            return True
+
+        return time.time() < self._expires_at - settings.http_client.token_refresh_margin
+
+    def _authorize(self, request: Request) -> None:
+        request.headers["Authorization"] = f"Bearer {self._token.access_token}"
+
+    # ---------- Синхронный режим ----------
+
+    def _renew_token(self) -> None:
+        authentication_client = get_authentication_client()
+
+        if self._token is not None:
+            logger.info("Refresh access token for user %s", self.login_request.email)
+            response = authentication_client.refresh_api(
+                RefreshRequestSchema(refresh_token=self._token.refresh_token)
+            )
+            if response.status_code == HTTPStatus.OK:
+                self._set_token(LoginResponseSchema.model_validate_json(response.text).token)
+                return
+
+            logger.warning("Unable to refresh access token for user %s, login again", self.login_request.email)
+
+        self._set_token(authentication_client.login(self.login_request).model.token)
+
+    def get_token(self, stale_token: TokenSchema | None = None) -> TokenSchema:
+        """
+        Возвращает действующий токен, при необходимости обновляя его.
+
+        :param stale_token: Токен, который был отклонен сервером (401). Если он все еще текущий,
+        токен будет обновлен принудительно.
+        :return: Действующий токен.
+        """
+        with self._lock:
+            # Пока мы ждали блокировку, токен мог обновить другой поток
+            if self._is_token_fresh() and (stale_token is None or self._token is not stale_token):
+                return self._token
+
+            self._renew_token()
+            return self._token
+
+    def sync_auth_flow(self, request: Request) -> Generator[Request, Response, None]:
+        token = self.get_token()
+        self._authorize(request)
+
+        response = yield request
+
+        if response.status_code == 401:
+            self.get_token(stale_token=token)
+            self._authorize(request)
+            yield request
+
+    # ---------- Асинхронный режим ----------
+
+    async def _async_renew_token(self) -> None:
+        authentication_client = get_async_authentication_client()
+
+        async with authentication_client.client:
+            if self._token is not None:
+                logger.info("Refresh access token for user %s", self.login_request.email)
+                response = await authentication_client.refresh_api(
+                    RefreshRequestSchema(refresh_token=self._token.refresh_token)
+                )
+                if response.status_code == HTTPStatus.OK:
+                    self._set_token(LoginResponseSchema.model_validate_json(response.text).token)
+                    return
+
+                logger.warning("Unable to refresh access token for user %s, login again", self.login_request.email)
+
+            self._set_token((await authentication_client.login(self.login_request)).model.token)
+
+    async def async_get_token(self, stale_token: TokenSchema | None = None) -> TokenSchema:
+        """
+        Асинхронная версия `get_token`.
+
+        :param stale_token: Токен, который был отклонен сервером (401).
+        :return: Действующий токен.
+        """
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+
+        async with self._async_lock:
+            if self._is_token_fresh() and (stale_token is None or self._token is not stale_token):
+                return self._token
+
+            await self._async_renew_token()
+            return self._token
+
+    async def async_auth_flow(self, request: Request) -> AsyncGenerator[Request, Response]:
+        token = await self.async_get_token()
+        self._authorize(request)
+
+        response = yield request
+
+        if response.status_code == 401:
+            await self.async_get_token(stale_token=token)
+            self._authorize(request)
+            yield request
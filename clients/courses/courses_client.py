@@ -1,9 +1,14 @@
 import allure
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
 from clients.courses.courses_schema import (
     GetCoursesQuerySchema,
     CreateCourseRequestSchema,
@@ -11,6 +16,8 @@ from clients.courses.courses_schema import (
     UpdateCourseRequestSchema,
     CourseSchema
 )
+from tools.allure.steps import async_step
+from tools.resources import resource_tracker, get_client_owner
 from tools.routes import APIRoutes
 
 
@@ -74,17 +81,23 @@ class CoursesClient(APIClient):
         :param course_id: Идентификатор курса.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.delete(f"{APIRoutes.COURSES}/{course_id}")
+        response = self.delete(f"{APIRoutes.COURSES}/{course_id}")
+        if response.is_success:
+            resource_tracker.untrack(course_id)
+
+        return response
 
-    def create_course(self, request: CreateCourseRequestSchema) -> CreateCourseResponseSchema:
+    def create_course(self, request: CreateCourseRequestSchema) -> ParsedResponse[CreateCourseResponseSchema]:
         """
         Метод создаёт курс и возвращает типизированный ответ.
 
         :param request: Pydantic-схема с параметрами курса.
-        :return: Pydantic-схема ответа.
+        :return: Ответ с лениво разобранными моделью и JSON.
         """
         response = self.create_course_api(request)
-        return CreateCourseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateCourseResponseSchema)
+        resource_tracker.track("course", parsed_response.model.course.id, get_client_owner(self.client))
+        return parsed_response
 
 
 def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
@@ -94,3 +107,94 @@ def get_courses_client(user: AuthenticationUserSchema) -> CoursesClient:
     :return: Готовый к использованию CoursesClient.
     """
     return CoursesClient(client=get_private_http_client(user))
+
+
+class AsyncCoursesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/courses
+    """
+
+    @async_step("Get courses")
+    @tracker.track_coverage_httpx(APIRoutes.COURSES)
+    async def get_courses_api(self, query: GetCoursesQuerySchema) -> Response:
+        """
+        Метод асинхронного получения списка курсов.
+
+        :param query: Словарь с userId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(APIRoutes.COURSES, params=query.model_dump(by_alias=True))
+
+    @async_step("Get course by id {course_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def get_course_api(self, course_id: str) -> Response:
+        """
+        Метод асинхронного получения курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.COURSES}/{course_id}")
+
+    @async_step("Create course")
+    @tracker.track_coverage_httpx(APIRoutes.COURSES)
+    async def create_course_api(self, request: CreateCourseRequestSchema) -> Response:
+        """
+        Метод асинхронного создания курса.
+
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime,
+        previewFileId, createdByUserId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.COURSES, json=request.model_dump(by_alias=True, mode="json"))
+
+    @async_step("Update course by id {course_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def update_course_api(self, course_id: str, request: UpdateCourseRequestSchema) -> Response:
+        """
+        Метод асинхронного обновления курса.
+
+        :param course_id: Идентификатор курса.
+        :param request: Словарь с title, maxScore, minScore, description, estimatedTime.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(
+            f"{APIRoutes.COURSES}/{course_id}",
+            json=request.model_dump(by_alias=True, exclude_none=True)
+        )
+
+    @async_step("Delete course by id {course_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.COURSES}/{{course_id}}")
+    async def delete_course_api(self, course_id: str) -> Response:
+        """
+        Метод асинхронного удаления курса.
+
+        :param course_id: Идентификатор курса.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        response = await self.delete(f"{APIRoutes.COURSES}/{course_id}")
+        if response.is_success:
+            resource_tracker.untrack(course_id)
+
+        return response
+
+    async def create_course(self, request: CreateCourseRequestSchema) -> ParsedResponse[CreateCourseResponseSchema]:
+        """
+        Метод асинхронно создаёт курс и возвращает типизированный ответ.
+
+        :param request: Pydantic-схема с параметрами курса.
+        :return: Ответ с лениво разобранными моделью и JSON.
+        """
+        response = await self.create_course_api(request)
+        parsed_response = parse_response(response, CreateCourseResponseSchema)
+        resource_tracker.track("course", parsed_response.model.course.id, get_client_owner(self.client))
+        return parsed_response
+
+
+async def get_async_courses_client(user: AuthenticationUserSchema) -> AsyncCoursesClient:
+    """
+    Функция создаёт экземпляр AsyncCoursesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncCoursesClient.
+    """
+    return AsyncCoursesClient(client=await get_async_private_http_client(user))
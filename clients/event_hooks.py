@@ -1,21 +1,47 @@
 import allure
 from httpx import Request, Response
 
-from tools.http.curl import make_curl_from_request
+from config import settings
+from tools.http.curl import make_curl_from_request, CurlHistory, CurlCommand
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 # Инициализируем логгер один раз на весь модуль
 logger = get_logger("HTTP_CLIENT")
 
 
+# Последние запросы текущего теста. cURL по ним формируется только для упавших тестов
+curl_history = CurlHistory(size=settings.curl.history_size)
+
+
+def attach_curl_commands(curl_commands: list[CurlCommand]):
+    """
+    Прикрепляет команды cURL к Allure отчету.
+
+    Если тело запроса не подставлено в команду, рядом прикладывается файл тела под именем,
+    на которое ссылается команда (`--data-binary @file`).
+
+    :param curl_commands: Список команд cURL.
+    """
+    for curl_command in curl_commands:
+        allure.attach(curl_command.command, "cURL command", allure.attachment_type.TEXT)
+        if curl_command.body_file is not None:
+            allure.attach(curl_command.body, curl_command.body_file, extension="bin")
+
+
 def curl_event_hook(request: Request):
     """
-    Event hook для автоматического прикрепления cURL команды к Allure отчету.
+    Event hook для прикрепления cURL команды к Allure отчету.
+
+    В режиме `always` команда формируется и прикладывается сразу, в режиме `on_failure`
+    запрос только сохраняется в кольцевой буфер, а команда формируется, если тест упадет.
 
     :param request: HTTP-запрос, переданный в `httpx` клиент.
     """
-    curl_command = make_curl_from_request(request)
-    allure.attach(curl_command, "cURL command", allure.attachment_type.TEXT)
+    match settings.curl.mode:
+        case "always":
+            attach_curl_commands([make_curl_from_request(request, settings.curl.max_body_size)])
+        case "on_failure":
+            curl_history.append(request)
 
 
 def log_request_event_hook(request: Request):  # Создаем event hook для логирования запроса
@@ -25,7 +51,7 @@ def log_request_event_hook(request: Request):  # Создаем event hook дл
     :param request: Объект запроса HTTPX.
     """
     # Пишем в лог информационное сообщение о запроса
-    logger.info(f'Make {request.method} request to {request.url}')
+    logger.info('Make %s request to %s', request.method, request.url)
 
 
 def log_response_event_hook(response: Response):  # Создаем event hook для логирования ответа
@@ -35,7 +61,33 @@ def log_response_event_hook(response: Response):  # Создаем event hook д
     :param response: Объект ответа HTTPX.
     """
     # Пишем в лог информационное сообщение о полученном ответе
-    logger.info(
-        f"Got response {response.status_code} {response.reason_phrase} from {response.url}"
-    )
+    logger.info("Got response %s %s from %s", response.status_code, response.reason_phrase, response.url)
+
+
+# Асинхронные версии event hooks: httpx.AsyncClient ожидает корутины
+
+async def async_curl_event_hook(request: Request):
+    """
+    Асинхронный event hook для прикрепления cURL команды к Allure отчету.
 
+    :param request: HTTP-запрос, переданный в `httpx.AsyncClient`.
+    """
+    curl_event_hook(request)
+
+
+async def async_log_request_event_hook(request: Request):
+    """
+    Асинхронно логирует информацию об отправленном HTTP-запросе.
+
+    :param request: Объект запроса HTTPX.
+    """
+    log_request_event_hook(request)
+
+
+async def async_log_response_event_hook(response: Response):
+    """
+    Асинхронно логирует информацию о полученном HTTP-ответе.
+
+    :param response: Объект ответа HTTPX.
+    """
+    log_response_event_hook(response)
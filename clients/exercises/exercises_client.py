@@ -1,9 +1,14 @@
 import allure
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
 from clients.exercises.exercises_schema import (
     GetExercisesQuerySchema,
     CreateExerciseRequestSchema,
@@ -13,6 +18,8 @@ from clients.exercises.exercises_schema import (
     UpdateExerciseRequestSchema,
     UpdateExerciseResponseSchema
 )
+from tools.allure.steps import async_step
+from tools.resources import resource_tracker, get_client_owner
 from tools.routes import APIRoutes
 
 
@@ -76,37 +83,47 @@ class ExercisesClient(APIClient):
         :param exercise_id: Идентификатор задания.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+        response = self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+        if response.is_success:
+            resource_tracker.untrack(exercise_id)
+
+        return response
 
     # ---------- Удобные методы (типизированный JSON) ----------
 
-    def get_exercises(self, query: GetExercisesQuerySchema) -> GetExercisesResponseSchema:
+    def get_exercises(self, query: GetExercisesQuerySchema) -> ParsedResponse[GetExercisesResponseSchema]:
         """
         Выполняет запрос списка заданий и возвращает типизированный ответ.
         """
         response = self.get_exercises_api(query)
-        return GetExercisesResponseSchema.model_validate_json(response.text)
+        return parse_response(response, GetExercisesResponseSchema)
 
-    def get_exercise(self, exercise_id: str) -> GetExerciseResponseSchema:
+    def get_exercise(self, exercise_id: str) -> ParsedResponse[GetExerciseResponseSchema]:
         """
         Получает одно задание по ID и возвращает типизированный ответ.
         """
         response = self.get_exercise_api(exercise_id)
-        return GetExerciseResponseSchema.model_validate_json(response.text)
+        return parse_response(response, GetExerciseResponseSchema)
 
-    def create_exercise(self, request: CreateExerciseRequestSchema) -> CreateExerciseResponseSchema:
+    def create_exercise(self, request: CreateExerciseRequestSchema) -> ParsedResponse[CreateExerciseResponseSchema]:
         """
         Создаёт задание и возвращает типизированный ответ.
         """
         response = self.create_exercise_api(request)
-        return CreateExerciseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateExerciseResponseSchema)
+        resource_tracker.track("exercise", parsed_response.model.exercise.id, get_client_owner(self.client))
+        return parsed_response
 
-    def update_exercise(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> UpdateExerciseResponseSchema:
+    def update_exercise(
+            self,
+            exercise_id: str,
+            request: UpdateExerciseRequestSchema
+    ) -> ParsedResponse[UpdateExerciseResponseSchema]:
         """
         Частично обновляет задание и возвращает типизированный ответ.
         """
         response = self.update_exercise_api(exercise_id, request)
-        return UpdateExerciseResponseSchema.model_validate_json(response.text)
+        return parse_response(response, UpdateExerciseResponseSchema)
 
 
 def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
@@ -114,3 +131,119 @@ def get_exercises_client(user: AuthenticationUserSchema) -> ExercisesClient:
     Функция создаёт экземпляр ExercisesClient с приватным HTTP-клиентом (авторизация обязательна).
     """
     return ExercisesClient(client=get_private_http_client(user))
+
+
+class AsyncExercisesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/exercises
+    """
+
+    # ---------- Низкоуровневые методы (httpx.Response) ----------
+    @async_step("Get exercises")
+    @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
+    async def get_exercises_api(self, query: GetExercisesQuerySchema) -> Response:
+        """
+        Метод асинхронного получения списка заданий по courseId.
+
+        :param query: Pydantic-схема с courseId.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(APIRoutes.EXERCISES, params=query.model_dump(by_alias=True))
+
+    @async_step("Get exercise by id {exercise_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def get_exercise_api(self, exercise_id: str) -> Response:
+        """
+        Метод асинхронного получения задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.EXERCISES}/{exercise_id}")
+
+    @async_step("Create exercise")
+    @tracker.track_coverage_httpx(APIRoutes.EXERCISES)
+    async def create_exercise_api(self, request: CreateExerciseRequestSchema) -> Response:
+        """
+        Метод асинхронного создания задания.
+
+        :param request: Pydantic-схема CreateExerciseRequestSchema.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.EXERCISES, json=request.model_dump(by_alias=True))
+
+    @async_step("Update exercise by id {exercise_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def update_exercise_api(self, exercise_id: str, request: UpdateExerciseRequestSchema) -> Response:
+        """
+        Метод асинхронного обновления задания.
+
+        :param exercise_id: Идентификатор задания.
+        :param request: Pydantic-схема UpdateExerciseRequestSchema.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.patch(
+            f"{APIRoutes.EXERCISES}/{exercise_id}",
+            json=request.model_dump(by_alias=True, exclude_none=True)
+        )
+
+    @async_step("Delete exercise by id {exercise_id}")
+    @tracker.track_coverage_httpx(f"{APIRoutes.EXERCISES}/{{exercise_id}}")
+    async def delete_exercise_api(self, exercise_id: str) -> Response:
+        """
+        Метод асинхронного удаления задания.
+
+        :param exercise_id: Идентификатор задания.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        response = await self.delete(f"{APIRoutes.EXERCISES}/{exercise_id}")
+        if response.is_success:
+            resource_tracker.untrack(exercise_id)
+
+        return response
+
+    # ---------- Удобные методы (типизированный JSON) ----------
+
+    async def get_exercises(self, query: GetExercisesQuerySchema) -> ParsedResponse[GetExercisesResponseSchema]:
+        """
+        Асинхронно выполняет запрос списка заданий и возвращает типизированный ответ.
+        """
+        response = await self.get_exercises_api(query)
+        return parse_response(response, GetExercisesResponseSchema)
+
+    async def get_exercise(self, exercise_id: str) -> ParsedResponse[GetExerciseResponseSchema]:
+        """
+        Асинхронно получает одно задание по ID и возвращает типизированный ответ.
+        """
+        response = await self.get_exercise_api(exercise_id)
+        return parse_response(response, GetExerciseResponseSchema)
+
+    async def create_exercise(
+            self,
+            request: CreateExerciseRequestSchema
+    ) -> ParsedResponse[CreateExerciseResponseSchema]:
+        """
+        Асинхронно создаёт задание и возвращает типизированный ответ.
+        """
+        response = await self.create_exercise_api(request)
+        parsed_response = parse_response(response, CreateExerciseResponseSchema)
+        resource_tracker.track("exercise", parsed_response.model.exercise.id, get_client_owner(self.client))
+        return parsed_response
+
+    async def update_exercise(
+            self,
+            exercise_id: str,
+            request: UpdateExerciseRequestSchema
+    ) -> ParsedResponse[UpdateExerciseResponseSchema]:
+        """
+        Асинхронно и частично обновляет задание и возвращает типизированный ответ.
+        """
+        response = await self.update_exercise_api(exercise_id, request)
+        return parse_response(response, UpdateExerciseResponseSchema)
+
+
+async def get_async_exercises_client(user: AuthenticationUserSchema) -> AsyncExercisesClient:
+    """
+    Функция создаёт экземпляр AsyncExercisesClient с приватным HTTP-клиентом (авторизация обязательна).
+    """
+    return AsyncExercisesClient(client=await get_async_private_http_client(user))
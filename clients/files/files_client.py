@@ -1,11 +1,64 @@
+import hashlib
+from typing import Callable
+
 import allure
+from allure_commons.types import AttachmentType
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
+from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, DownloadFileResultSchema
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.private_http_builder import (
+    AuthenticationUserSchema,
+    get_private_http_client,
+    get_async_private_http_client
+)
+from tools.allure.steps import async_step
+from tools.http.uploads import upload_payload_cache
+from tools.resources import resource_tracker, get_client_owner
 from tools.routes import APIRoutes
+from tools.testdata.generator import MB
+
+# Размер части, которой читается тело ответа при скачивании файла
+DOWNLOAD_CHUNK_SIZE = MB
+# Шаблон эндпоинта статических файлов из FileSchema.url: ключ метрик, покрытия, ограничителя запросов и кассет
+STATIC_FILE_ENDPOINT = f"{APIRoutes.STATIC}/{{directory}}/{{filename}}"
+
+
+class DownloadDigest:
+    """
+    SHA-256 и размер тела ответа, которое читается частями.
+    """
+
+    def __init__(self):
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def update(self, chunk: bytes) -> None:
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+
+
+def build_download_result(response: Response, digest: DownloadDigest) -> DownloadFileResultSchema:
+    """
+    Формирует результат скачивания из задержек и скорости, собранных `APIClient.stream`.
+
+    :param response: Закрытый потоковый ответ.
+    :param digest: Хэш и размер прочитанного тела.
+    :return: Результат скачивания.
+    """
+    latency = response.extensions["latency"]
+    result = DownloadFileResultSchema(
+        url=str(response.request.url),
+        status_code=response.status_code,
+        size=digest.size,
+        sha256=digest.sha256.hexdigest(),
+        duration=latency["total"] / 1000,
+        throughput=latency["throughput"]
+    )
+    allure.attach(result.model_dump_json(indent=2), name="Download result", attachment_type=AttachmentType.JSON)
+    return result
 
 
 class FilesClient(APIClient):
@@ -33,11 +86,13 @@ class FilesClient(APIClient):
         :param request: Словарь с filename, directory, upload_file.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.post(
-            APIRoutes.FILES,
-            data=request.model_dump(by_alias=True, exclude={'upload_file'}),
-            files = {"upload_file": request.upload_file.read_bytes()}
-        )
+        # Файл отправляется потоком, без чтения целиком в память
+        with upload_payload_cache.open(request.upload_file) as upload_file:
+            return self.post(
+                APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={'upload_file'}),
+                files={"upload_file": upload_file}
+            )
 
     @allure.step("Delete file by id {file_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
@@ -48,11 +103,40 @@ class FilesClient(APIClient):
         :param file_id: Идентификатор файла.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.delete(f"{APIRoutes.FILES}/{file_id}")
+        response = self.delete(f"{APIRoutes.FILES}/{file_id}")
+        if response.is_success:
+            resource_tracker.untrack(file_id)
+
+        return response
+
+    @allure.step("Download file {url}")
+    @tracker.track_coverage_httpx(STATIC_FILE_ENDPOINT)
+    def download_file_api(self, url: str, on_chunk: Callable[[bytes], None]) -> Response:
+        """
+        Метод потокового скачивания файла по ссылке из FileSchema.url.
+
+        Тело читается частями и передается в `on_chunk`, поэтому расход памяти не зависит от размера файла.
+
+        :param url: Ссылка на файл.
+        :param on_chunk: Обработчик очередной части тела.
+        :return: Закрытый потоковый ответ (тело уже прочитано).
+        """
+        with self.stream("GET", url) as response:
+            for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                on_chunk(chunk)
 
-    def create_file(self, request: CreateFileRequestSchema) -> CreateFileResponseSchema:
+        return response
+
+    def download_file(self, url: str) -> DownloadFileResultSchema:
+        digest = DownloadDigest()
+        response = self.download_file_api(url, digest.update)
+        return build_download_result(response, digest)
+
+    def create_file(self, request: CreateFileRequestSchema) -> ParsedResponse[CreateFileResponseSchema]:
         response = self.create_file_api(request)
-        return CreateFileResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateFileResponseSchema)
+        resource_tracker.track("file", parsed_response.model.file.id, get_client_owner(self.client))
+        return parsed_response
 
 
 def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
@@ -62,3 +146,87 @@ def get_files_client(user: AuthenticationUserSchema) -> FilesClient:
     :return: Готовый к использованию FilesClient.
     """
     return FilesClient(client=get_private_http_client(user))
+
+
+class AsyncFilesClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/files
+    """
+
+    @async_step("Get file by id {file_id}")
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
+    async def get_file_api(self, file_id: str) -> Response:
+        """
+        Метод асинхронного получения файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.FILES}/{file_id}")
+
+    @async_step("Create file")
+    @tracker.track_coverage_httpx(APIRoutes.FILES)
+    async def create_file_api(self, request: CreateFileRequestSchema) -> Response:
+        """
+        Метод асинхронного создания файла.
+
+        :param request: Словарь с filename, directory, upload_file.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        with upload_payload_cache.open(request.upload_file) as upload_file:
+            return await self.post(
+                APIRoutes.FILES,
+                data=request.model_dump(by_alias=True, exclude={'upload_file'}),
+                files={"upload_file": upload_file}
+            )
+
+    @async_step("Delete file by id {file_id}")
+    @tracker.track_coverage_httpx(f'{APIRoutes.FILES}/{{file_id}}')
+    async def delete_file_api(self, file_id: str) -> Response:
+        """
+        Метод асинхронного удаления файла.
+
+        :param file_id: Идентификатор файла.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        response = await self.delete(f"{APIRoutes.FILES}/{file_id}")
+        if response.is_success:
+            resource_tracker.untrack(file_id)
+
+        return response
+
+    @async_step("Download file {url}")
+    @tracker.track_coverage_httpx(STATIC_FILE_ENDPOINT)
+    async def download_file_api(self, url: str, on_chunk: Callable[[bytes], None]) -> Response:
+        """
+        Метод асинхронного потокового скачивания файла по ссылке из FileSchema.url.
+
+        :param url: Ссылка на файл.
+        :param on_chunk: Обработчик очередной части тела.
+        :return: Закрытый потоковый ответ (тело уже прочитано).
+        """
+        async with self.stream("GET", url) as response:
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                on_chunk(chunk)
+
+        return response
+
+    async def download_file(self, url: str) -> DownloadFileResultSchema:
+        digest = DownloadDigest()
+        response = await self.download_file_api(url, digest.update)
+        return build_download_result(response, digest)
+
+    async def create_file(self, request: CreateFileRequestSchema) -> ParsedResponse[CreateFileResponseSchema]:
+        response = await self.create_file_api(request)
+        parsed_response = parse_response(response, CreateFileResponseSchema)
+        resource_tracker.track("file", parsed_response.model.file.id, get_client_owner(self.client))
+        return parsed_response
+
+
+async def get_async_files_client(user: AuthenticationUserSchema) -> AsyncFilesClient:
+    """
+    Функция создаёт экземпляр AsyncFilesClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncFilesClient.
+    """
+    return AsyncFilesClient(client=await get_async_private_http_client(user))
@@ -38,3 +38,14 @@ class GetFileResponseSchema(BaseModel):
     """
     file: FileSchema
 
+
+class DownloadFileResultSchema(BaseModel):
+    """
+    Описание результата потокового скачивания файла.
+    """
+    url: str
+    status_code: int
+    size: int  # Байт
+    sha256: str
+    duration: float  # Секунды
+    throughput: float  # МБ/с
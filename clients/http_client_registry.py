@@ -0,0 +1,195 @@
+import importlib.util
+import threading
+import weakref
+
+from httpx import Client, HTTPTransport, AsyncHTTPTransport, BaseTransport, AsyncBaseTransport, MockTransport, \
+    Request, Response, Limits, Timeout
+
+from config import settings
+from tools.fake_lms import fake_lms
+from tools.http.cassette import cassette, CassetteTransport
+from tools.http.circuit_breaker import CircuitBreakerTransport, circuit_breaker
+from tools.http.retry import RetryTransport, retry_budget
+from tools.logger import get_logger
+
+logger = get_logger("HTTP_CLIENT_REGISTRY")
+
+
+class SharedTransport(BaseTransport):
+    """
+    Обёртка над общим пулом соединений.
+
+    Каждый httpx.Client получает свой экземпляр обёртки, поэтому закрытие отдельного клиента
+    не закрывает общий пул. Пулом управляет HTTPClientRegistry.
+    """
+
+    def __init__(self, transport: BaseTransport):
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        return self.transport.handle_request(request)
+
+    def close(self) -> None:
+        # Общий пул закрывается только через HTTPClientRegistry.close
+        pass
+
+
+class HTTPClientRegistry:
+    """
+    Реестр HTTP-клиентов текущего процесса.
+
+    Хранит один пул соединений на процесс (при запуске через pytest-xdist — на воркер),
+    раздаёт его клиентам и детерминированно закрывает всё в конце сессии.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._transport: BaseTransport | None = None
+        self._clients: weakref.WeakSet[Client] = weakref.WeakSet()
+
+    @staticmethod
+    def get_limits() -> Limits:
+        """
+        Формирует лимиты пула соединений из настроек.
+
+        :return: Объект httpx.Limits.
+        """
+        return Limits(
+            max_connections=settings.http_client.max_connections,
+            max_keepalive_connections=settings.http_client.max_keepalive_connections,
+            keepalive_expiry=settings.http_client.keepalive_expiry,
+        )
+
+    @staticmethod
+    def get_timeout() -> Timeout:
+        """
+        Формирует таймауты из настроек. Не заданные отдельно таймауты равны общему `timeout`.
+
+        :return: Объект httpx.Timeout.
+        """
+        config = settings.http_client
+        timeouts = {
+            "connect": config.connect_timeout,
+            "read": config.read_timeout,
+            "write": config.write_timeout,
+            "pool": config.pool_timeout,
+        }
+        return Timeout(config.timeout, **{name: value for name, value in timeouts.items() if value is not None})
+
+    @staticmethod
+    def is_http2_enabled() -> bool:
+        """
+        Проверяет, можно ли включить HTTP/2. Для HTTP/2 httpx требует установленный пакет h2.
+
+        :return: True, если HTTP/2 включен в настройках и пакет h2 доступен.
+        """
+        if not settings.http_client.http2:
+            return False
+
+        if importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 is enabled in settings, but package 'h2' is not installed. Fallback to HTTP/1.1")
+            return False
+
+        return True
+
+    def get_transport(self) -> SharedTransport:
+        """
+        Возвращает обёртку над общим пулом соединений, создавая пул при первом обращении.
+
+        :return: Транспорт для передачи в httpx.Client.
+        """
+        with self._lock:
+            if self._transport is None:
+                self._transport = self.wrap_transport(
+                    self.build_fake_transport() or
+                    HTTPTransport(limits=self.get_limits(), http2=self.is_http2_enabled())
+                )
+
+            return SharedTransport(self._transport)
+
+    def build_async_transport(self) -> AsyncBaseTransport:
+        """
+        Создаёт асинхронный транспорт с теми же настройками пула.
+
+        Асинхронный пул привязан к event loop, поэтому он не разделяется между клиентами
+        и закрывается вместе со своим httpx.AsyncClient.
+
+        :return: Асинхронный транспорт httpx.
+        """
+        return self.wrap_transport(
+            self.build_fake_transport() or
+            AsyncHTTPTransport(limits=self.get_limits(), http2=self.is_http2_enabled())
+        )
+
+    @staticmethod
+    def build_fake_transport() -> MockTransport | None:
+        """
+        Создаёт транспорт к in-memory реализации LMS API, если она включена в настройках (FAKE_LMS.ENABLED).
+
+        MockTransport поддерживает и синхронные, и асинхронные клиенты, а запросы не покидают процесс.
+
+        :return: Объект httpx.MockTransport или None, если используется реальный сервер.
+        """
+        if not settings.fake_lms.enabled:
+            return None
+
+        return MockTransport(fake_lms.handle)
+
+    @staticmethod
+    def wrap_transport(transport: BaseTransport | AsyncBaseTransport) -> BaseTransport | AsyncBaseTransport:
+        """
+        Оборачивает транспорт слоями из настроек: автоматический выключатель, повторы идемпотентных запросов
+        и запись/воспроизведение кассет.
+
+        :param transport: Транспорт httpx, который выполняет запросы к серверу.
+        :return: Исходный или обёрнутый транспорт.
+        """
+        # Выключатель под повторами: каждая неудачная попытка засчитывается, а разомкнутый выключатель
+        # завершает запрос ошибкой CircuitOpenError, которая не повторяется
+        if settings.circuit_breaker.enabled:
+            transport = CircuitBreakerTransport(transport, circuit_breaker)
+
+        if settings.retry.enabled:
+            transport = RetryTransport(
+                transport,
+                budget=retry_budget,
+                max_attempts=settings.retry.max_attempts,
+                backoff=settings.retry.backoff,
+                max_backoff=settings.retry.max_backoff,
+                retry_patch=settings.retry.retry_patch
+            )
+
+        if cassette.is_enabled:
+            return CassetteTransport(cassette, transport)
+
+        return transport
+
+    def register(self, client: Client) -> Client:
+        """
+        Регистрирует клиент, чтобы закрыть его в конце сессии.
+
+        :param client: Объект httpx.Client.
+        :return: Тот же клиент.
+        """
+        self._clients.add(client)
+        return client
+
+    def close(self) -> None:
+        """
+        Закрывает все зарегистрированные клиенты и общий пул соединений.
+        """
+        with self._lock:
+            clients = list(self._clients)
+            for client in clients:
+                client.close()
+
+            self._clients.clear()
+
+            if self._transport is not None:
+                self._transport.close()
+                self._transport = None
+
+        logger.info("Closed %s HTTP clients and shared connection pool", len(clients))
+
+
+http_client_registry = HTTPClientRegistry()
@@ -0,0 +1,58 @@
+import importlib.util
+import json
+from functools import cached_property
+from typing import Any, Generic, TypeVar
+
+from httpx import Response
+from pydantic import BaseModel
+
+# orjson — необязательная зависимость: разбирает JSON в несколько раз быстрее стандартного модуля json
+if importlib.util.find_spec("orjson") is not None:
+    import orjson
+
+    json_loads = orjson.loads
+else:
+    json_loads = json.loads
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class ParsedResponse(Generic[ModelT]):
+    """
+    Ответ сервера, тело которого разбирается один раз и лениво: и в pydantic-модель, и в JSON-объект.
+
+    JSON-объект разбирается из байтов тела (`response.content`) через orjson, если он установлен, без
+    промежуточного декодирования в строку (`response.text`), и кэшируется. Модель валидируется из этого же
+    объекта, поэтому тело, которое нужно и для модели, и для проверки JSON-схемы, разбирается один раз.
+    """
+
+    def __init__(self, response: Response, model: type[ModelT]):
+        """
+        :param response: Ответ сервера.
+        :param model: Pydantic-модель тела ответа.
+        """
+        self.response = response
+        self.model_type = model
+
+    @property
+    def status_code(self) -> int:
+        return self.response.status_code
+
+    @cached_property
+    def model(self) -> ModelT:
+        return self.model_type.model_validate(self.json)
+
+    @cached_property
+    def json(self) -> Any:
+        return json_loads(self.response.content)
+
+
+def parse_response(response: Response, model: type[ModelT]) -> ParsedResponse[ModelT]:
+    """
+    Оборачивает ответ сервера в ParsedResponse.
+
+    :param response: Ответ сервера.
+    :param model: Pydantic-модель тела ответа.
+    :return: Ответ с ленивым разбором тела.
+    """
+    return ParsedResponse(response, model)
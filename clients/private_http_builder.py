@@ -1,12 +1,24 @@
-from functools import lru_cache
+import threading
+from collections import OrderedDict
 
-from httpx import Client
+from httpx import Client, AsyncClient
 from pydantic import BaseModel
 
-from clients.authentication.authentication_client import get_authentication_client
 from clients.authentication.authentication_schema import LoginRequestSchema
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.authentication.token_auth import TokenAuth
+from clients.event_hooks import (
+    curl_event_hook,
+    log_request_event_hook,
+    log_response_event_hook,
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook
+)
+from clients.http_client_registry import http_client_registry
 from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("PRIVATE_HTTP_BUILDER")
 
 
 class AuthenticationUserSchema(BaseModel, frozen=True):
@@ -14,19 +26,124 @@ class AuthenticationUserSchema(BaseModel, frozen=True):
     password: str
 
 
-@lru_cache(maxsize=None)
-def get_private_http_client(user: AuthenticationUserSchema) -> Client:
-    authentication_client = get_authentication_client()
+class PrivateHTTPClientCache:
+    """
+    Ограниченный LRU-кэш приватных HTTP-клиентов (по одному клиенту на пользователя).
+
+    При переполнении самый давно использованный клиент вытесняется и закрывается.
+    """
+
+    def __init__(self, maxsize: int):
+        """
+        :param maxsize: Максимальное количество клиентов в кэше.
+        """
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._clients: OrderedDict[AuthenticationUserSchema, Client] = OrderedDict()
+
+    def get_or_create(self, user: AuthenticationUserSchema, factory) -> Client:
+        """
+        Возвращает клиент пользователя из кэша или создает новый через factory.
+
+        :param user: Email и пароль пользователя.
+        :param factory: Функция, создающая httpx.Client для пользователя.
+        :return: Объект httpx.Client.
+        """
+        with self._lock:
+            client = self._clients.get(user)
+            if client is not None and not client.is_closed:
+                self._clients.move_to_end(user)
+                return client
+
+        # Логин выполняется вне блокировки, чтобы клиенты разных пользователей создавались параллельно
+        client = factory(user)
+
+        with self._lock:
+            cached_client = self._clients.get(user)
+            if cached_client is not None and not cached_client.is_closed:
+                # Другой поток успел создать клиент раньше — используем его
+                client.close()
+                self._clients.move_to_end(user)
+                return cached_client
+
+            self._clients[user] = client
+
+            while len(self._clients) > self.maxsize:
+                evicted_user, evicted_client = self._clients.popitem(last=False)
+                logger.info("Evict private HTTP client for user %s", evicted_user.email)
+                evicted_client.close()
+
+            return client
+
+    def clear(self) -> None:
+        """
+        Закрывает и удаляет из кэша все клиенты.
+        """
+        with self._lock:
+            for client in self._clients.values():
+                client.close()
+
+            self._clients.clear()
+
+
+private_http_client_cache = PrivateHTTPClientCache(maxsize=settings.http_client.private_clients_cache_size)
 
-    login_request = LoginRequestSchema(email=user.email, password=user.password)
-    login_response = authentication_client.login(login_request)
 
-    return Client(
-        timeout=settings.http_client.timeout,
+def build_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Функция создаёт httpx.Client, который сам получает и обновляет токен пользователя.
+
+    :param user: Email и пароль пользователя.
+    :return: Готовый к использованию объект httpx.Client.
+    """
+    auth = TokenAuth(login_request=LoginRequestSchema(email=user.email, password=user.password))
+    # Логинимся сразу, чтобы ошибка аутентификации проявилась при создании клиента, а не в середине теста
+    auth.get_token()
+
+    client = Client(
+        auth=auth,
+        timeout=http_client_registry.get_timeout(),
         base_url=settings.http_client.client_url,
-        headers={"Authorization": f"Bearer {login_response.token.access_token}"},
+        transport=http_client_registry.get_transport(),
         event_hooks={
             "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
             "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
         },
     )
+    return http_client_registry.register(client)
+
+
+def get_private_http_client(user: AuthenticationUserSchema) -> Client:
+    """
+    Функция возвращает закэшированный приватный httpx.Client пользователя или создаёт новый.
+
+    :param user: Email и пароль пользователя.
+    :return: Готовый к использованию объект httpx.Client.
+    """
+    return private_http_client_cache.get_or_create(user, build_private_http_client)
+
+
+async def get_async_private_http_client(user: AuthenticationUserSchema) -> AsyncClient:
+    """
+    Функция выполняет асинхронную аутентификацию и создаёт httpx.AsyncClient с токеном пользователя.
+
+    В отличие от синхронной версии клиент не кэшируется: httpx.AsyncClient привязан к event loop,
+    поэтому его жизненным циклом управляет вызывающий код (например, через `async with`).
+
+    :param user: Email и пароль пользователя.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    auth = TokenAuth(login_request=LoginRequestSchema(email=user.email, password=user.password))
+    await auth.async_get_token()
+
+    return AsyncClient(
+        auth=auth,
+        timeout=http_client_registry.get_timeout(),
+        base_url=settings.http_client.client_url,
+        transport=http_client_registry.build_async_transport(),
+        event_hooks={
+            "request": [async_curl_event_hook, async_log_request_event_hook],  # Логируем исходящие HTTP-запросы
+            "response": [async_log_response_event_hook]  # Логируем полученные HTTP-ответы
+        },
+    )
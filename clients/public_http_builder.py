@@ -1,6 +1,14 @@
-from httpx import Client
+from httpx import Client, AsyncClient
 
-from clients.event_hooks import curl_event_hook, log_request_event_hook, log_response_event_hook
+from clients.event_hooks import (
+    curl_event_hook,
+    log_request_event_hook,
+    log_response_event_hook,
+    async_curl_event_hook,
+    async_log_request_event_hook,
+    async_log_response_event_hook
+)
+from clients.http_client_registry import http_client_registry
 from config import settings
 
 
@@ -8,13 +16,35 @@ def get_public_http_client() -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками.
 
+    Клиент использует общий пул соединений воркера, поэтому создание нового клиента
+    не приводит к новому TCP-рукопожатию. Все клиенты закрываются в конце сессии.
+
     :return: Готовый к использованию объект httpx.Client.
     """
-    return Client(
-        timeout=settings.http_client.timeout,
+    client = Client(
+        timeout=http_client_registry.get_timeout(),
         base_url=settings.http_client.client_url,
+        transport=http_client_registry.get_transport(),
         event_hooks={
             "request": [curl_event_hook, log_request_event_hook],  # Логируем исходящие HTTP-запросы
             "response": [log_response_event_hook]  # Логируем полученные HTTP-ответы
         }
-    )
\ No newline at end of file
+    )
+    return http_client_registry.register(client)
+
+
+def get_async_public_http_client() -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с базовыми настройками.
+
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=http_client_registry.get_timeout(),
+        base_url=settings.http_client.client_url,
+        transport=http_client_registry.build_async_transport(),
+        event_hooks={
+            "request": [async_curl_event_hook, async_log_request_event_hook],  # Логируем исходящие HTTP-запросы
+            "response": [async_log_response_event_hook]  # Логируем полученные HTTP-ответы
+        }
+    )
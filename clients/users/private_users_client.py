@@ -1,10 +1,17 @@
 import allure
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.private_http_builder import get_private_http_client, AuthenticationUserSchema
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.private_http_builder import (
+    get_private_http_client,
+    get_async_private_http_client,
+    AuthenticationUserSchema
+)
 from clients.users.users_schema import UpdateUserRequestSchema, GetUserResponseSchema
+from tools.allure.steps import async_step
+from tools.resources import resource_tracker
 from tools.routes import APIRoutes
 
 
@@ -44,7 +51,11 @@ class PrivateUsersClient(APIClient):
         :param request: Словарь с email, lastName, firstName, middleName.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+        response = self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+        if response.is_success and request.email:
+            resource_tracker.change_owner_email(user_id, request.email)
+
+        return response
 
     @allure.step("Delete user by id {user_id}")
     @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
@@ -55,11 +66,15 @@ class PrivateUsersClient(APIClient):
         :param user_id: Идентификатор пользователя.
         :return: Ответ от сервера в виде объекта httpx.Response
         """
-        return self.delete(f"{APIRoutes.USERS}/{user_id}")
+        response = self.delete(f"{APIRoutes.USERS}/{user_id}")
+        if response.is_success:
+            resource_tracker.untrack(user_id)
+
+        return response
 
-    def get_user(self, user_id: str) -> GetUserResponseSchema:
+    def get_user(self, user_id: str) -> ParsedResponse[GetUserResponseSchema]:
         response = self.get_user_api(user_id)
-        return GetUserResponseSchema.model_validate_json(response.text)
+        return parse_response(response, GetUserResponseSchema)
 
 
 def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClient:
@@ -69,3 +84,74 @@ def get_private_users_client(user: AuthenticationUserSchema) -> PrivateUsersClie
     :return: Готовый к использованию PrivateUsersClient.
     """
     return PrivateUsersClient(client=get_private_http_client(user))
+
+
+class AsyncPrivateUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    @async_step("Get user me")
+    @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/me')
+    async def get_user_me_api(self) -> Response:
+        """
+        Метод асинхронного получения текущего пользователя.
+
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.USERS}/me")
+
+    @async_step("Get user by id {user_id}")
+    @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Метод асинхронного получения пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.get(f"{APIRoutes.USERS}/{user_id}")
+
+    @async_step("Update user by id {user_id}")
+    @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
+    async def update_user_api(self, user_id: str, request: UpdateUserRequestSchema) -> Response:
+        """
+        Метод асинхронного обновления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :param request: Словарь с email, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        response = await self.patch(f"{APIRoutes.USERS}/{user_id}", json=request.model_dump(by_alias=True))
+        if response.is_success and request.email:
+            resource_tracker.change_owner_email(user_id, request.email)
+
+        return response
+
+    @async_step("Delete user by id {user_id}")
+    @tracker.track_coverage_httpx(f'{APIRoutes.USERS}/{{user_id}}')
+    async def delete_user_api(self, user_id: str) -> Response:
+        """
+        Метод асинхронного удаления пользователя по идентификатору.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        response = await self.delete(f"{APIRoutes.USERS}/{user_id}")
+        if response.is_success:
+            resource_tracker.untrack(user_id)
+
+        return response
+
+    async def get_user(self, user_id: str) -> ParsedResponse[GetUserResponseSchema]:
+        response = await self.get_user_api(user_id)
+        return parse_response(response, GetUserResponseSchema)
+
+
+async def get_async_private_users_client(user: AuthenticationUserSchema) -> AsyncPrivateUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPrivateUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPrivateUsersClient.
+    """
+    return AsyncPrivateUsersClient(client=await get_async_private_http_client(user))
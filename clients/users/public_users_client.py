@@ -1,10 +1,14 @@
 import allure
 from httpx import Response
 
-from clients.api_client import APIClient
+from clients.api_client import APIClient, AsyncAPIClient
 from clients.api_coverage import tracker
-from clients.public_http_builder import get_public_http_client
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.private_http_builder import AuthenticationUserSchema
+from clients.public_http_builder import get_public_http_client, get_async_public_http_client
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from tools.allure.steps import async_step
+from tools.resources import resource_tracker
 from tools.routes import APIRoutes
 
 
@@ -25,9 +29,12 @@ class PublicUsersClient(APIClient):
         return self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
 
     # Добавили новый метод
-    def create_user(self, request: CreateUserRequestSchema) -> CreateUserResponseSchema:
+    def create_user(self, request: CreateUserRequestSchema) -> ParsedResponse[CreateUserResponseSchema]:
         response = self.create_user_api(request)
-        return CreateUserResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateUserResponseSchema)
+        owner = AuthenticationUserSchema(email=request.email, password=request.password)
+        resource_tracker.track("user", parsed_response.model.user.id, owner)
+        return parsed_response
 
 
 def get_public_users_client() -> PublicUsersClient:
@@ -37,3 +44,36 @@ def get_public_users_client() -> PublicUsersClient:
     :return: Готовый к использованию PublicUsersClient.
     """
     return PublicUsersClient(client=get_public_http_client())
+
+
+class AsyncPublicUsersClient(AsyncAPIClient):
+    """
+    Асинхронный клиент для работы с /api/v1/users
+    """
+
+    @async_step("Create user")
+    @tracker.track_coverage_httpx(APIRoutes.USERS)
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Метод асинхронно создает пользователя.
+
+        :param request: Словарь с email, password, lastName, firstName, middleName.
+        :return: Ответ от сервера в виде объекта httpx.Response
+        """
+        return await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+
+    async def create_user(self, request: CreateUserRequestSchema) -> ParsedResponse[CreateUserResponseSchema]:
+        response = await self.create_user_api(request)
+        parsed_response = parse_response(response, CreateUserResponseSchema)
+        owner = AuthenticationUserSchema(email=request.email, password=request.password)
+        resource_tracker.track("user", parsed_response.model.user.id, owner)
+        return parsed_response
+
+
+def get_async_public_users_client() -> AsyncPublicUsersClient:
+    """
+    Функция создаёт экземпляр AsyncPublicUsersClient с уже настроенным HTTP-клиентом.
+
+    :return: Готовый к использованию AsyncPublicUsersClient.
+    """
+    return AsyncPublicUsersClient(client=get_async_public_http_client())
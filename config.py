@@ -1,20 +1,193 @@
-from typing import Self
+import tempfile
+from pathlib import Path
+from typing import Self, Literal
 
-from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath
+from pydantic import BaseModel, HttpUrl, FilePath, DirectoryPath, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class HTTPClientConfig(BaseModel):
     url: HttpUrl
     timeout: float
+    # Отдельные таймауты фаз запроса в секундах. Не заданные равны timeout.
+    # Короткий connect_timeout позволяет быстро упасть, если сервер недоступен
+    connect_timeout: float | None = 5.0
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = 10.0
+
+    # Настройки общего пула соединений (один пул на процесс/xdist-воркер)
+    http2: bool = False
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    # Токен обновляется заранее, за указанное число секунд до истечения
+    token_refresh_margin: float = 60.0
+    # Максимальное число приватных клиентов (по одному на пользователя) в кэше воркера
+    private_clients_cache_size: int = 256
 
     @property
     def client_url(self) -> str:
         return str(self.url)
 
 
+class UsersPoolConfig(BaseModel):
+    # Количество пользователей, создаваемых заранее на каждом воркере (0 — пул отключен)
+    size: int = 5
+    # Количество потоков для параллельного создания пользователей
+    concurrency: int = 5
+
+
+class EntityFactoryConfig(BaseModel):
+    # Количество потоков для параллельного создания независимых сущностей
+    concurrency: int = 5
+    # Количество сущностей, создаваемых для тестов получения списков
+    batch_size: int = 3
+
+
+class CurlConfig(BaseModel):
+    # always — прикладывать cURL к каждому запросу, on_failure — только для упавших тестов, never — не прикладывать
+    mode: Literal["always", "on_failure", "never"] = "on_failure"
+    # Сколько последних запросов теста хранить для режима on_failure
+    history_size: int = 20
+    # Тела больше этого размера (в байтах) заменяются ссылкой --data-binary @file
+    max_body_size: int = 4096
+
+
+class LoggingConfig(BaseModel):
+    # Уровень логирования для логгеров и консоли
+    level: str = "DEBUG"
+    # Выводить логи в консоль
+    console: bool = True
+    # Папка для JSON-lines логов (по файлу на xdist-воркер). None — не писать JSON-логи
+    json_dir: Path | None = None
+    # Уровень логирования для JSON-lines логов
+    json_level: str = "DEBUG"
+
+
+class MetricsConfig(BaseModel):
+    # Собирать задержки запросов по эндпоинтам
+    enabled: bool = True
+    # Папка для гистограмм воркеров и итогового отчета latency-report.json
+    directory: Path = Path("./metrics")
+    # Относительная погрешность перцентилей в гистограммах
+    precision: float = 0.01
+
+
+class LatencyBudgetConfig(BaseModel):
+    # fail — превышение бюджета роняет тест, warn — только предупреждение в отчете
+    mode: Literal["fail", "warn"] = "fail"
+    # Бюджеты в миллисекундах по ключу "METHOD шаблон эндпоинта", например {"GET /api/v1/courses": 150}
+    budgets: dict[str, float] = {}
+
+
+class CassetteConfig(BaseModel):
+    # off — обычный режим, record — записывать ответы сервера в кассеты, replay — воспроизводить без сервера
+    mode: Literal["off", "record", "replay"] = "off"
+    directory: Path = Path("./cassettes")
+
+
+class FakeLMSConfig(BaseModel):
+    # Вместо сервера использовать in-memory реализацию LMS API (tools/fake_lms.py)
+    enabled: bool = False
+
+
+class UploadsConfig(BaseModel):
+    # Файлы до этого размера (в байтах) кэшируются в памяти воркера через mmap, большие — читаются потоком с диска
+    mmap_max_size: int = 64 * 1024 * 1024
+
+
+class RetryConfig(BaseModel):
+    # Повторять GET/DELETE (и PATCH, если retry_patch) при ошибках соединения и ответах 502/503/504. POST не повторяется
+    enabled: bool = True
+    # Максимальное количество попыток запроса, включая первую
+    max_attempts: int = 3
+    # Базовая и максимальная пауза перед повтором в секундах (экспоненциальная, с джиттером)
+    backoff: float = 0.5
+    max_backoff: float = 8.0
+    # Максимальное количество повторов за сессию на воркер
+    budget: int = 50
+    retry_patch: bool = False
+
+
+class LocalServerConfig(BaseModel):
+    # Запускать на каждом xdist-воркере свой сервер LMS API с отдельной базой SQLite вместо HTTP_CLIENT.URL
+    enabled: bool = False
+    # Каталог с приложением сервера (репозиторий qa-automation-engineer-api-course) и ASGI-приложение uvicorn
+    app_dir: Path | None = None
+    app: str = "main:app"
+    host: str = "127.0.0.1"
+    # Каталог для баз данных и логов серверов
+    directory: Path = Path(tempfile.gettempdir()).joinpath("autotests-api-servers")
+    startup_timeout: float = 30.0
+    # Дополнительные переменные окружения сервера, например {"JWT_SECRET_KEY": "..."}.
+    # Могут содержать секреты, поэтому не выгружаются в model_dump (environment.properties Allure)
+    env: dict[str, str] = Field(default={}, exclude=True)
+
+
+class RateLimitGroupConfig(BaseModel):
+    # Шаблоны ключей "METHOD шаблон эндпоинта" (fnmatch), например ["POST /api/v1/files", "* /api/v1/courses*"]
+    routes: list[str]
+    # Запросов в секунду на все воркеры хоста и допустимая пачка запросов сверх этой скорости
+    rate: float | None = None
+    burst: int = 1
+    # Одновременно выполняемых запросов на все воркеры хоста
+    concurrency: int | None = None
+
+
+class RateLimitConfig(BaseModel):
+    # Ограничение запросов к серверу, общее для всех xdist-воркеров (tools/http/rate_limit.py)
+    enabled: bool = False
+    # Каталог файлов состояния ограничителя, общий для всех воркеров хоста
+    directory: Path = Path(tempfile.gettempdir()).joinpath("autotests-api-rate-limit")
+    # Группы эндпоинтов по названию, например {"files": {"routes": ["POST /api/v1/files"], "concurrency": 2}}
+    groups: dict[str, RateLimitGroupConfig] = {}
+
+
+class HealthCheckConfig(BaseModel):
+    # Перед запуском тестов проверить, что сервер отвечает, и завершить запуск, если нет
+    enabled: bool = True
+    timeout: float = 5.0
+
+
+class CircuitBreakerConfig(BaseModel):
+    # После failure_threshold ошибок соединения/таймаутов подряд запросы сразу завершаются ошибкой
+    enabled: bool = True
+    failure_threshold: int = 5
+    # Через сколько секунд пропустить пробный запрос, чтобы проверить, восстановился ли сервер
+    reset_timeout: float = 30.0
+
+
+class SchedulingConfig(BaseModel):
+    # Распределять тесты по xdist-воркерам по длительности из прошлых запусков (вместо --dist load)
+    enabled: bool = True
+    # История длительностей тестов, кэшируется в CI между запусками
+    history_file: Path = Path("./test-durations.json")
+    # Вес длительности последнего запуска в скользящем среднем
+    smoothing: float = 0.5
+
+
+class FakerConfig(BaseModel):
+    # Количество заранее генерируемых значений каждого провайдера (текст, имена и т.д.)
+    pool_size: int = 1024
+    # Seed запуска, из которого выводятся seed воркеров и тестов (tools/seeding.py). None — случайный seed
+    seed: int | None = None
+
+
+class CleanupConfig(BaseModel):
+    # Удалять в конце сессии пользователей, файлы, курсы и задания, созданные через create_* методы клиентов
+    enabled: bool = True
+    # Количество параллельных запросов удаления
+    concurrency: int = 10
+
+
 class TestDataConfig(BaseModel):
     image_png_file: FilePath
+    # Кэш сгенерированных тестовых файлов (tools/testdata/generator.py)
+    generated_files_dir: Path = Path(tempfile.gettempdir()).joinpath("autotests-api-files")
+    # Seed по умолчанию для генерации тестовых файлов
+    seed: int = 0
 
 
 class Settings(BaseSettings):
@@ -27,6 +200,23 @@ class Settings(BaseSettings):
 
     test_data: TestDataConfig
     http_client: HTTPClientConfig
+    users_pool: UsersPoolConfig = UsersPoolConfig()
+    entity_factory: EntityFactoryConfig = EntityFactoryConfig()
+    curl: CurlConfig = CurlConfig()
+    logging: LoggingConfig = LoggingConfig()
+    metrics: MetricsConfig = MetricsConfig()
+    latency_budget: LatencyBudgetConfig = LatencyBudgetConfig()
+    cassette: CassetteConfig = CassetteConfig()
+    fake_lms: FakeLMSConfig = FakeLMSConfig()
+    uploads: UploadsConfig = UploadsConfig()
+    cleanup: CleanupConfig = CleanupConfig()
+    faker: FakerConfig = FakerConfig()
+    retry: RetryConfig = RetryConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    local_server: LocalServerConfig = LocalServerConfig()
+    health_check: HealthCheckConfig = HealthCheckConfig()
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    scheduling: SchedulingConfig = SchedulingConfig()
     allure_results_dir: DirectoryPath  # Добавили новое поле
 
     # Добавили метод initialize
@@ -4,5 +4,15 @@ pytest_plugins = (
     "fixtures.courses",
     "fixtures.exercises",
     "fixtures.authentication",
-    "fixtures.allure"
+    "fixtures.factory",
+    "fixtures.allure",
+    "fixtures.schema",
+    "fixtures.http_clients",
+    "fixtures.metrics",
+    "fixtures.cassettes",
+    "fixtures.resources",
+    "fixtures.seeding",
+    "fixtures.local_server",
+    "fixtures.health",
+    "fixtures.scheduling"
 )
@@ -1,5 +1,7 @@
 import pytest
 
+from clients.event_hooks import curl_history, attach_curl_commands
+from config import settings
 from tools.allure.environment import create_allure_environment_file
 
 
@@ -8,4 +10,25 @@ def save_allure_environment_file():
     # До начала автотестов ничего не делаем
     yield  # Запукаются автотесты...
     # После завершения автотестов создаем файл environment.properties
-    create_allure_environment_file()
\ No newline at end of file
+    create_allure_environment_file()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    # Запросы, сделанные до теста (например, сессионными фикстурами), к тесту не относятся
+    curl_history.clear()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    outcome = yield
+    report: pytest.TestReport = outcome.get_result()
+
+    if settings.curl.mode != "on_failure":
+        return
+
+    # Прикладываем cURL последних запросов только если упала подготовка, тест или очистка
+    if report.failed:
+        attach_curl_commands(curl_history.render(settings.curl.max_body_size))
+    elif report.when == "teardown":
+        curl_history.clear()
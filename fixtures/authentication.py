@@ -4,5 +4,5 @@ from clients.authentication.authentication_client import AuthenticationClient, g
 
 
 @pytest.fixture
-def authentication_client() -> AuthenticationClient:
+def authentication_client(lms_health: None) -> AuthenticationClient:
     return get_authentication_client()
\ No newline at end of file
@@ -0,0 +1,23 @@
+import pytest
+
+from fixtures.metrics import is_xdist_worker
+from tools.http.cassette import cassette
+from tools.seeding import session_seed
+
+
+def pytest_sessionstart(session: pytest.Session):
+    # Seed записи сохраняется один раз главным процессом, воркеры используют тот же seed
+    if cassette.mode == "record" and not is_xdist_worker(session.config):
+        cassette.save_seed(session_seed.seed)
+
+
+@pytest.fixture(autouse=True)
+def use_cassette(request: pytest.FixtureRequest):
+    if not cassette.is_enabled:
+        yield
+        return
+
+    # Запросы теста и его фикстур записываются в кассету (или воспроизводятся из кассеты) с именем по nodeid
+    cassette.use(request.node.nodeid)
+    yield  # Запускается автотест...
+    cassette.eject()
@@ -18,14 +18,6 @@ def courses_client(function_user: UserFixture) -> CoursesClient:
 
 
 @pytest.fixture
-def function_course(
-        courses_client: CoursesClient,
-        function_user: UserFixture,
-        function_file: FileFixture
-) -> CourseFixture:
-    request = CreateCourseRequestSchema(
-        preview_file_id=function_file.response.file.id,
-        created_by_user_id=function_user.response.user.id
-    )
-    response = courses_client.create_course(request)
-    return CourseFixture(request=request, response=response)
+def function_course(entity_factory, function_user: UserFixture, function_file: FileFixture) -> CourseFixture:
+    [course] = entity_factory.build(CreateCourseRequestSchema, existing=[function_user, function_file])
+    return course
@@ -4,6 +4,7 @@ from pydantic import BaseModel
 from clients.exercises.exercises_client import ExercisesClient, get_exercises_client
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema
 from fixtures.courses import CourseFixture
+from fixtures.users import UserFixture
 
 
 class ExerciseFixture(BaseModel):
@@ -18,13 +19,10 @@ def exercises_client(function_user) -> ExercisesClient:
 
 
 @pytest.fixture
-def function_exercise(exercises_client: ExercisesClient, function_course: CourseFixture) -> ExerciseFixture:
+def function_exercise(entity_factory, function_user: UserFixture, function_course: CourseFixture) -> ExerciseFixture:
     """
     Фикстура для создания тестового задания (exercise).
     Использует созданный курс (function_course).
     """
-    request = CreateExerciseRequestSchema(
-        course_id=function_course.response.course.id
-    )
-    response = exercises_client.create_exercise(request)
-    return ExerciseFixture(request=request, response=response)
+    [exercise] = entity_factory.build(CreateExerciseRequestSchema, existing=[function_user, function_course])
+    return exercise
@@ -0,0 +1,179 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Sequence
+
+import pytest
+from pydantic import BaseModel
+
+from clients.courses.courses_client import get_courses_client
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from clients.exercises.exercises_client import get_exercises_client
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema
+from clients.files.files_client import get_files_client
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.users.public_users_client import get_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+from fixtures.courses import CourseFixture
+from fixtures.exercises import ExerciseFixture
+from fixtures.files import FileFixture
+from fixtures.users import UserFixture, create_user
+
+# Граф зависимостей между сущностями: чтобы создать сущность, нужны все перечисленные сущности
+ENTITY_DEPENDENCIES: dict[type[BaseModel], tuple[type[BaseModel], ...]] = {
+    CreateUserRequestSchema: (),
+    CreateFileRequestSchema: (CreateUserRequestSchema,),
+    CreateCourseRequestSchema: (CreateUserRequestSchema, CreateFileRequestSchema),
+    CreateExerciseRequestSchema: (CreateUserRequestSchema, CreateCourseRequestSchema),
+}
+
+# Уже созданные сущности ветки графа: схема запроса -> фикстура
+Entities = dict[type[BaseModel], BaseModel]
+# Запросы создания сущностей ветки в порядке создания: схема запроса -> данные запроса
+Plan = list[tuple[type[BaseModel], BaseModel]]
+
+
+class EntityFactory:
+    """
+    Фабрика тестовых сущностей, учитывающая граф зависимостей ENTITY_DEPENDENCIES.
+
+    Каждая запрошенная сущность создается вместе со своей веткой зависимостей, а независимые ветки
+    создаются параллельно. Например, для N курсов параллельно выполняется N цепочек "файл -> курс".
+    Уже существующие сущности (например, пользователь или курс) передаются в `build` и переиспользуются.
+
+    Данные запросов всех веток генерируются заранее и последовательно, а параллельно выполняются только
+    HTTP-запросы: иначе потоки брали бы значения из общего генератора `fake` в случайном порядке,
+    и данные теста не воспроизводились бы по seed.
+    """
+
+    def __init__(self, concurrency: int):
+        """
+        :param concurrency: Максимальное количество параллельно создаваемых веток.
+        """
+        self.concurrency = max(concurrency, 1)
+
+        self.requests: dict[type[BaseModel], Callable[[], BaseModel]] = {
+            CreateUserRequestSchema: CreateUserRequestSchema,
+            CreateFileRequestSchema: lambda: CreateFileRequestSchema(upload_file=settings.test_data.image_png_file),
+            CreateCourseRequestSchema: CreateCourseRequestSchema,
+            CreateExerciseRequestSchema: CreateExerciseRequestSchema,
+        }
+        self.creators: dict[type[BaseModel], Callable[[BaseModel, Entities], BaseModel]] = {
+            CreateUserRequestSchema: self.create_user,
+            CreateFileRequestSchema: self.create_file,
+            CreateCourseRequestSchema: self.create_course,
+            CreateExerciseRequestSchema: self.create_exercise,
+        }
+
+    @staticmethod
+    def create_user(request: CreateUserRequestSchema, entities: Entities) -> UserFixture:
+        return create_user(get_public_users_client(), request)
+
+    @staticmethod
+    def create_file(request: CreateFileRequestSchema, entities: Entities) -> FileFixture:
+        user: UserFixture = entities[CreateUserRequestSchema]
+
+        response = get_files_client(user.authentication_user).create_file(request)
+        return FileFixture(request=request, response=response.model)
+
+    @staticmethod
+    def create_course(request: CreateCourseRequestSchema, entities: Entities) -> CourseFixture:
+        user: UserFixture = entities[CreateUserRequestSchema]
+        file: FileFixture = entities[CreateFileRequestSchema]
+
+        request = request.model_copy(
+            update={"preview_file_id": file.response.file.id, "created_by_user_id": user.response.user.id}
+        )
+        response = get_courses_client(user.authentication_user).create_course(request)
+        return CourseFixture(request=request, response=response.model)
+
+    @staticmethod
+    def create_exercise(request: CreateExerciseRequestSchema, entities: Entities) -> ExerciseFixture:
+        user: UserFixture = entities[CreateUserRequestSchema]
+        course: CourseFixture = entities[CreateCourseRequestSchema]
+
+        request = request.model_copy(update={"course_id": course.response.course.id})
+        response = get_exercises_client(user.authentication_user).create_exercise(request)
+        return ExerciseFixture(request=request, response=response.model)
+
+    def plan_branch(self, schema: type[BaseModel], existing: set[type[BaseModel]]) -> Plan:
+        """
+        Генерирует данные запросов сущности и ее недостающих зависимостей.
+
+        :param schema: Схема запроса создания сущности (узел графа).
+        :param existing: Схемы уже созданных или запланированных сущностей ветки, дополняется.
+        :return: Пары "схема — запрос" в порядке создания.
+        """
+        plan: Plan = []
+        for dependency in ENTITY_DEPENDENCIES[schema]:
+            if dependency not in existing:
+                plan.extend(self.plan_branch(dependency, existing))
+
+        existing.add(schema)
+        plan.append((schema, self.requests[schema]()))
+        return plan
+
+    def create_branch(self, plan: Plan, entities: Entities) -> BaseModel:
+        """
+        Создает сущности ветки по заранее сгенерированным запросам.
+
+        :param plan: Пары "схема — запрос" в порядке создания (см. plan_branch).
+        :param entities: Уже созданные сущности ветки, дополняется созданными сущностями.
+        :return: Фикстура последней (запрошенной) сущности.
+        """
+        for schema, request in plan:
+            entities[schema] = self.creators[schema](request, entities)
+
+        return entities[plan[-1][0]]
+
+    def build(
+            self,
+            schema: type[BaseModel],
+            count: int = 1,
+            existing: Sequence[BaseModel] = ()
+    ) -> list[BaseModel]:
+        """
+        Параллельно создает `count` сущностей вместе с их зависимостями.
+
+        :param schema: Схема запроса создания сущности (например, CreateCourseRequestSchema).
+        :param count: Количество сущностей.
+        :param existing: Уже созданные сущности (UserFixture, FileFixture, CourseFixture), общие для всех веток.
+        :return: Список фикстур в порядке создания веток.
+        """
+        shared: Entities = {type(entity.request): entity for entity in existing}
+        plans = [self.plan_branch(schema, set(shared)) for _ in range(count)]
+
+        # Одна ветка — это цепочка зависимых запросов: распараллеливать нечего, создаем ее в потоке теста,
+        # чтобы шаги Allure остались в отчете теста
+        if len(plans) == 1:
+            return [self.create_branch(plans[0], dict(shared))]
+
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, count) or 1) as executor:
+            futures = [executor.submit(self.create_branch, plan, dict(shared)) for plan in plans]
+            return [future.result() for future in futures]
+
+
+@pytest.fixture
+def entity_factory() -> EntityFactory:
+    return EntityFactory(concurrency=settings.entity_factory.concurrency)
+
+
+@pytest.fixture
+def function_courses(entity_factory: EntityFactory, function_user: UserFixture) -> list[CourseFixture]:
+    return entity_factory.build(
+        CreateCourseRequestSchema,
+        count=settings.entity_factory.batch_size,
+        existing=[function_user]
+    )
+
+
+@pytest.fixture
+def function_exercises(
+        entity_factory: EntityFactory,
+        function_user: UserFixture,
+        function_course: CourseFixture
+) -> list[ExerciseFixture]:
+    return entity_factory.build(
+        CreateExerciseRequestSchema,
+        count=settings.entity_factory.batch_size,
+        existing=[function_user, function_course]
+    )
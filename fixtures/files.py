@@ -3,7 +3,6 @@ from pydantic import BaseModel
 
 from clients.files.files_client import get_files_client, FilesClient
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema
-from config import settings
 from fixtures.users import UserFixture
 
 
@@ -18,7 +17,7 @@ def files_client(function_user: UserFixture) -> FilesClient:
 
 
 @pytest.fixture
-def function_file(files_client: FilesClient) -> FileFixture:
-    request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
-    response = files_client.create_file(request)
-    return FileFixture(request=request, response=response)
+def function_file(entity_factory, function_user: UserFixture) -> FileFixture:
+    # entity_factory без аннотации: fixtures.factory импортирует модели фикстур из этого модуля
+    [file] = entity_factory.build(CreateFileRequestSchema, existing=[function_user])
+    return file
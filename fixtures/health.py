@@ -0,0 +1,29 @@
+import pytest
+
+from config import settings
+from tools.http.cassette import cassette
+from tools.http.health import check_server_health
+
+
+def is_health_check_required() -> bool:
+    # Без сервера (фейковый LMS или воспроизведение кассет) проверять нечего.
+    # Локальные серверы воркеров проверяет плагин fixtures/local_server.py при запуске
+    return settings.health_check.enabled and not (
+            settings.fake_lms.enabled or settings.local_server.enabled or cassette.mode == "replay"
+    )
+
+
+@pytest.fixture(scope="session")
+def lms_health(request: pytest.FixtureRequest) -> None:
+    # Проверка выполняется один раз на процесс и только если выбранным тестам нужен сервер:
+    # от этой фикстуры зависят фикстуры API-клиентов, а офлайн-тесты инфраструктуры ее не запрашивают
+    if not is_health_check_required():
+        return
+
+    url = settings.http_client.client_url
+    if error := check_server_health(url, timeout=settings.health_check.timeout):
+        # pytest.exit из фикстуры воркера xdist роняет главный процесс, поэтому останавливаем сессию штатно:
+        # текущий тест падает с понятным сообщением, а остальные тесты не запускаются
+        message = f"LMS API is not available at {url}: {error}"
+        request.session.shouldstop = message
+        pytest.fail(message, pytrace=False)
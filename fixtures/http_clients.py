@@ -0,0 +1,13 @@
+import pytest
+
+from clients.http_client_registry import http_client_registry
+from tools.http.uploads import upload_payload_cache
+
+
+@pytest.fixture(scope='session', autouse=True)
+def close_http_clients():
+    # Пул соединений создается лениво при первом запросе
+    yield  # Запускаются автотесты...
+    # После завершения автотестов закрываем все HTTP-клиенты и общий пул соединений воркера
+    http_client_registry.close()
+    upload_payload_cache.close()
@@ -0,0 +1,54 @@
+import pytest
+from pydantic import HttpUrl
+
+from config import settings
+from fixtures.metrics import is_xdist_worker
+from tools.local_server import LocalServer, LocalServerError
+from tools.logger import get_worker_id
+
+local_server: LocalServer | None = None
+
+
+def is_local_server_required(config: pytest.Config) -> bool:
+    if not settings.local_server.enabled or settings.fake_lms.enabled:
+        return False
+
+    # При запуске через xdist сервер нужен только воркерам: главный процесс тесты не выполняет
+    return is_xdist_worker(config) or getattr(config.option, "dist", "no") == "no"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    global local_server
+
+    if not is_local_server_required(config):
+        return
+
+    if settings.local_server.app_dir is None:
+        raise pytest.UsageError("LOCAL_SERVER.APP_DIR must point to the LMS server application")
+
+    # Сервер запускается до создания клиентов и пула пользователей, поэтому все запросы воркера идут в него
+    local_server = LocalServer(
+        name=get_worker_id(),
+        app_dir=settings.local_server.app_dir,
+        app=settings.local_server.app,
+        host=settings.local_server.host,
+        directory=settings.local_server.directory,
+        env=settings.local_server.env
+    )
+    try:
+        local_server.start(startup_timeout=settings.local_server.startup_timeout)
+    except LocalServerError as error:
+        raise pytest.UsageError(str(error)) from error
+
+    settings.http_client.url = HttpUrl(local_server.url)
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_unconfigure(config: pytest.Config):
+    global local_server
+
+    # Сессионные фикстуры (в том числе удаление тестовых данных) к этому моменту завершены
+    if local_server is not None:
+        local_server.stop()
+        local_server = None
@@ -0,0 +1,85 @@
+import json
+
+import allure
+import pytest
+
+from config import settings
+from tools.allure.session import create_allure_session_result
+from tools.assertions.base import assert_response_time_budget
+from tools.logger import get_worker_id
+from tools.metrics.latency import latency_collector, LatencyCollector, format_latency_report
+
+LATENCY_REPORT_FILE = "latency-report.json"
+
+
+def is_xdist_worker(config: pytest.Config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_sessionstart(session: pytest.Session):
+    # Гистограммы предыдущего запуска удаляет только главный процесс, до старта воркеров
+    if not settings.metrics.enabled or is_xdist_worker(session.config):
+        return
+
+    for file in settings.metrics.directory.glob("latency-*.json"):
+        file.unlink()
+
+
+@pytest.fixture(scope='session', autouse=True)
+def save_latency_histograms():
+    yield  # Запускаются автотесты...
+    if not settings.metrics.enabled:
+        return
+
+    # После завершения автотестов сохраняем гистограммы воркера для объединения в главном процессе
+    # Отчет воркера не прикладывается здесь: вложение из фикстуры сессии попало бы в последний тест воркера
+    latency_collector.dump(settings.metrics.directory.joinpath(f"latency-{get_worker_id()}.json"))
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item: pytest.Item):
+    # Бюджеты проверяются только для запросов из тела теста: подготовка данных в фикстурах не учитывается
+    with latency_collector.observe() as responses:
+        result = yield
+
+    for response in responses:
+        assert_response_time_budget(response)
+
+    return result
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session):
+    if not settings.metrics.enabled or is_xdist_worker(session.config):
+        return
+
+    # Объединяем гистограммы всех воркеров в общий отчет p50/p95/p99 по эндпоинтам
+    collector = LatencyCollector(precision=settings.metrics.precision)
+    worker_reports: list[tuple[str, dict]] = []
+    for file in sorted(settings.metrics.directory.glob("latency-*.json")):
+        if file.name == LATENCY_REPORT_FILE:
+            continue
+
+        collector.load(file)
+        worker_collector = LatencyCollector(precision=settings.metrics.precision)
+        worker_collector.load(file)
+        worker_reports.append((file.stem.removeprefix("latency-"), worker_collector.build_report()))
+
+    report = collector.build_report()
+    if report:
+        settings.metrics.directory.joinpath(LATENCY_REPORT_FILE).write_text(json.dumps(report, indent=2))
+        attachments = [
+            ("Latency report", format_latency_report(report), allure.attachment_type.TEXT),
+            (LATENCY_REPORT_FILE, json.dumps(report, indent=2), allure.attachment_type.JSON),
+        ]
+        # Без xdist отчет единственного процесса совпадает с общим
+        if len(worker_reports) > 1:
+            attachments.extend(
+                (f"Latency report ({worker_id})", format_latency_report(worker_report), allure.attachment_type.TEXT)
+                for worker_id, worker_report in worker_reports
+            )
+
+        # Общий отчет и отчеты воркеров прикладываются к отдельному результату сессии, а не к тестам
+        allure_results_dir = session.config.getoption("allure_report_dir", None) or settings.allure_results_dir
+        create_allure_session_result(allure_results_dir, "Latency report", attachments)
@@ -0,0 +1,46 @@
+from typing import Callable
+
+import pytest
+from httpx import Response
+
+from clients.courses.courses_client import get_courses_client
+from clients.exercises.exercises_client import get_exercises_client
+from clients.files.files_client import get_files_client
+from clients.users.private_users_client import get_private_users_client
+from tools.http.cassette import cassette
+from tools.resources import resource_tracker, Resource, ResourceKind
+
+
+def delete_exercise(resource: Resource) -> Response:
+    return get_exercises_client(resource.owner).delete_exercise_api(resource.id)
+
+
+def delete_course(resource: Resource) -> Response:
+    return get_courses_client(resource.owner).delete_course_api(resource.id)
+
+
+def delete_file(resource: Resource) -> Response:
+    return get_files_client(resource.owner).delete_file_api(resource.id)
+
+
+def delete_user(resource: Resource) -> Response:
+    return get_private_users_client(resource.owner).delete_user_api(resource.id)
+
+
+DELETERS: dict[ResourceKind, Callable[[Resource], Response]] = {
+    "exercise": delete_exercise,
+    "course": delete_course,
+    "file": delete_file,
+    "user": delete_user,
+}
+
+
+@pytest.fixture(scope="session", autouse=True)
+def cleanup_resources(close_http_clients):
+    # Зависимость от close_http_clients гарантирует, что очистка выполнится до закрытия HTTP-клиентов
+    yield  # Запускаются автотесты...
+    # При воспроизведении кассет сервера нет, удалять нечего
+    if not resource_tracker.enabled or cassette.mode == "replay":
+        return
+
+    resource_tracker.cleanup(DELETERS)
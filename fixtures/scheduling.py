@@ -0,0 +1,48 @@
+import pytest
+
+from config import settings
+from fixtures.metrics import is_xdist_worker
+from tools.logger import get_worker_id
+from tools.scheduling import DurationScheduling, duration_history, get_shared_scope
+
+
+def pytest_configure(config: pytest.Config):
+    # Историю читает и обновляет только главный процесс: отчеты воркеров приходят в него через xdist
+    if settings.scheduling.enabled and not is_xdist_worker(config):
+        duration_history.load(settings.scheduling.history_file)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config: pytest.Config, log):
+    # Хук pytest-xdist: заменяем только планировщик по умолчанию, явно выбранный --dist не трогаем
+    if settings.scheduling.enabled and config.getoption("dist") == "load":
+        return DurationScheduling(config, duration_history, log)
+
+    return None
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo):
+    report = yield
+    # Область видимости разделяемых фикстур известна только в воркере, передаем ее вместе с отчетом
+    if call.when == "setup":
+        report.shared_scope = get_shared_scope(item)
+
+    return report
+
+
+def pytest_runtest_logreport(report: pytest.TestReport):
+    # В главном процессе приходят отчеты всех воркеров, в воркере история не ведется
+    if not settings.scheduling.enabled or get_worker_id() != "main":
+        return
+
+    duration_history.record(report.nodeid, report.when, report.duration, getattr(report, "shared_scope", None))
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_sessionfinish(session: pytest.Session):
+    if not settings.scheduling.enabled or is_xdist_worker(session.config):
+        return
+
+    # Сохраняем историю для расписания следующего запуска
+    duration_history.dump(settings.scheduling.history_file)
@@ -0,0 +1,16 @@
+import pytest
+
+from tools.assertions.schema import schema_validator_cache
+from tools.logger import get_logger
+
+logger = get_logger("SCHEMA_ASSERTIONS")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def report_schema_cache():
+    yield  # Запускаются автотесты...
+    # Каждый воркер сообщает, сколько проверок схем обошлись без создания валидатора
+    logger.info(
+        "Schema validator cache: %s hits, %s misses, hit ratio %.1f%%",
+        schema_validator_cache.hits, schema_validator_cache.misses, schema_validator_cache.hit_ratio * 100
+    )
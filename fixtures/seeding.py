@@ -0,0 +1,51 @@
+import pytest
+
+from tools.fakers import fake
+from tools.http.cassette import cassette
+from tools.logger import get_logger
+from tools.seeding import session_seed
+
+logger = get_logger("SEEDING")
+
+
+def pytest_addoption(parser: pytest.Parser):
+    parser.addoption(
+        "--seed",
+        type=int,
+        default=None,
+        help="seed of test data; pass the seed of a previous run to reproduce its payloads"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config):
+    # Воркеры получают seed от главного процесса, чтобы все воркеры запуска использовали один seed
+    if hasattr(config, "workerinput"):
+        session_seed.seed = config.workerinput["seed"]
+    elif config.getoption("seed") is not None:
+        session_seed.seed = config.getoption("seed")
+    elif cassette.mode == "replay" and (seed := cassette.load_seed()) is not None:
+        # Кассеты воспроизводятся с seed записи, чтобы тела запросов совпадали с записанными
+        session_seed.seed = seed
+
+    fake.reset(session_seed.seed)
+    fake.seed(session_seed.worker_seed)
+    logger.info("Session seed: %s", session_seed.seed)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    # Хук pytest-xdist: передаем seed запуска в воркер
+    node.workerinput["seed"] = session_seed.seed
+
+
+def pytest_report_header(config: pytest.Config) -> str:
+    return f"seed: {session_seed.seed} (reproduce with --seed {session_seed.seed})"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item: pytest.Item):
+    # Данные теста зависят только от seed запуска и nodeid, а не от воркера и предыдущих тестов
+    seed = session_seed.get_test_seed(item.nodeid)
+    fake.seed(seed)
+    logger.info("Seed %s for test %s", seed, item.nodeid)
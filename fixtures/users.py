@@ -1,10 +1,20 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Generator
+
 import pytest
 from pydantic import BaseModel, EmailStr
 
-from clients.private_http_builder import AuthenticationUserSchema
+from clients.private_http_builder import AuthenticationUserSchema, get_private_http_client
 from clients.users.private_users_client import get_private_users_client, PrivateUsersClient
 from clients.users.public_users_client import get_public_users_client, PublicUsersClient
 from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema
+from config import settings
+from tools.http.cassette import cassette
+from tools.logger import get_logger
+
+logger = get_logger("USERS_POOL")
 
 
 class UserFixture(BaseModel):
@@ -24,8 +34,105 @@ class UserFixture(BaseModel):
         return AuthenticationUserSchema(email=self.email, password=self.password)
 
 
+def create_user(
+        public_users_client: PublicUsersClient,
+        request: CreateUserRequestSchema | None = None
+) -> UserFixture:
+    """
+    Создает нового пользователя со случайными данными.
+
+    :param public_users_client: Публичный клиент для работы с /api/v1/users.
+    :param request: Заранее сгенерированные данные пользователя. Если не указаны, генерируются новые.
+    :return: Данные запроса и ответа создания пользователя.
+    """
+    request = request or CreateUserRequestSchema()
+    response = public_users_client.create_user(request)
+    return UserFixture(request=request, response=response.model)
+
+
+class UsersPool:
+    """
+    Пул заранее созданных пользователей одного воркера.
+
+    Пользователи создаются пачкой (параллельно в `concurrency` потоков), сразу логинятся, а их токены
+    остаются в кэше приватных клиентов. Тест берет пользователя в аренду и возвращает его после завершения,
+    поэтому один пользователь никогда не используется двумя тестами одновременно.
+    """
+
+    def __init__(self, size: int, concurrency: int):
+        """
+        :param size: Количество пользователей в пуле.
+        :param concurrency: Количество потоков для параллельного создания пользователей.
+        """
+        self.size = size
+        self.concurrency = max(concurrency, 1)
+
+        self._users: queue.Queue[UserFixture] = queue.Queue()
+
+    def create_user(self) -> UserFixture:
+        """
+        Создает пользователя и заранее получает для него токен.
+
+        :return: Созданный пользователь.
+        """
+        user = create_user(get_public_users_client())
+        get_private_http_client(user.authentication_user)  # Логин и кэширование токена
+        return user
+
+    def provision(self) -> None:
+        """
+        Создает всех пользователей пула.
+        """
+        logger.info("Provision %s users with concurrency %s", self.size, self.concurrency)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for user in executor.map(lambda _: self.create_user(), range(self.size)):
+                self._users.put(user)
+
+    @contextmanager
+    def lease(self) -> Generator[UserFixture, None, None]:
+        """
+        Выдает пользователя в аренду и возвращает его в пул после выхода из контекста.
+        Если все пользователи заняты, создается дополнительный пользователь.
+
+        :return: Пользователь из пула.
+        """
+        try:
+            user = self._users.get_nowait()
+        except queue.Empty:
+            logger.info("Users pool is exhausted, create additional user")
+            user = self.create_user()
+
+        try:
+            yield user
+        finally:
+            # Возвращаем пользователя в конец очереди, чтобы пользователи выдавались по кругу
+            self._users.put(user)
+
+
+def is_users_pool_used(node: pytest.Item) -> bool:
+    """
+    Проверяет, получает ли тест пользователя из пула.
+
+    Тесты, которые изменяют/удаляют пользователя или зависят от его "чистоты", помечаются
+    @pytest.mark.fresh_user и получают нового пользователя. С кассетами пул не используется:
+    пользователь должен создаваться внутри кассеты теста.
+
+    :param node: Тест, которому нужен пользователь.
+    :return: True, если пользователь берется из пула.
+    """
+    return settings.users_pool.size > 0 and not cassette.is_enabled and node.get_closest_marker("fresh_user") is None
+
+
+@pytest.fixture(scope="session")
+def users_pool(lms_health: None) -> UsersPool:
+    pool = UsersPool(size=settings.users_pool.size, concurrency=settings.users_pool.concurrency)
+    pool.provision()
+    return pool
+
+
 @pytest.fixture
-def public_users_client() -> PublicUsersClient:
+def public_users_client(lms_health: None) -> PublicUsersClient:
     return get_public_users_client()
 
 
@@ -35,7 +142,14 @@ def private_users_client(function_user: UserFixture) -> PrivateUsersClient:
 
 
 @pytest.fixture
-def function_user(public_users_client: PublicUsersClient) -> UserFixture:
-    request = CreateUserRequestSchema()
-    response = public_users_client.create_user(request)
-    return UserFixture(request=request, response=response)
+def function_user(
+        request: pytest.FixtureRequest,
+        public_users_client: PublicUsersClient
+) -> Generator[UserFixture, None, None]:
+    if not is_users_pool_used(request.node):
+        yield create_user(public_users_client)
+        return
+
+    users_pool: UsersPool = request.getfixturevalue("users_pool")
+    with users_pool.lease() as user:
+        yield user
@@ -11,7 +11,7 @@ from config import settings
 public_users_client = get_public_users_client()
 
 create_user_request = CreateUserRequestSchema()
-create_user_response = public_users_client.create_user(create_user_request)
+create_user_response = public_users_client.create_user(create_user_request).model
 print("User created:", create_user_response)
 
 # 2. Аутентификация
@@ -28,7 +28,7 @@ courses_client = get_courses_client(auth_user)
 create_file_request = CreateFileRequestSchema(
     upload_file=settings.test_data.image_png_file
 )
-create_file_response = files_client.create_file(create_file_request)
+create_file_response = files_client.create_file(create_file_request).model
 print("File uploaded:", create_file_response)
 
 # 5. Создание курса
@@ -37,5 +37,5 @@ create_course_request = CreateCourseRequestSchema(
     created_by_user_id=create_user_response.user.id     # snake_case
 )
 
-create_course_response = courses_client.create_course(create_course_request)
+create_course_response = courses_client.create_course(create_course_request).model
 print("Course created:", create_course_response)
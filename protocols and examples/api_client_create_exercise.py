@@ -13,7 +13,7 @@ from config import settings
 public_users_client = get_public_users_client()
 create_user_request = CreateUserRequestSchema(
 )
-create_user_response = public_users_client.create_user(create_user_request)
+create_user_response = public_users_client.create_user(create_user_request).model
 print("User created:", create_user_response)
 
 # ---------- Авторизация и клиенты ----------
@@ -29,7 +29,7 @@ exercises_client = get_exercises_client(authentication_user)
 create_file_request = CreateFileRequestSchema(
     upload_file=settings.test_data.image_png_file
 )
-create_file_response = files_client.create_file(create_file_request)
+create_file_response = files_client.create_file(create_file_request).model
 print("File uploaded:", create_file_response)
 
 # ---------- Создание курса ----------
@@ -37,7 +37,7 @@ create_course_request = CreateCourseRequestSchema(
     preview_file_id=create_file_response.file.id,
     created_by_user_id=create_user_response.user.id,
 )
-create_course_response: CreateCourseResponseSchema = courses_client.create_course(create_course_request)
+create_course_response: CreateCourseResponseSchema = courses_client.create_course(create_course_request).model
 print("Course created:", create_course_response)
 
 # ---------- Создание задания ----------
@@ -45,5 +45,5 @@ create_exercise_request = CreateExerciseRequestSchema(
     course_id=create_course_response.course.id,
     created_by_user_id=create_user_response.user.id
 )
-create_exercise_response = exercises_client.create_exercise(create_exercise_request)
+create_exercise_response = exercises_client.create_exercise(create_exercise_request).model
 print("Exercise created:", create_exercise_response)
@@ -6,7 +6,7 @@ from clients.users.users_schema import CreateUserRequestSchema
 public_users_client = get_public_users_client()
 
 create_user_request = CreateUserRequestSchema()
-create_user_response = public_users_client.create_user(create_user_request)
+create_user_response = public_users_client.create_user(create_user_request).model
 print('Create user data:', create_user_response)
 
 # Используем атрибуты вместо ключей
@@ -17,5 +17,5 @@ authentication_user = AuthenticationUserSchema(
 private_users_client = get_private_users_client(authentication_user)
 
 # Используем атрибуты вместо ключей
-get_user_response = private_users_client.get_user(create_user_response.user.id)
+get_user_response = private_users_client.get_user(create_user_response.user.id).model
 print('Get user data:', get_user_response)
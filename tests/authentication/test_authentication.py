@@ -6,6 +6,7 @@ from allure_commons.types import Severity
 from clients.authentication.authentication_client import AuthenticationClient
 from clients.authentication.authentication_schema import LoginRequestSchema, LoginResponseSchema
 from clients.users.public_users_client import PublicUsersClient
+from clients.parsed_response import parse_response
 from fixtures.users import UserFixture
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -36,9 +37,9 @@ class TestAuthentication:
     ):
         request = LoginRequestSchema(email=function_user.email, password=function_user.password)
         response = authentication_client.login_api(request)
-        response_data = LoginResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, LoginResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_login_response(response_data)
+        assert_login_response(parsed_response.model)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, LoginResponseSchema)
@@ -6,6 +6,7 @@ from allure_commons.types import Severity
 from clients.courses.courses_client import CoursesClient
 from clients.courses.courses_schema import UpdateCourseRequestSchema, UpdateCourseResponseSchema, GetCoursesQuerySchema, \
     GetCoursesResponseSchema, CreateCourseRequestSchema, CreateCourseResponseSchema
+from clients.parsed_response import parse_response
 from fixtures.courses import CourseFixture
 from fixtures.files import FileFixture
 from fixtures.users import UserFixture
@@ -27,6 +28,7 @@ from tools.assertions.schema import validate_json_schema
 @allure.feature(AllureFeature.COURSES)
 @allure.suite(AllureFeature.COURSES)
 class TestCourses:
+    @pytest.mark.fresh_user  # Список курсов фильтруется по пользователю, поэтому нужен "чистый" пользователь
     @allure.title("Get courses")
     @allure.tag(AllureTag.GET_ENTITIES)
     @allure.story(AllureStory.GET_ENTITIES)
@@ -36,22 +38,22 @@ class TestCourses:
             self,
             courses_client: CoursesClient,
             function_user: UserFixture,
-            function_course: CourseFixture
+            function_courses: list[CourseFixture]
     ):
         # Формируем параметры запроса, передавая user_id
         query = GetCoursesQuerySchema(user_id=function_user.response.user.id)
         # Отправляем GET-запрос на получение списка курсов
         response = courses_client.get_courses_api(query)
         # Десериализуем JSON-ответ в Pydantic-модель
-        response_data = GetCoursesResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, GetCoursesResponseSchema)
 
         # Проверяем, что код ответа 200 OK
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что список курсов соответствует ранее созданным курсам
-        assert_get_courses_response(response_data, [function_course.response])
+        assert_get_courses_response(parsed_response.model, [course.response for course in function_courses])
 
         # Проверяем соответствие JSON-ответа схеме
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, GetCoursesResponseSchema)
 
     @allure.title("Create course")
     @allure.tag(AllureTag.CREATE_ENTITY)
@@ -73,16 +75,16 @@ class TestCourses:
             created_by_user_id=function_user.response.user.id
         )
         response = courses_client.create_course_api(request)
-        response_data = CreateCourseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateCourseResponseSchema)
 
         # Проверяем статус-код
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверяем тело ответа
-        assert_create_course_response(request, response_data)
+        assert_create_course_response(request, parsed_response.model)
 
         # Валидируем JSON-схему
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, CreateCourseResponseSchema)
 
     @allure.title("Update course")
     @allure.tag(AllureTag.UPDATE_ENTITY)
@@ -95,13 +97,13 @@ class TestCourses:
         # Отправляем запрос на обновление курса
         response = courses_client.update_course_api(function_course.response.course.id, request)
         # Преобразуем JSON-ответ в объект схемы
-        response_data = UpdateCourseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, UpdateCourseResponseSchema)
 
         # Проверяем статус-код ответа
         assert_status_code(response.status_code, HTTPStatus.OK)
         # Проверяем, что данные в ответе соответствуют запросу
-        assert_update_course_response(request, response_data)
+        assert_update_course_response(request, parsed_response.model)
 
         # Валидируем JSON-схему ответа
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, UpdateCourseResponseSchema)
 
@@ -8,6 +8,7 @@ from clients.exercises.exercises_client import ExercisesClient
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     GetExerciseResponseSchema, UpdateExerciseResponseSchema, UpdateExerciseRequestSchema, GetExercisesResponseSchema, \
     GetExercisesQuerySchema
+from clients.parsed_response import parse_response
 from fixtures.courses import CourseFixture
 from fixtures.exercises import ExerciseFixture
 from tools.allure.epics import AllureEpic
@@ -48,16 +49,16 @@ class TestExercises:
         response = exercises_client.create_exercise_api(request)
 
         # Десериализация ответа
-        response_data = CreateExerciseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateExerciseResponseSchema)
 
         # Проверяем статус-код
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверяем тело ответа
-        assert_create_exercise_response(request, response_data)
+        assert_create_exercise_response(request, parsed_response.model)
 
         # Проверяем JSON-схему
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, CreateExerciseResponseSchema)
 
     @allure.title("Get exercise")
     @allure.tag(AllureTag.GET_ENTITY)
@@ -76,16 +77,16 @@ class TestExercises:
         response = exercises_client.get_exercise_api(function_exercise.response.exercise.id)
 
         # Десериализация ответа
-        response_data = GetExerciseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, GetExerciseResponseSchema)
 
         # Проверяем статус-код
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверяем тело ответа
-        assert_get_exercise_response(response_data, function_exercise.response)
+        assert_get_exercise_response(parsed_response.model, function_exercise.response)
 
         # Проверяем JSON-схему
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, GetExerciseResponseSchema)
 
     @allure.title("Update exercise")
     @allure.tag(AllureTag.UPDATE_ENTITY)
@@ -110,16 +111,16 @@ class TestExercises:
         )
 
         # Десериализация ответа
-        response_data = UpdateExerciseResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, UpdateExerciseResponseSchema)
 
         # Проверка статус-кода
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверка тела ответа
-        assert_update_exercise_response(request, response_data)
+        assert_update_exercise_response(request, parsed_response.model)
 
         # Валидация JSON-схемы
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, UpdateExerciseResponseSchema)
 
     @allure.title("Delete exercise")
     @allure.tag(AllureTag.DELETE_ENTITY)
@@ -142,16 +143,16 @@ class TestExercises:
 
         # GET-запрос для проверки, что задание удалено
         get_response = exercises_client.get_exercise_api(function_exercise.response.exercise.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_parsed_response = parse_response(get_response, InternalErrorResponseSchema)
 
         # Проверка статус-кода (ожидаем 404 Not Found)
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
 
         # Проверка тела ответа на наличие ошибки "Exercise not found"
-        assert_exercise_not_found_response(get_response_data)
+        assert_exercise_not_found_response(get_parsed_response.model)
 
         # Валидация JSON-схемы ошибки
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_parsed_response.json, InternalErrorResponseSchema)
 
     @allure.title("Get exercises")
     @allure.tag(AllureTag.GET_ENTITIES)
@@ -162,7 +163,7 @@ class TestExercises:
             self,
             exercises_client: ExercisesClient,
             function_course: CourseFixture,
-            function_exercise: ExerciseFixture
+            function_exercises: list[ExerciseFixture]
     ):
         """
         Проверяет получение списка заданий по course_id через API.
@@ -172,13 +173,13 @@ class TestExercises:
         response = exercises_client.get_exercises_api(query)
 
         # Десериализация ответа
-        response_data = GetExercisesResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, GetExercisesResponseSchema)
 
         # Проверка статус-кода
         assert_status_code(response.status_code, HTTPStatus.OK)
 
         # Проверка списка
-        assert_get_exercises_response(response_data, [function_exercise.response])
+        assert_get_exercises_response(parsed_response.model, [exercise.response for exercise in function_exercises])
 
         # Валидация JSON-схемы
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(parsed_response.json, GetExercisesResponseSchema)
\ No newline at end of file
@@ -6,6 +6,7 @@ from allure_commons.types import Severity
 from clients.errors_schema import ValidationErrorResponseSchema, InternalErrorResponseSchema
 from clients.files.files_client import FilesClient
 from clients.files.files_schema import CreateFileRequestSchema, CreateFileResponseSchema, GetFileResponseSchema
+from clients.parsed_response import parse_response
 from config import settings
 from fixtures.files import FileFixture
 from tools.allure.epics import AllureEpic
@@ -15,8 +16,10 @@ from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.files import assert_create_file_response, assert_get_file_response, \
     assert_create_file_with_empty_filename_response, assert_create_file_with_empty_directory_response, \
-    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response
+    assert_file_not_found_response, assert_get_file_with_incorrect_file_id_response, assert_download_file
 from tools.assertions.schema import validate_json_schema
+from tools.fakers import fake
+from tools.testdata.generator import synthetic_files, FileKind, KB
 
 
 @pytest.mark.files
@@ -35,12 +38,30 @@ class TestFiles:
     def test_create_file(self, files_client: FilesClient):
         request = CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
         response = files_client.create_file_api(request)
-        response_data = CreateFileResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_create_file_response(request, response_data)
+        assert_create_file_response(request, parsed_response.model)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, CreateFileResponseSchema)
+
+    @pytest.mark.parametrize("kind", ["png", "jpeg", "pdf", "binary"])
+    @allure.tag(AllureTag.CREATE_ENTITY)
+    @allure.title("Create generated file")
+    @allure.story(AllureStory.CREATE_ENTITY)
+    @allure.sub_suite(AllureStory.CREATE_ENTITY)
+    @allure.severity(Severity.NORMAL)
+    def test_create_generated_file(self, kind: FileKind, files_client: FilesClient):
+        allure.dynamic.title(f"Create generated {kind} file")
+        upload_file = synthetic_files.get(kind, size=256 * KB)
+        request = CreateFileRequestSchema(filename=f"{fake.uuid4()}{upload_file.suffix}", upload_file=upload_file)
+        response = files_client.create_file_api(request)
+        parsed_response = parse_response(response, CreateFileResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_create_file_response(request, parsed_response.model)
+
+        validate_json_schema(parsed_response.json, CreateFileResponseSchema)
 
     @allure.tag(AllureTag.GET_ENTITY)
     @allure.title("Get file")
@@ -49,12 +70,22 @@ class TestFiles:
     @allure.severity(Severity.BLOCKER)
     def test_get_file(self, files_client: FilesClient, function_file: FileFixture):
         response = files_client.get_file_api(function_file.response.file.id)
-        response_data = GetFileResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, GetFileResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_file_response(response_data, function_file.response)
+        assert_get_file_response(parsed_response.model, function_file.response)
+
+        validate_json_schema(parsed_response.json, GetFileResponseSchema)
+
+    @allure.tag(AllureTag.GET_ENTITY)
+    @allure.title("Download file")
+    @allure.story(AllureStory.GET_ENTITY)
+    @allure.sub_suite(AllureStory.GET_ENTITY)
+    @allure.severity(Severity.CRITICAL)
+    def test_download_file(self, files_client: FilesClient, function_file: FileFixture):
+        result = files_client.download_file(str(function_file.response.file.url))
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        assert_download_file(result, function_file.request.upload_file)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.title("Create file with empty filename")
@@ -67,15 +98,15 @@ class TestFiles:
             upload_file=settings.test_data.image_png_file
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, ValidationErrorResponseSchema)
 
         # Проверка, что код ответа соответствует ожиданиям (422 - Unprocessable Entity)
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         # Проверка, что ответ API соответствует ожидаемой валидационной ошибке
-        assert_create_file_with_empty_filename_response(response_data)
+        assert_create_file_with_empty_filename_response(parsed_response.model)
 
         # Дополнительная проверка структуры JSON, чтобы убедиться, что схема валидационного ответа не изменилась
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.title("Create file with empty directory")
@@ -88,15 +119,15 @@ class TestFiles:
             upload_file=settings.test_data.image_png_file
         )
         response = files_client.create_file_api(request)
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, ValidationErrorResponseSchema)
 
         # Проверка, что код ответа соответствует ожиданиям (422 - Unprocessable Entity)
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
         # Проверка, что ответ API соответствует ожидаемой валидационной ошибке
-        assert_create_file_with_empty_directory_response(response_data)
+        assert_create_file_with_empty_directory_response(parsed_response.model)
 
         # Дополнительная проверка структуры JSON
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, ValidationErrorResponseSchema)
 
     @allure.tag(AllureTag.DELETE_ENTITY)
     @allure.title("Delete file")
@@ -111,15 +142,15 @@ class TestFiles:
 
         # 3. Пытаемся получить удаленный файл
         get_response = files_client.get_file_api(function_file.response.file.id)
-        get_response_data = InternalErrorResponseSchema.model_validate_json(get_response.text)
+        get_parsed_response = parse_response(get_response, InternalErrorResponseSchema)
 
         # 4. Проверяем, что сервер вернул 404 Not Found
         assert_status_code(get_response.status_code, HTTPStatus.NOT_FOUND)
         # 5. Проверяем, что в ответе содержится ошибка "File not found"
-        assert_file_not_found_response(get_response_data)
+        assert_file_not_found_response(get_parsed_response.model)
 
         # 6. Проверяем, что ответ соответствует схеме
-        validate_json_schema(get_response.json(), get_response_data.model_json_schema())
+        validate_json_schema(get_parsed_response.json, InternalErrorResponseSchema)
 
     @allure.tag(AllureTag.VALIDATE_ENTITY)
     @allure.story(AllureStory.VALIDATE_ENTITY)
@@ -133,13 +164,13 @@ class TestFiles:
         """
         # Отправляем запрос с некорректным file_id
         response = files_client.get_file_api("incorrect-file-id")
-        response_data = ValidationErrorResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, ValidationErrorResponseSchema)
 
         # Проверяем статус-код (422 Unprocessable Entity)
         assert_status_code(response.status_code, HTTPStatus.UNPROCESSABLE_ENTITY)
 
         # Проверяем, что тело ответа соответствует ожидаемому
-        assert_get_file_with_incorrect_file_id_response(response_data)
+        assert_get_file_with_incorrect_file_id_response(parsed_response.model)
 
         # Проверяем JSON-схему
-        validate_json_schema(response.json(), response_data.model_json_schema())
\ No newline at end of file
+        validate_json_schema(parsed_response.json, ValidationErrorResponseSchema)
\ No newline at end of file
@@ -0,0 +1,30 @@
+from contextlib import contextmanager
+
+import allure
+import pytest
+
+
+class StepRecorder:
+    """
+    Подменяет allure.step и записывает шаги с их родителями по стеку потока, как это делает Allure.
+    """
+
+    def __init__(self):
+        self.stack: list[str] = []
+        self.steps: list[tuple[str, str | None]] = []
+
+    @contextmanager
+    def step(self, title: str):
+        self.steps.append((title, self.stack[-1] if self.stack else None))
+        self.stack.append(title)
+        try:
+            yield
+        finally:
+            self.stack.remove(title)
+
+
+@pytest.fixture
+def recorder(monkeypatch) -> StepRecorder:
+    recorder = StepRecorder()
+    monkeypatch.setattr(allure, "step", recorder.step)
+    return recorder
@@ -0,0 +1,223 @@
+import hashlib
+import io
+import json
+import os
+import subprocess
+import sys
+from http import HTTPStatus
+from pathlib import Path
+
+import pytest
+from httpx import BaseTransport, Client, MockTransport, Request, RequestNotRead, Response
+
+from clients.api_coverage import current_endpoint
+from tools.http.cassette import Substitutions, Cassette, CassetteTransport, CassetteMissError
+
+# Корень проекта: там лежат .env, pytest.ini и conftest.py
+PROJECT_DIR = Path(__file__).parents[2]
+# Сколько ждать прогон набора тестов в подпроцессе
+SUITE_TIMEOUT = 300
+
+
+def create_user(request: Request) -> Response:
+    body = json.loads(request.content)
+    return Response(HTTPStatus.OK, json={"user": {"id": f"id-{body['email']}", "email": body["email"]}})
+
+
+def build_client(cassette: Cassette) -> Client:
+    return Client(base_url="http://lms.test", transport=CassetteTransport(cassette, MockTransport(create_user)))
+
+
+def post_user(client: Client, email: str) -> Response:
+    token = current_endpoint.set("/api/v1/users")
+    try:
+        return client.post("/api/v1/users", json={"email": email, "password": "secret"})
+    finally:
+        current_endpoint.reset(token)
+
+
+class UploadServer(BaseTransport):
+    """
+    Сервер загрузки файлов, который читает тело запроса потоком, как настоящий транспорт httpx.
+    """
+
+    def __init__(self):
+        self.received = b""
+
+    def handle_request(self, request: Request) -> Response:
+        # До отправки тело не должно быть прочитано в память
+        with pytest.raises(RequestNotRead):
+            _ = request.content
+
+        self.received = b"".join(request.stream)
+        return Response(HTTPStatus.OK, json={"file": {"id": "file-id"}})
+
+
+class UnreadableFile(io.BytesIO):
+    def read(self, *args):
+        raise AssertionError("Upload must not be read in replay")
+
+
+def upload_file(client: Client, file: io.BytesIO) -> Response:
+    token = current_endpoint.set("/api/v1/files")
+    try:
+        return client.post("/api/v1/files", data={"filename": "image.png"}, files={"upload_file": ("image.png", file)})
+    finally:
+        current_endpoint.reset(token)
+
+
+def run_suite(mode: str, directory: Path, **env: str) -> subprocess.CompletedProcess:
+    """
+    Запускает регрессионный набор в отдельном процессе с кассетами в режиме `mode`.
+    """
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-m", "regression", "-q", "-p", "no:cacheprovider", "-p", "no:xdist"],
+        cwd=PROJECT_DIR,
+        env={
+            **os.environ,
+            "CASSETTE.MODE": mode,
+            "CASSETTE.DIRECTORY": str(directory),
+            "METRICS.ENABLED": "false",
+            "SCHEDULING.ENABLED": "false",
+            **env
+        },
+        capture_output=True,
+        text=True,
+        timeout=SUITE_TIMEOUT
+    )
+
+
+@pytest.mark.tools
+class TestSubstitutions:
+    def test_substitutes_identifier_fields(self):
+        substitutions = Substitutions()
+        substitutions.learn({"email": "recorded@example.com"}, {"email": "live@example.com"})
+
+        actual = substitutions.apply({"user": {"email": "recorded@example.com", "firstName": "recorded@example.com"}})
+
+        assert actual == {"user": {"email": "live@example.com", "firstName": "recorded@example.com"}}
+
+    def test_does_not_learn_non_identifier_fields(self):
+        substitutions = Substitutions()
+        substitutions.learn(
+            {"title": "Recorded", "estimatedTime": "6 weeks"},
+            {"title": "Live", "estimatedTime": "10 weeks"}
+        )
+
+        assert substitutions.values == {}
+        assert substitutions.apply({"estimatedTime": "6 weeks"}) == {"estimatedTime": "6 weeks"}
+
+    def test_learns_path_parameters_by_endpoint_template(self):
+        substitutions = Substitutions()
+        substitutions.learn_path(
+            "/static/{directory}/{filename}",
+            "/static/tests/recorded-0000.png",
+            "/static/tests/live-1111.png"
+        )
+
+        actual = substitutions.apply({
+            "filename": "recorded-0000.png",
+            "url": "http://localhost:8000/static/tests/recorded-0000.png"
+        })
+
+        assert actual == {"filename": "live-1111.png", "url": "http://localhost:8000/static/tests/live-1111.png"}
+
+    def test_substitutes_nested_ids(self):
+        substitutions = Substitutions()
+        substitutions.learn({"courseId": "course-recorded"}, {"courseId": "course-live"})
+
+        actual = substitutions.apply({"exercises": [{"id": "exercise", "courseId": "course-recorded"}]})
+
+        assert actual == {"exercises": [{"id": "exercise", "courseId": "course-live"}]}
+
+
+@pytest.mark.tools
+class TestCassette:
+    def test_record_saves_redacted_interactions_per_test(self, tmp_path):
+        cassette = Cassette(mode="record", directory=tmp_path)
+        cassette.use("tests/test_users.py::test_create_user")
+        post_user(build_client(cassette), "recorded@example.com")
+        cassette.eject()
+
+        [interaction] = Cassette.read_file(cassette.get_file("tests/test_users.py::test_create_user"))
+
+        assert interaction["body"] == {"email": "recorded@example.com", "password": "cassette-password"}
+        assert interaction["response"]["json"]["user"]["email"] == "recorded@example.com"
+
+    def test_replay_substitutes_identifiers_of_current_run(self, tmp_path):
+        recorder = Cassette(mode="record", directory=tmp_path)
+        recorder.use("test_create_user")
+        post_user(build_client(recorder), "recorded@example.com")
+        recorder.eject()
+
+        player = Cassette(mode="replay", directory=tmp_path)
+        player.use("test_create_user")
+        response = post_user(build_client(player), "live@example.com")
+
+        assert response.json() == {"user": {"id": "id-recorded@example.com", "email": "live@example.com"}}
+
+    def test_replay_falls_back_to_other_cassettes(self, tmp_path):
+        recorder = Cassette(mode="record", directory=tmp_path)
+        recorder.use("test_create_user")
+        post_user(build_client(recorder), "recorded@example.com")
+        recorder.eject()
+
+        player = Cassette(mode="replay", directory=tmp_path)
+        player.use("test_other")
+
+        assert post_user(build_client(player), "live@example.com").status_code == HTTPStatus.OK
+
+    def test_replay_without_recording_raises_miss(self, tmp_path):
+        player = Cassette(mode="replay", directory=tmp_path)
+        player.use("test_create_user")
+
+        with pytest.raises(CassetteMissError):
+            post_user(build_client(player), "live@example.com")
+
+    def test_record_streams_upload_and_saves_file_digest(self, tmp_path):
+        server, content = UploadServer(), b"\x89PNG" * 1024
+        cassette = Cassette(mode="record", directory=tmp_path)
+        cassette.use("test_upload")
+        client = Client(base_url="http://lms.test", transport=CassetteTransport(cassette, server))
+        upload_file(client, io.BytesIO(content))
+        cassette.eject()
+
+        [interaction] = Cassette.read_file(cassette.get_file("test_upload"))
+
+        assert content in server.received
+        assert interaction["body"] == {
+            "filename": "image.png",
+            "upload_file": f"sha256:{hashlib.sha256(content).hexdigest()}"
+        }
+
+    def test_replay_matches_upload_without_reading_file(self, tmp_path):
+        recorder = Cassette(mode="record", directory=tmp_path)
+        recorder.use("test_upload")
+        client = Client(base_url="http://lms.test", transport=CassetteTransport(recorder, UploadServer()))
+        upload_file(client, io.BytesIO(b"recorded"))
+        recorder.eject()
+
+        player = Cassette(mode="replay", directory=tmp_path)
+        player.use("test_upload")
+        client = Client(base_url="http://lms.test", transport=CassetteTransport(player, UploadServer()))
+
+        assert upload_file(client, UnreadableFile()).json() == {"file": {"id": "file-id"}}
+
+    def test_seed_is_saved_with_cassettes(self, tmp_path):
+        cassette = Cassette(mode="record", directory=tmp_path)
+        assert cassette.load_seed() is None
+
+        cassette.save_seed(42)
+
+        assert Cassette(mode="replay", directory=tmp_path).load_seed() == 42
+
+
+@pytest.mark.tools
+class TestCassetteRoundTrip:
+    def test_replay_passes_suite_recorded_against_fake_server(self, tmp_path):
+        # Запись идет в in-memory сервер, воспроизведение — без сервера, только из кассет
+        record = run_suite("record", tmp_path, **{"FAKE_LMS.ENABLED": "true"})
+        assert record.returncode == 0, record.stdout[-5000:]
+
+        replay = run_suite("replay", tmp_path, **{"FAKE_LMS.ENABLED": "false"})
+        assert replay.returncode == 0, replay.stdout[-5000:]
@@ -0,0 +1,136 @@
+import asyncio
+import time
+from http import HTTPStatus
+
+import pytest
+from httpx import Client, AsyncClient, MockTransport, Request, Response, ConnectError, ReadTimeout, DecodingError
+
+from tools.http.circuit_breaker import CircuitBreaker, CircuitBreakerTransport, CircuitOpenError
+
+# Через сколько секунд после размыкания пропускается пробный запрос
+RESET_TIMEOUT = 0.05
+
+
+class SwitchableServer:
+    """
+    Обработчик для httpx.MockTransport, который отвечает 200 или завершает запрос ошибкой `error`.
+    """
+
+    def __init__(self):
+        self.error: Exception | None = None
+        self.requests = 0
+
+    def handle(self, request: Request) -> Response:
+        self.requests += 1
+        if self.error is not None:
+            raise self.error
+
+        return Response(HTTPStatus.OK)
+
+
+def build_client(server: SwitchableServer, failure_threshold: int = 3) -> tuple[Client, CircuitBreaker]:
+    breaker = CircuitBreaker(failure_threshold=failure_threshold, reset_timeout=RESET_TIMEOUT)
+    transport = CircuitBreakerTransport(MockTransport(server.handle), breaker)
+    return Client(base_url="http://lms.test", transport=transport), breaker
+
+
+@pytest.mark.tools
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        server = SwitchableServer()
+        server.error = ConnectError("Connection refused")
+        client, breaker = build_client(server, failure_threshold=3)
+
+        for _ in range(3):
+            with pytest.raises(ConnectError):
+                client.get("/api/v1/courses")
+
+        # Следующие запросы до сервера не доходят
+        with pytest.raises(CircuitOpenError):
+            client.get("/api/v1/courses")
+
+        assert breaker.is_open
+        assert server.requests == 3
+
+    def test_success_resets_failure_count(self):
+        server = SwitchableServer()
+        client, breaker = build_client(server, failure_threshold=2)
+
+        server.error = ReadTimeout("Timed out")
+        with pytest.raises(ReadTimeout):
+            client.get("/api/v1/courses")
+
+        server.error = None
+        client.get("/api/v1/courses")
+
+        assert breaker.failures == 0
+        assert not breaker.is_open
+
+    def test_other_errors_are_not_counted(self):
+        server = SwitchableServer()
+        server.error = DecodingError("Malformed response")
+        client, breaker = build_client(server, failure_threshold=1)
+
+        with pytest.raises(DecodingError):
+            client.get("/api/v1/courses")
+
+        assert not breaker.is_open
+
+    def test_successful_trial_request_closes_circuit(self):
+        server = SwitchableServer()
+        server.error = ConnectError("Connection refused")
+        client, breaker = build_client(server, failure_threshold=1)
+
+        with pytest.raises(ConnectError):
+            client.get("/api/v1/courses")
+        assert breaker.is_open
+
+        time.sleep(RESET_TIMEOUT)
+        server.error = None
+
+        assert client.get("/api/v1/courses").status_code == HTTPStatus.OK
+        assert not breaker.is_open
+
+    def test_failed_trial_request_opens_circuit_again(self):
+        server = SwitchableServer()
+        server.error = ConnectError("Connection refused")
+        client, breaker = build_client(server, failure_threshold=1)
+
+        with pytest.raises(ConnectError):
+            client.get("/api/v1/courses")
+
+        time.sleep(RESET_TIMEOUT)
+        with pytest.raises(ConnectError):
+            client.get("/api/v1/courses")
+
+        with pytest.raises(CircuitOpenError):
+            client.get("/api/v1/courses")
+        assert server.requests == 2
+
+    def test_only_one_trial_request_is_let_through(self):
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=RESET_TIMEOUT)
+        request = Request("GET", "http://lms.test/api/v1/courses")
+        breaker.on_failure(ConnectError("Connection refused"))
+
+        time.sleep(RESET_TIMEOUT)
+        breaker.before_request(request)
+
+        # Пока пробный запрос выполняется, остальные запросы отклоняются
+        with pytest.raises(CircuitOpenError):
+            breaker.before_request(request)
+
+    def test_async_requests_fail_fast_when_open(self):
+        server = SwitchableServer()
+        server.error = ConnectError("Connection refused")
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+        transport = CircuitBreakerTransport(MockTransport(server.handle), breaker)
+
+        async def run():
+            async with AsyncClient(base_url="http://lms.test", transport=transport) as client:
+                with pytest.raises(ConnectError):
+                    await client.get("/api/v1/courses")
+                with pytest.raises(CircuitOpenError):
+                    await client.get("/api/v1/courses")
+
+        asyncio.run(run())
+        assert server.requests == 1
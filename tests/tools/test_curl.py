@@ -0,0 +1,143 @@
+from http import HTTPStatus
+from pathlib import Path
+from types import SimpleNamespace
+
+import allure
+import pytest
+from httpx import Client, MockTransport, Request, Response
+
+import fixtures.allure
+from clients.event_hooks import curl_event_hook, curl_history
+from config import settings
+from tools.http.curl import CurlHistory, make_curl_from_request
+from tools.http.uploads import UploadPayloadCache
+
+PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+
+
+def send(request: Request) -> Response:
+    return Response(HTTPStatus.OK)
+
+
+@pytest.fixture
+def attachments(monkeypatch) -> list[tuple[bytes | str, str]]:
+    attachments = []
+    monkeypatch.setattr(allure, "attach", lambda body, name, *args, **kwargs: attachments.append((body, name)))
+    return attachments
+
+
+@pytest.fixture
+def client() -> Client:
+    curl_history.clear()
+    return Client(base_url="http://lms.test", transport=MockTransport(send), event_hooks={"request": [curl_event_hook]})
+
+
+def make_report(failed: bool, when: str = "call") -> None:
+    # Вызываем hookwrapper fixtures/allure.py так же, как pytest: до и после формирования отчета
+    hook = fixtures.allure.pytest_runtest_makereport(None, None)
+    next(hook)
+    with pytest.raises(StopIteration):
+        hook.send(SimpleNamespace(get_result=lambda: SimpleNamespace(failed=failed, when=when)))
+
+
+@pytest.mark.tools
+class TestCurlCommand:
+    def test_text_body_is_inlined_and_quoted(self):
+        request = Request("POST", "http://lms.test/api/v1/courses", json={"title": "It's"})
+
+        curl = make_curl_from_request(request, max_body_size=1024)
+
+        assert curl.command.endswith("""-d '{"title":"It'\\''s"}'""")
+        assert curl.body_file is None
+
+    def test_small_binary_body_is_inlined(self):
+        request = Request("POST", "http://lms.test/api/v1/files", content=b"\x89PNG\r\n'")
+
+        curl = make_curl_from_request(request, max_body_size=1024)
+
+        assert curl.command.endswith("--data-binary $'\\x89PNG\\x0d\\x0a\\x27'")
+        assert curl.body_file is None
+
+    @pytest.mark.parametrize("content, max_body_size", [(PNG, 1024), (b"x" * 100, 10)])
+    def test_body_that_cannot_be_inlined_is_referenced_as_file(self, content: bytes, max_body_size: int):
+        request = Request("POST", "http://lms.test/api/v1/files", content=content)
+
+        curl = make_curl_from_request(request, max_body_size=max_body_size)
+
+        assert curl.command.endswith(f"--data-binary '@{curl.body_file}'")
+        assert curl.body == content
+
+    def test_streamed_upload_is_rendered_as_form(self, tmp_path: Path):
+        path = tmp_path.joinpath("image.png")
+        path.write_bytes(PNG)
+        cache = UploadPayloadCache(mmap_max_size=1024)
+
+        # Тело загрузки отправляется потоком и не вычитывается: cURL ссылается на сам файл
+        with cache.open(path) as file:
+            request = Request(
+                "POST", "http://lms.test/api/v1/files", data={"directory": "tests"}, files={"upload_file": file}
+            )
+        curl = make_curl_from_request(request, max_body_size=1024)
+        cache.close()
+
+        assert f"-F 'upload_file=@{path.resolve()};filename=image.png;type=image/png'" in curl.command
+        assert "-F 'directory=tests'" in curl.command
+        assert "content-type" not in curl.command.lower().replace("type=image/png", "")
+        assert curl.body_file is None
+
+
+@pytest.mark.tools
+class TestCurlHistory:
+    def test_keeps_only_last_requests(self):
+        history = CurlHistory(size=2)
+        for index in range(3):
+            history.append(Request("GET", f"http://lms.test/api/v1/courses/{index}"))
+
+        commands = [curl.command for curl in history.render()]
+
+        assert len(commands) == 2
+        assert "'http://lms.test/api/v1/courses/1'" in commands[0]
+        assert "'http://lms.test/api/v1/courses/2'" in commands[1]
+        assert history.render() == []
+
+
+@pytest.mark.tools
+class TestCurlModes:
+    def test_always_attaches_each_request(self, monkeypatch, client: Client, attachments: list):
+        monkeypatch.setattr(settings.curl, "mode", "always")
+
+        client.post("/api/v1/files", content=PNG)
+
+        [(command, command_name), (body, body_name)] = attachments
+        assert command_name == "cURL command"
+        assert command.endswith(f"'@{body_name}'")
+        assert body == PNG
+
+    def test_on_failure_attaches_only_failed_tests(self, monkeypatch, client: Client, attachments: list):
+        monkeypatch.setattr(settings.curl, "mode", "on_failure")
+
+        client.get("/api/v1/courses")
+        make_report(failed=False, when="call")
+        assert attachments == []
+
+        make_report(failed=True, when="call")
+        assert [name for _, name in attachments] == ["cURL command"]
+        assert "'http://lms.test/api/v1/courses'" in attachments[0][0]
+
+    def test_history_is_cleared_after_passed_test(self, monkeypatch, client: Client, attachments: list):
+        monkeypatch.setattr(settings.curl, "mode", "on_failure")
+
+        client.get("/api/v1/courses")
+        make_report(failed=False, when="teardown")
+        make_report(failed=True, when="teardown")
+
+        assert attachments == []
+
+    def test_never_does_not_capture_requests(self, monkeypatch, client: Client, attachments: list):
+        monkeypatch.setattr(settings.curl, "mode", "never")
+
+        client.get("/api/v1/courses")
+        make_report(failed=True)
+
+        assert attachments == []
+        assert curl_history.render() == []
@@ -0,0 +1,71 @@
+import threading
+
+import pytest
+
+from clients.courses.courses_schema import CreateCourseRequestSchema
+from fixtures.factory import EntityFactory
+from tools.fakers import fake
+
+# Сколько ждать, пока все ветки одновременно дойдут до создания курса
+BARRIER_TIMEOUT = 5
+# Поля, значения которых уникальны и не зависят от seed
+UNIQUE_FIELDS = {"email", "filename", "preview_file_id", "created_by_user_id", "upload_file"}
+
+
+def plan_payloads(factory: EntityFactory, count: int) -> list[list[dict]]:
+    plans = [factory.plan_branch(CreateCourseRequestSchema, set()) for _ in range(count)]
+    return [[request.model_dump(exclude=UNIQUE_FIELDS) for _, request in plan] for plan in plans]
+
+
+@pytest.mark.tools
+class TestEntityFactory:
+    def test_plan_branch_creates_dependencies_in_order(self):
+        plan = EntityFactory(concurrency=5).plan_branch(CreateCourseRequestSchema, set())
+
+        assert [type(request).__name__ for _, request in plan] == [
+            "CreateUserRequestSchema", "CreateFileRequestSchema", "CreateCourseRequestSchema"
+        ]
+
+    def test_payloads_are_reproducible_with_concurrency(self):
+        factory = EntityFactory(concurrency=5)
+
+        fake.seed(42)
+        first = plan_payloads(factory, count=5)
+        fake.seed(42)
+        second = plan_payloads(factory, count=5)
+
+        assert first == second
+
+    def test_independent_branches_are_created_concurrently(self):
+        factory = EntityFactory(concurrency=3)
+        barrier = threading.Barrier(3, timeout=BARRIER_TIMEOUT)
+        threads: set[str] = set()
+
+        def create(request, entities):
+            return request
+
+        def create_course(request, entities):
+            # Барьер пропускает ветки, только когда все три создают курс одновременно
+            threads.add(threading.current_thread().name)
+            barrier.wait()
+            return request
+
+        factory.creators = {**{schema: create for schema in factory.creators}, CreateCourseRequestSchema: create_course}
+
+        courses = factory.build(CreateCourseRequestSchema, count=3)
+
+        assert len(courses) == 3
+        assert len(threads) == 3
+
+    def test_single_branch_is_created_in_test_thread(self):
+        factory = EntityFactory(concurrency=3)
+        threads: list[threading.Thread] = []
+
+        def create(request, entities):
+            threads.append(threading.current_thread())
+            return request
+
+        factory.creators = {schema: create for schema in factory.creators}
+        factory.build(CreateCourseRequestSchema)
+
+        assert threads == [threading.current_thread()] * 3
@@ -0,0 +1,98 @@
+import itertools
+import random
+
+import pytest
+from faker import Faker
+
+from tools.fakers import Fake, ValuePool
+
+
+@pytest.mark.tools
+class TestValuePool:
+    def test_values_are_generated_once(self):
+        counter = itertools.count()
+        pool = ValuePool(lambda: next(counter), size=8)
+
+        picked = {pool.pick(random.Random(seed)) for seed in range(100)}
+
+        assert next(counter) == 8
+        assert picked <= set(range(8))
+
+    def test_pool_has_at_least_one_value(self):
+        assert ValuePool(lambda: "value", size=0).values == ["value"]
+
+    def test_same_rng_seed_picks_same_values(self):
+        pool = ValuePool(itertools.count().__next__, size=64)
+
+        first_rng, second_rng = random.Random(7), random.Random(7)
+
+        assert [pool.pick(first_rng) for _ in range(10)] == [pool.pick(second_rng) for _ in range(10)]
+
+
+@pytest.mark.tools
+class TestFake:
+    def test_same_seed_reproduces_non_unique_values(self):
+        fake = Fake(Faker(), pool_size=16, seed=1)
+
+        fake.seed(42)
+        first = [fake.text(), fake.first_name(), fake.integer(1, 1000)]
+        fake.seed(42)
+        second = [fake.text(), fake.first_name(), fake.integer(1, 1000)]
+
+        assert first == second
+
+    def test_same_seed_generates_unique_emails(self):
+        # Повтор теста (--reruns) и повторный запуск с тем же seed не должны создавать уже занятые email
+        fake = Fake(Faker(), pool_size=16, seed=1)
+
+        fake.seed(42)
+        first = fake.email()
+        fake.seed(42)
+        second = fake.email()
+
+        assert first != second
+        assert first.split(".")[0] == second.split(".")[0]
+
+    def test_emails_are_unique_between_instances_with_same_seed(self):
+        first = Fake(Faker(), pool_size=16, seed=1)
+        second = Fake(Faker(), pool_size=16, seed=1)
+
+        assert first.email(domain="example.com") != second.email(domain="example.com")
+
+    def test_uuid_does_not_depend_on_seed(self):
+        fake = Fake(Faker(), pool_size=16, seed=1)
+
+        fake.seed(42)
+        first = fake.uuid4()
+        fake.seed(42)
+
+        assert fake.uuid4() != first
+
+    def test_pools_are_created_lazily_with_pool_size(self):
+        fake = Fake(Faker(), pool_size=16, seed=1)
+        fake.first_name()
+
+        assert list(fake._pools) == ["first_name"]
+        assert len(fake._pools["first_name"].values) == 16
+
+    def test_pool_values_do_not_depend_on_creation_order(self):
+        # Содержимое пула зависит только от seed и имени провайдера, а не от того, какие пулы созданы раньше
+        first = Fake(Faker(), pool_size=16, seed=1)
+        second = Fake(Faker(), pool_size=16, seed=1)
+        second.text()
+        second.sentence()
+
+        first.first_name()
+        second.first_name()
+
+        assert first._pools["first_name"].values == second._pools["first_name"].values
+
+    def test_reset_rebuilds_pools_from_new_seed(self):
+        fake = Fake(Faker(), pool_size=16, seed=1)
+        fake.first_name()
+        values = fake._pools["first_name"].values
+
+        fake.reset(2)
+        fake.first_name()
+
+        assert fake._pools["first_name"].values != values
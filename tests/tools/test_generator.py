@@ -0,0 +1,84 @@
+import hashlib
+import struct
+import zlib
+from pathlib import Path
+
+import pytest
+
+from tools.testdata.generator import SyntheticFileGenerator, KB, FileKind
+
+SIGNATURES: dict[FileKind, tuple[bytes, bytes]] = {
+    "png": (b"\x89PNG\r\n\x1a\n", b"IEND\xaeB`\x82"),
+    "jpeg": (b"\xff\xd8", b"\xff\xd9"),
+    "pdf": (b"%PDF-1.4", b"%%EOF\n"),
+}
+
+
+def read_png_chunks(content: bytes) -> list[tuple[bytes, bytes]]:
+    chunks, offset = [], 8
+    while offset < len(content):
+        length, = struct.unpack(">I", content[offset:offset + 4])
+        kind, data = content[offset + 4:offset + 8], content[offset + 8:offset + 8 + length]
+        crc, = struct.unpack(">I", content[offset + 8 + length:offset + 12 + length])
+        assert crc == zlib.crc32(kind + data), f"Invalid CRC of PNG chunk {kind!r}"
+        chunks.append((kind, data))
+        offset += 12 + length
+
+    return chunks
+
+
+@pytest.mark.tools
+class TestSyntheticFileGenerator:
+    @pytest.mark.parametrize("kind", ["png", "jpeg", "pdf"])
+    def test_file_has_format_signature_and_size(self, tmp_path: Path, kind: FileKind):
+        path = SyntheticFileGenerator(tmp_path, seed=1).get(kind, size=256 * KB)
+        content = path.read_bytes()
+
+        header, footer = SIGNATURES[kind]
+        assert content.startswith(header) and content.endswith(footer)
+        assert abs(len(content) - 256 * KB) / (256 * KB) < 0.05
+
+    def test_binary_file_has_exact_size(self, tmp_path: Path):
+        path = SyntheticFileGenerator(tmp_path, seed=1).get("binary", size=3 * KB + 1)
+
+        assert path.stat().st_size == 3 * KB + 1
+
+    def test_png_chunks_are_valid(self, tmp_path: Path):
+        content = SyntheticFileGenerator(tmp_path, seed=1).get("png", size=2048 * KB).read_bytes()
+        chunks = read_png_chunks(content)
+
+        width, height = struct.unpack(">II", chunks[0][1][:8])
+        pixels = zlib.decompress(b"".join(data for kind, data in chunks if kind == b"IDAT"))
+
+        assert (chunks[0][0], chunks[-1][0]) == (b"IHDR", b"IEND")
+        # IDAT пишется несколькими чанками по мере накопления данных
+        assert sum(kind == b"IDAT" for kind, _ in chunks) > 1
+        assert len(pixels) == height * (1 + width * 3)
+
+    def test_same_parameters_reproduce_content(self, tmp_path: Path):
+        first = SyntheticFileGenerator(tmp_path.joinpath("first"), seed=1).get("png", size=64 * KB)
+        second = SyntheticFileGenerator(tmp_path.joinpath("second"), seed=1).get("png", size=64 * KB)
+
+        assert first.read_bytes() == second.read_bytes()
+
+    def test_different_seed_changes_content(self, tmp_path: Path):
+        generator = SyntheticFileGenerator(tmp_path, seed=1)
+
+        first, second = generator.get("binary", size=KB), generator.get("binary", size=KB, seed=2)
+
+        assert first != second
+        assert first.read_bytes() != second.read_bytes()
+
+    def test_file_is_generated_once(self, tmp_path: Path):
+        generator = SyntheticFileGenerator(tmp_path, seed=1)
+        path = generator.get("pdf", size=16 * KB)
+        modified = path.stat().st_mtime_ns
+
+        assert generator.get("pdf", size=16 * KB) == path
+        assert path.stat().st_mtime_ns == modified
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_cached_hash_matches_content(self, tmp_path: Path):
+        path = SyntheticFileGenerator(tmp_path, seed=1).get("jpeg", size=128 * KB)
+
+        assert SyntheticFileGenerator.get_hash(path) == hashlib.sha256(path.read_bytes()).hexdigest()
@@ -0,0 +1,82 @@
+import math
+import random
+
+import pytest
+
+from tools.metrics.histogram import LatencyHistogram
+
+PRECISION = 0.01
+
+
+def get_exact_percentile(values: list[float], percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(math.ceil(len(ordered) * percent / 100), 1) - 1]
+
+
+@pytest.mark.tools
+class TestLatencyHistogram:
+    def test_empty_histogram(self):
+        histogram = LatencyHistogram(PRECISION)
+
+        assert histogram.summary() == {
+            "count": 0, "min": None, "max": None, "mean": None, "p50": None, "p95": None, "p99": None
+        }
+
+    @pytest.mark.parametrize("percent", [50, 95, 99, 100])
+    def test_percentile_relative_error_is_within_precision(self, percent: float):
+        generator = random.Random(percent)
+        values = [generator.lognormvariate(3, 1) for _ in range(10_000)]
+        histogram = LatencyHistogram(PRECISION)
+        for value in values:
+            histogram.record(value)
+
+        expected = get_exact_percentile(values, percent)
+        assert abs(histogram.percentile(percent) - expected) / expected <= PRECISION
+
+    def test_summary_keeps_exact_count_min_max_and_mean(self):
+        histogram = LatencyHistogram(PRECISION)
+        for value in (10.0, 20.0, 30.0):
+            histogram.record(value)
+
+        summary = histogram.summary()
+
+        assert (summary["count"], summary["min"], summary["max"]) == (3, 10.0, 30.0)
+        assert summary["mean"] == pytest.approx(20.0)
+        assert summary["p99"] == 30.0
+
+    def test_zero_values_are_recorded(self):
+        histogram = LatencyHistogram(PRECISION)
+        histogram.record(0.0)
+
+        assert histogram.count == 1
+        assert histogram.percentile(50) == pytest.approx(0.001, rel=PRECISION)
+
+    def test_merge_equals_recording_all_values(self):
+        generator = random.Random(1)
+        values = [generator.uniform(1, 500) for _ in range(1_000)]
+        merged, first, second = LatencyHistogram(PRECISION), LatencyHistogram(PRECISION), LatencyHistogram(PRECISION)
+        for index, value in enumerate(values):
+            merged.record(value)
+            (first if index % 2 else second).record(value)
+
+        first.merge(second)
+
+        assert first.to_dict() == {**merged.to_dict(), "total": pytest.approx(merged.total)}
+
+    def test_merge_into_empty_histogram(self):
+        histogram, other = LatencyHistogram(PRECISION), LatencyHistogram(PRECISION)
+        other.record(42.0)
+
+        histogram.merge(other)
+
+        assert (histogram.count, histogram.min, histogram.max) == (1, 42.0, 42.0)
+
+    def test_dict_round_trip(self):
+        histogram = LatencyHistogram(PRECISION)
+        for value in (1.5, 15.0, 150.0):
+            histogram.record(value)
+
+        restored = LatencyHistogram.from_dict(histogram.to_dict())
+
+        assert restored.to_dict() == histogram.to_dict()
+        assert restored.summary() == histogram.summary()
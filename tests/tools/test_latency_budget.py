@@ -0,0 +1,53 @@
+import warnings
+from http import HTTPStatus
+
+import pytest
+from httpx import Request, Response
+
+from config import settings
+from tools.assertions.base import LatencyBudgetWarning, assert_response_time, assert_response_time_budget
+
+ENDPOINT = "/api/v1/courses"
+
+
+def build_response(total: float) -> Response:
+    return Response(
+        HTTPStatus.OK,
+        request=Request("GET", f"http://lms.test{ENDPOINT}"),
+        extensions={"endpoint": ENDPOINT, "latency": {"total": total}}
+    )
+
+
+@pytest.mark.tools
+class TestAssertResponseTime:
+    def test_passes_within_budget(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            assert_response_time(build_response(100.0), 150)
+
+    def test_raises_when_budget_exceeded(self):
+        with pytest.raises(AssertionError, match="Response time exceeded: \"GET /api/v1/courses\""):
+            assert_response_time(build_response(250.0), 150)
+
+    def test_warn_only_emits_warning_instead_of_raising(self):
+        with pytest.warns(LatencyBudgetWarning, match="Actual time: 250.0 ms"):
+            assert_response_time(build_response(250.0), 150, warn_only=True)
+
+
+@pytest.mark.tools
+class TestAssertResponseTimeBudget:
+    def test_uses_budget_and_mode_from_settings(self, monkeypatch):
+        monkeypatch.setattr(settings.latency_budget, "budgets", {f"GET {ENDPOINT}": 150})
+        monkeypatch.setattr(settings.latency_budget, "mode", "warn")
+
+        with pytest.warns(LatencyBudgetWarning):
+            assert_response_time_budget(build_response(250.0))
+
+        monkeypatch.setattr(settings.latency_budget, "mode", "fail")
+        with pytest.raises(AssertionError):
+            assert_response_time_budget(build_response(250.0))
+
+    def test_skips_endpoints_without_budget(self, monkeypatch):
+        monkeypatch.setattr(settings.latency_budget, "budgets", {})
+
+        assert_response_time_budget(build_response(10_000.0))
@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from tools.load.runner import RatePacer
+from tools.load.stats import LoadStats, format_load_report
+
+
+def build_stats(started: float, values: list[tuple[str, float, bool]]) -> LoadStats:
+    stats = LoadStats()
+    for scenario, duration, is_error in values:
+        stats.record(scenario, duration, is_error)
+
+    stats.started, stats.finished = started, started + 10
+    return stats
+
+
+@pytest.mark.tools
+class TestLoadStats:
+    def test_merge_sums_scenarios_and_extends_duration(self):
+        first = build_stats(100, [("get_courses", 10.0, False), ("get_courses", 20.0, True)])
+        second = build_stats(105, [("get_courses", 30.0, False), ("create_course", 40.0, False)])
+
+        first.merge(second)
+        report = first.build_report()
+
+        assert (first.started, first.finished, report["duration"]) == (100, 115, 15)
+        assert report["scenarios"]["get_courses"]["requests"] == 3
+        assert report["scenarios"]["get_courses"]["errors"] == 1
+        assert report["scenarios"]["create_course"]["requests"] == 1
+        assert report["total"]["requests"] == 4
+        assert report["total"]["error_rate"] == 0.25
+        assert report["total"]["max"] == 40.0
+
+    def test_dict_round_trip(self):
+        stats = build_stats(100, [("get_courses", 10.0, False), ("create_course", 40.0, True)])
+
+        restored = LoadStats.from_dict(stats.to_dict())
+
+        assert restored.to_dict() == stats.to_dict()
+        assert restored.build_report() == stats.build_report()
+
+    def test_report_shows_error_rate_in_error_column(self):
+        stats = build_stats(100, [("get_courses", 10.0, False), ("get_courses", 20.0, True)])
+
+        header, row = format_load_report(stats.build_report()).splitlines()[1:3]
+
+        assert header.split()[:4] == ["Scenario", "requests", "error", "%"]
+        assert row.split()[:3] == ["get_courses", "2", "50.0%"]
+
+
+@pytest.mark.tools
+class TestRatePacer:
+    def test_waits_are_spaced_by_interval(self):
+        pacer = RatePacer(rps=50)
+
+        async def run() -> list[float]:
+            moments = []
+            for _ in range(5):
+                await pacer.wait()
+                moments.append(time.monotonic())
+            return moments
+
+        moments = asyncio.run(run())
+
+        # Первый слот выдается сразу, следующие — не чаще, чем раз в 1/50 секунды
+        assert moments[-1] - moments[0] >= 4 * pacer.interval - 0.005
+        assert all(later - earlier >= pacer.interval - 0.005 for earlier, later in zip(moments, moments[1:]))
+
+    def test_concurrent_waits_get_distinct_slots(self):
+        pacer = RatePacer(rps=100)
+
+        async def run() -> float:
+            started = time.monotonic()
+            await asyncio.gather(*(pacer.wait() for _ in range(5)))
+            return time.monotonic() - started
+
+        # Пять задач делят слоты: последняя ждет четыре интервала
+        assert asyncio.run(run()) >= 4 * pacer.interval - 0.005
@@ -0,0 +1,135 @@
+import socket
+import sys
+from types import SimpleNamespace
+
+import pytest
+from pydantic import HttpUrl
+
+import fixtures.local_server
+from config import settings
+from tools.http.health import check_server_health
+from tools.local_server import LocalServer, LocalServerError, get_free_port
+
+HOST = "127.0.0.1"
+
+
+class StaticServer(LocalServer):
+    """
+    Вместо uvicorn с LMS API запускает http.server: проверяется только управление процессом сервера.
+    """
+
+    def build_command(self) -> list[str]:
+        return [sys.executable, "-m", "http.server", str(self.port), "--bind", self.host]
+
+
+class BrokenServer(LocalServer):
+    def build_command(self) -> list[str]:
+        return [sys.executable, "-c", "import sys; print('Address already in use'); sys.exit(3)"]
+
+
+def build_server(server_class: type[LocalServer], name: str, directory) -> LocalServer:
+    return server_class(name=name, app_dir=directory, app="main:app", host=HOST, directory=directory, env={})
+
+
+class FakeLocalServer:
+    """
+    Заглушка LocalServer для pytest_configure: сервер не запускается, а только отдает адрес.
+    """
+
+    instances: list["FakeLocalServer"] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.url = "http://127.0.0.1:50123"
+        self.stopped = False
+        FakeLocalServer.instances.append(self)
+
+    def start(self, startup_timeout: float) -> None:
+        pass
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+def build_config(dist: str = "no", worker: bool = False) -> SimpleNamespace:
+    config = SimpleNamespace(option=SimpleNamespace(dist=dist))
+    if worker:
+        config.workerinput = {"workerid": "gw0"}
+
+    return config
+
+
+@pytest.mark.tools
+class TestLocalServer:
+    def test_free_port_can_be_bound(self):
+        port = get_free_port(HOST)
+
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind((HOST, port))
+
+    def test_servers_run_on_separate_ports_with_own_databases(self, tmp_path):
+        first, second = build_server(StaticServer, "gw0", tmp_path), build_server(StaticServer, "gw1", tmp_path)
+        try:
+            first.start(startup_timeout=10)
+            second.start(startup_timeout=10)
+
+            assert first.port != second.port
+            assert first.database_file != second.database_file
+            assert check_server_health(first.url, timeout=1.0) is None
+            assert check_server_health(second.url, timeout=1.0) is None
+        finally:
+            first.stop()
+            second.stop()
+
+        assert first.process is None and second.process is None
+        assert check_server_health(first.url, timeout=1.0, log_errors=False) is not None
+
+    def test_start_removes_database_of_previous_run(self, tmp_path):
+        server = build_server(StaticServer, "gw0", tmp_path)
+        server.database_file.write_text("stale")
+        try:
+            server.start(startup_timeout=10)
+
+            assert not server.database_file.exists()
+        finally:
+            server.stop()
+
+    def test_exited_server_raises_error_with_log_tail(self, tmp_path):
+        server = build_server(BrokenServer, "gw0", tmp_path)
+
+        with pytest.raises(LocalServerError, match="exited with code 3(.|\\n)*Address already in use"):
+            server.start(startup_timeout=10)
+
+
+@pytest.mark.tools
+class TestLocalServerPlugin:
+    @pytest.fixture(autouse=True)
+    def fake_server(self, monkeypatch, tmp_path):
+        FakeLocalServer.instances.clear()
+        monkeypatch.setattr(fixtures.local_server, "LocalServer", FakeLocalServer)
+        monkeypatch.setattr(settings.local_server, "enabled", True)
+        monkeypatch.setattr(settings.local_server, "app_dir", tmp_path)
+        monkeypatch.setattr(settings.fake_lms, "enabled", False)
+        monkeypatch.setattr(settings.http_client, "url", settings.http_client.url)
+
+    def test_configure_points_client_to_local_server(self):
+        fixtures.local_server.pytest_configure(build_config(dist="load", worker=True))
+        fixtures.local_server.pytest_unconfigure(build_config(dist="load", worker=True))
+
+        [server] = FakeLocalServer.instances
+        assert settings.http_client.url == HttpUrl(server.url)
+        assert server.stopped
+
+    def test_xdist_controller_does_not_start_server(self):
+        url = settings.http_client.url
+
+        fixtures.local_server.pytest_configure(build_config(dist="load"))
+
+        assert FakeLocalServer.instances == []
+        assert settings.http_client.url == url
+
+    def test_missing_app_dir_is_usage_error(self, monkeypatch):
+        monkeypatch.setattr(settings.local_server, "app_dir", None)
+
+        with pytest.raises(pytest.UsageError, match="LOCAL_SERVER.APP_DIR"):
+            fixtures.local_server.pytest_configure(build_config())
@@ -0,0 +1,72 @@
+import json
+import logging
+import queue
+from logging.handlers import QueueListener
+
+import pytest
+
+from tools.logger import DeferredQueueHandler, JSONLinesFormatter, get_logger, queue_handler
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.messages.append(self.format(record))
+
+
+def build_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    logger = logging.getLogger(name)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.handlers = [handler]
+    return logger
+
+
+@pytest.mark.tools
+class TestDeferredQueueHandler:
+    def test_record_is_queued_without_formatting(self):
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger = build_logger("TEST_DEFERRED_QUEUE", DeferredQueueHandler(log_queue))
+
+        logger.info("Got %s", "value")
+        record = log_queue.get_nowait()
+
+        assert (record.msg, record.args) == ("Got %s", ("value",))
+
+    def test_listener_flushes_all_records_on_stop(self):
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        collector = CollectingHandler()
+        listener = QueueListener(log_queue, collector, respect_handler_level=True)
+        logger = build_logger("TEST_QUEUE_LISTENER", DeferredQueueHandler(log_queue))
+
+        listener.start()
+        for index in range(100):
+            logger.info("Record %d", index)
+        listener.stop()
+
+        assert collector.messages == [f"Record {index}" for index in range(100)]
+
+
+@pytest.mark.tools
+class TestGetLogger:
+    def test_repeated_calls_do_not_duplicate_handler(self):
+        first = get_logger("TEST_GET_LOGGER")
+        second = get_logger("TEST_GET_LOGGER")
+
+        assert first is second
+        assert second.handlers.count(queue_handler) == 1
+
+
+@pytest.mark.tools
+class TestJSONLinesFormatter:
+    def test_formats_record_as_json_line(self):
+        record = logging.LogRecord("HTTP_CLIENT", logging.INFO, __file__, 1, "Got %s", ("value",), None)
+
+        data = json.loads(JSONLinesFormatter(worker="gw1").format(record))
+
+        assert data | {"time": None} == {
+            "time": None, "worker": "gw1", "name": "HTTP_CLIENT", "level": "INFO", "message": "Got value"
+        }
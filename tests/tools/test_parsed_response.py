@@ -0,0 +1,55 @@
+from http import HTTPStatus
+
+import pytest
+from httpx import Client, MockTransport, Request, Response
+
+import clients.parsed_response
+from clients.parsed_response import ParsedResponse, parse_response
+from clients.users.private_users_client import PrivateUsersClient
+from clients.users.users_schema import GetUserResponseSchema
+
+USER = {"id": "user-id", "email": "user@example.com", "lastName": "Last", "firstName": "First", "middleName": "Middle"}
+
+
+def get_user(request: Request) -> Response:
+    return Response(HTTPStatus.OK, json={"user": {**USER, "id": request.url.path.rsplit("/", 1)[-1]}})
+
+
+@pytest.fixture
+def json_loads_calls(monkeypatch) -> list[bytes]:
+    calls = []
+    json_loads = clients.parsed_response.json_loads
+
+    def counting_json_loads(content: bytes):
+        calls.append(content)
+        return json_loads(content)
+
+    monkeypatch.setattr(clients.parsed_response, "json_loads", counting_json_loads)
+    return calls
+
+
+@pytest.mark.tools
+class TestParsedResponse:
+    def test_body_is_parsed_once_for_json_and_model(self, json_loads_calls: list[bytes]):
+        parsed_response = parse_response(Response(HTTPStatus.OK, json={"user": USER}), GetUserResponseSchema)
+
+        assert parsed_response.model is parsed_response.model
+        assert parsed_response.json is parsed_response.json
+        assert parsed_response.model.user.email == USER["email"]
+        assert parsed_response.json == {"user": USER}
+        assert len(json_loads_calls) == 1
+
+    def test_body_is_not_parsed_until_accessed(self, json_loads_calls: list[bytes]):
+        parsed_response = parse_response(Response(HTTPStatus.NOT_FOUND, content=b"not json"), GetUserResponseSchema)
+
+        assert parsed_response.status_code == HTTPStatus.NOT_FOUND
+        assert json_loads_calls == []
+
+    def test_typed_client_method_returns_parsed_response(self, json_loads_calls: list[bytes]):
+        client = PrivateUsersClient(client=Client(base_url="http://lms.test", transport=MockTransport(get_user)))
+
+        parsed_response = client.get_user("user-1")
+
+        assert isinstance(parsed_response, ParsedResponse)
+        assert parsed_response.model.user.id == parsed_response.json["user"]["id"] == "user-1"
+        assert len(json_loads_calls) == 1
@@ -0,0 +1,50 @@
+import pytest
+from httpx import Client
+
+from clients.private_http_builder import PrivateHTTPClientCache, AuthenticationUserSchema
+
+
+def build_user(index: int) -> AuthenticationUserSchema:
+    return AuthenticationUserSchema(email=f"user-{index}@example.com", password="password")
+
+
+@pytest.mark.tools
+class TestPrivateHTTPClientCache:
+    def test_returns_cached_client_for_same_user(self):
+        cache = PrivateHTTPClientCache(maxsize=2)
+        created: list[AuthenticationUserSchema] = []
+
+        def factory(user: AuthenticationUserSchema) -> Client:
+            created.append(user)
+            return Client()
+
+        first = cache.get_or_create(build_user(1), factory)
+
+        assert cache.get_or_create(build_user(1), factory) is first
+        assert created == [build_user(1)]
+        cache.clear()
+
+    def test_evicts_and_closes_least_recently_used_client(self):
+        cache = PrivateHTTPClientCache(maxsize=2)
+        first = cache.get_or_create(build_user(1), lambda user: Client())
+        second = cache.get_or_create(build_user(2), lambda user: Client())
+
+        # После обращения к первому клиенту самым давно использованным становится второй
+        cache.get_or_create(build_user(1), lambda user: Client())
+        third = cache.get_or_create(build_user(3), lambda user: Client())
+
+        assert second.is_closed
+        assert not first.is_closed and not third.is_closed
+
+        cache.clear()
+        assert first.is_closed and third.is_closed
+
+    def test_recreates_closed_client(self):
+        cache = PrivateHTTPClientCache(maxsize=2)
+        first = cache.get_or_create(build_user(1), lambda user: Client())
+        first.close()
+
+        second = cache.get_or_create(build_user(1), lambda user: Client())
+
+        assert second is not first and not second.is_closed
+        cache.clear()
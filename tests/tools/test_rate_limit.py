@@ -0,0 +1,114 @@
+import base64
+import json
+import threading
+import time
+from http import HTTPStatus
+
+import pytest
+from httpx import Client, MockTransport, Request, Response
+
+import clients.api_client
+import clients.authentication.token_auth
+from clients.api_client import APIClient
+from clients.authentication.authentication_client import AuthenticationClient
+from clients.authentication.authentication_schema import LoginRequestSchema, TokenSchema
+from clients.authentication.token_auth import TokenAuth
+from config import settings, RateLimitGroupConfig
+from tools.assertions.base import assert_status_code
+from tools.http.rate_limit import RateLimiter
+
+BASE_URL = "http://lms.test"
+# Сколько ждать запрос, прежде чем считать, что он завис в ожидании слота
+DEADLOCK_TIMEOUT = 10
+
+
+def issue_token() -> TokenSchema:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": time.time() + 3600}).encode()).decode().rstrip("=")
+    return TokenSchema(tokenType="bearer", accessToken=f"header.{payload}.signature", refreshToken="refresh")
+
+
+class AuthServer:
+    """
+    Обработчик для httpx.MockTransport: выдает токены на /authentication/* и запоминает пути запросов.
+    """
+
+    def __init__(self):
+        self.paths: list[str] = []
+
+    def handle(self, request: Request) -> Response:
+        self.paths.append(request.url.path)
+        if request.url.path.startswith("/api/v1/authentication/"):
+            return Response(HTTPStatus.OK, json={"token": issue_token().model_dump(by_alias=True)})
+
+        return Response(HTTPStatus.OK, json={})
+
+
+def build_limiter(directory, **group) -> RateLimiter:
+    return RateLimiter(enabled=True, directory=directory, groups={"writes": RateLimitGroupConfig(**group)})
+
+
+@pytest.mark.tools
+class TestRateLimiter:
+    def test_concurrency_slot_is_reentrant(self, tmp_path):
+        limiter = build_limiter(tmp_path, routes=["POST *"], concurrency=1)
+
+        with limiter.limit("POST", "/api/v1/courses"):
+            # Вложенный запрос той же группы не ждет слот, который держит внешний запрос
+            with limiter.limit("POST", "/api/v1/authentication/refresh"):
+                pass
+
+            # Слот по-прежнему занят внешним запросом
+            assert limiter.groups[0].try_acquire_slot() is None
+
+        slot = limiter.groups[0].try_acquire_slot()
+        assert slot is not None
+        limiter.groups[0].release_slot(slot)
+
+    def test_concurrency_slot_is_not_shared_between_threads(self, tmp_path):
+        limiter = build_limiter(tmp_path, routes=["POST *"], concurrency=1)
+        acquired = threading.Event()
+
+        def acquire():
+            with limiter.limit("POST", "/api/v1/courses"):
+                acquired.set()
+
+        with limiter.limit("POST", "/api/v1/courses"):
+            thread = threading.Thread(target=acquire, daemon=True)
+            thread.start()
+            assert not acquired.wait(0.2)
+
+        thread.join(DEADLOCK_TIMEOUT)
+        assert acquired.is_set()
+
+    def test_token_bucket_delays_requests_over_rate(self, tmp_path):
+        limiter = build_limiter(tmp_path, routes=["GET *"], rate=20, burst=1)
+
+        started = time.perf_counter()
+        for _ in range(3):
+            with limiter.limit("GET", "/api/v1/courses"):
+                pass
+
+        # Первый запрос проходит сразу, два следующих ждут по 1/20 секунды
+        assert time.perf_counter() - started >= 0.09
+
+    def test_token_refresh_inside_limited_request(self, tmp_path, monkeypatch):
+        server = AuthServer()
+        limiter = build_limiter(tmp_path, routes=["POST *"], concurrency=1)
+        monkeypatch.setattr(clients.api_client, "rate_limiter", limiter)
+        monkeypatch.setattr(
+            clients.authentication.token_auth, "get_authentication_client",
+            lambda: AuthenticationClient(client=Client(base_url=BASE_URL, transport=MockTransport(server.handle)))
+        )
+        # Токен всегда считается истекающим: каждый запрос сначала обновляет его через POST /authentication/refresh
+        monkeypatch.setattr(settings.http_client, "token_refresh_margin", 10 ** 9)
+
+        auth = TokenAuth(LoginRequestSchema(email="user@example.com", password="password"), token=issue_token())
+        client = APIClient(client=Client(base_url=BASE_URL, auth=auth, transport=MockTransport(server.handle)))
+        responses = []
+        thread = threading.Thread(target=lambda: responses.append(client.post("/api/v1/courses", json={})), daemon=True)
+        thread.start()
+        thread.join(DEADLOCK_TIMEOUT)
+
+        assert not thread.is_alive(), "Request with token refresh is stuck waiting for the rate limiter slot"
+        assert_status_code(responses[0].status_code, HTTPStatus.OK)
+        assert server.paths == ["/api/v1/authentication/refresh", "/api/v1/courses"]
@@ -0,0 +1,36 @@
+import pytest
+
+from clients.private_http_builder import AuthenticationUserSchema
+from tools.resources import ResourceTracker
+
+
+@pytest.mark.tools
+class TestResourceTracker:
+    def test_change_owner_email_updates_resources_of_updated_user(self):
+        tracker = ResourceTracker(enabled=True, concurrency=1)
+        admin = AuthenticationUserSchema(email="admin@example.com", password="password")
+        user = AuthenticationUserSchema(email="user@example.com", password="password")
+        tracker.track("user", "admin-id", admin)
+        tracker.track("user", "user-id", user)
+        tracker.track("file", "admin-file-id", admin)
+        tracker.track("file", "user-file-id", user)
+
+        # Email пользователя меняет другой пользователь: владелец определяется по user_id, а не по клиенту
+        tracker.change_owner_email("user-id", "new@example.com")
+
+        owners = {resource.id: resource.owner.email for resource in tracker.resources}
+        assert owners == {
+            "admin-id": "admin@example.com",
+            "user-id": "new@example.com",
+            "admin-file-id": "admin@example.com",
+            "user-file-id": "new@example.com",
+        }
+
+    def test_change_owner_email_ignores_untracked_user(self):
+        tracker = ResourceTracker(enabled=True, concurrency=1)
+        owner = AuthenticationUserSchema(email="user@example.com", password="password")
+        tracker.track("file", "file-id", owner)
+
+        tracker.change_owner_email("unknown-id", "new@example.com")
+
+        assert [resource.owner for resource in tracker.resources] == [owner]
@@ -0,0 +1,151 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from httpx import Client, AsyncClient, MockTransport, Request, Response, ConnectError
+
+from tools.allure.steps import async_step
+from tools.http.retry import RetryTransport, RetryBudget
+
+
+class FlakyServer:
+    """
+    Обработчик для httpx.MockTransport: первые `failures` запросов завершаются ответом `status`
+    или ошибкой соединения (status=None), остальные — 200.
+    """
+
+    def __init__(self, failures: int, status: HTTPStatus | None = HTTPStatus.SERVICE_UNAVAILABLE):
+        self.failures = failures
+        self.status = status
+        self.requests = 0
+
+    def handle(self, request: Request) -> Response:
+        self.requests += 1
+        if self.requests > self.failures:
+            return Response(HTTPStatus.OK)
+
+        if self.status is None:
+            raise ConnectError("Connection refused", request=request)
+
+        return Response(self.status)
+
+
+def build_transport(server: FlakyServer, budget: int = 100, **options) -> RetryTransport:
+    return RetryTransport(
+        MockTransport(server.handle),
+        budget=RetryBudget(size=budget),
+        max_attempts=options.pop("max_attempts", 3),
+        backoff=0,
+        max_backoff=0,
+        **options
+    )
+
+
+@async_step("Get courses {name}")
+async def get_courses(name: str, client: AsyncClient) -> Response:
+    return await client.get("http://lms.test/api/v1/courses")
+
+
+@pytest.mark.tools
+class TestRetryTransport:
+    @pytest.mark.parametrize("status", [HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, None])
+    def test_idempotent_request_is_retried(self, status: HTTPStatus | None):
+        server = FlakyServer(failures=2, status=status)
+        client = Client(transport=build_transport(server))
+
+        response = client.get("http://lms.test/api/v1/courses")
+
+        assert response.status_code == HTTPStatus.OK
+        assert server.requests == 3
+
+    def test_last_response_is_returned_after_max_attempts(self):
+        server = FlakyServer(failures=5)
+        client = Client(transport=build_transport(server, max_attempts=3))
+
+        response = client.delete("http://lms.test/api/v1/courses/1")
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert server.requests == 3
+
+    def test_connection_error_is_raised_after_max_attempts(self):
+        server = FlakyServer(failures=5, status=None)
+        client = Client(transport=build_transport(server, max_attempts=2))
+
+        with pytest.raises(ConnectError):
+            client.get("http://lms.test/api/v1/courses")
+
+        assert server.requests == 2
+
+    def test_post_is_not_retried(self):
+        server = FlakyServer(failures=1)
+        client = Client(transport=build_transport(server))
+
+        response = client.post("http://lms.test/api/v1/courses", json={})
+
+        assert response.status_code == HTTPStatus.SERVICE_UNAVAILABLE
+        assert server.requests == 1
+
+    @pytest.mark.parametrize("retry_patch, requests", [(False, 1), (True, 2)])
+    def test_patch_is_retried_only_when_enabled(self, retry_patch: bool, requests: int):
+        server = FlakyServer(failures=1)
+        client = Client(transport=build_transport(server, retry_patch=retry_patch))
+
+        client.patch("http://lms.test/api/v1/courses/1", json={})
+
+        assert server.requests == requests
+
+    def test_client_errors_are_not_retried(self):
+        server = FlakyServer(failures=1, status=HTTPStatus.INTERNAL_SERVER_ERROR)
+        client = Client(transport=build_transport(server))
+
+        response = client.get("http://lms.test/api/v1/courses")
+
+        assert response.status_code == HTTPStatus.INTERNAL_SERVER_ERROR
+        assert server.requests == 1
+
+    def test_retries_stop_when_budget_is_exhausted(self):
+        server = FlakyServer(failures=10)
+        transport = build_transport(server, budget=2, max_attempts=5)
+        client = Client(transport=transport)
+
+        client.get("http://lms.test/api/v1/courses")
+        client.get("http://lms.test/api/v1/courses")
+
+        # Первый запрос использовал оба повтора бюджета, второй выполнен один раз
+        assert server.requests == 4
+        assert transport.budget.used == 2
+
+    def test_delay_is_bounded_by_max_backoff(self):
+        transport = RetryTransport(
+            MockTransport(FlakyServer(failures=0).handle),
+            budget=RetryBudget(size=1),
+            max_attempts=3,
+            backoff=0.1,
+            max_backoff=0.5
+        )
+
+        assert all(0 <= transport.get_delay(1) <= 0.1 for _ in range(100))
+        assert all(0 <= transport.get_delay(10) <= 0.5 for _ in range(100))
+
+    def test_async_idempotent_request_is_retried(self):
+        server = FlakyServer(failures=2)
+
+        async def run() -> Response:
+            async with AsyncClient(transport=build_transport(server)) as client:
+                return await client.get("http://lms.test/api/v1/courses")
+
+        assert asyncio.run(run()).status_code == HTTPStatus.OK
+        assert server.requests == 3
+
+    def test_concurrent_async_retry_steps_are_not_nested_under_other_tasks(self, recorder):
+        clients = {name: AsyncClient(transport=build_transport(FlakyServer(failures=1))) for name in ("first", "second")}
+
+        async def run() -> list[Response]:
+            return await asyncio.gather(*(get_courses(name, client) for name, client in clients.items()))
+
+        responses = asyncio.run(run())
+
+        assert [response.status_code for response in responses] == [HTTPStatus.OK, HTTPStatus.OK]
+        # Шаги открывает только первая задача: повтор второй задачи не попадает внутрь шагов первой
+        assert [parent for _, parent in recorder.steps] == [None, "Get courses 'first'"]
+        assert recorder.steps[1][0].startswith("Retry GET http://lms.test/api/v1/courses after 503")
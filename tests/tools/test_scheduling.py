@@ -0,0 +1,148 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from tools.scheduling import DurationHistory, DurationScheduling, get_group
+
+
+class FakeConfig:
+    """
+    Минимальная конфигурация pytest для планировщика xdist: `workers` воркеров.
+    """
+
+    def __init__(self, workers: int):
+        self.workers = workers
+
+    def getvalue(self, name: str):
+        return [f"{self.workers}*popen"] if name == "tx" else None
+
+
+class FakeNode:
+    """
+    Воркер xdist, который запоминает отправленные ему тесты.
+    """
+
+    def __init__(self, name: str):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.sent: list[int] = []
+
+    def send_runtest_some(self, indexes: list[int]) -> None:
+        self.sent.extend(indexes)
+
+    def shutdown(self) -> None:
+        self.shutting_down = True
+
+
+COLLECTION = ["a.py::test_1", "a.py::test_2", "b.py::test_1", "b.py::test_2", "c.py::test_1"]
+
+
+def build_history(durations: dict[str, float], scope: str | None = "module") -> DurationHistory:
+    history = DurationHistory()
+    for nodeid, duration in durations.items():
+        history.record(nodeid, "setup", 0.0, scope)
+        history.record(nodeid, "call", duration)
+
+    return history
+
+
+HISTORY = build_history({
+    "a.py::test_1": 1.0, "a.py::test_2": 1.0, "b.py::test_1": 3.0, "b.py::test_2": 2.0, "c.py::test_1": 0.5
+})
+
+
+def start_scheduling(history: DurationHistory, collection: list[str], workers: int):
+    scheduling = DurationScheduling(FakeConfig(workers), history)
+    nodes = [FakeNode(f"gw{index}") for index in range(workers)]
+    for node in nodes:
+        scheduling.add_node(node)
+        scheduling.add_node_collection(node, collection)
+
+    scheduling.schedule()
+    return scheduling, nodes
+
+
+@pytest.mark.tools
+class TestGetGroup:
+    @pytest.mark.parametrize("scope, group", [
+        ("package", "tests/users"),
+        ("module", "tests/users/test_users.py"),
+        ("class", "tests/users/test_users.py::TestUsers"),
+        (None, "tests/users/test_users.py::TestUsers::test_get_user_me"),
+    ])
+    def test_group_by_shared_scope(self, scope: str | None, group: str):
+        assert get_group("tests/users/test_users.py::TestUsers::test_get_user_me", scope) == group
+
+    def test_class_scope_of_function_without_class(self):
+        assert get_group("tests/test_health.py::test_health", "class") == "tests/test_health.py::test_health"
+
+
+@pytest.mark.tools
+class TestDurationHistory:
+    def test_durations_are_smoothed(self):
+        history = DurationHistory(smoothing=0.5)
+        history.record("test_a", "call", 1.0)
+        history.record("test_a", "call", 3.0)
+
+        assert history.get_duration("test_a") == 2.0
+
+    def test_duration_sums_phases(self):
+        history = DurationHistory()
+        for phase, duration in (("setup", 0.5), ("call", 1.0), ("teardown", 0.25)):
+            history.record("test_a", phase, duration, scope="class")
+
+        assert history.get_duration("test_a") == 1.75
+        assert history.get_scope("test_a") == "class"
+        assert history.get_duration("test_unknown") is None
+
+    def test_dump_and_load(self, tmp_path: Path):
+        history = build_history({"test_a": 1.0})
+        history.dump(tmp_path.joinpath("durations.json"))
+
+        loaded = DurationHistory()
+        loaded.load(tmp_path.joinpath("durations.json"))
+
+        assert loaded.tests == history.tests
+
+    def test_broken_file_is_ignored(self, tmp_path: Path):
+        file = tmp_path.joinpath("durations.json")
+        file.write_text("{not json")
+
+        history = DurationHistory()
+        history.load(file)
+
+        assert history.tests == {}
+
+
+@pytest.mark.tools
+class TestDurationScheduling:
+    def test_unknown_tests_are_estimated_at_average(self):
+        scheduling = DurationScheduling(FakeConfig(2), build_history({"a.py::test_a": 1.0, "b.py::test_b": 3.0}))
+
+        durations = scheduling.get_durations(["a.py::test_a", "b.py::test_b", "c.py::test_c"])
+
+        assert durations == {"a.py::test_a": 1.0, "b.py::test_b": 3.0, "c.py::test_c": 2.0}
+
+    def test_longest_groups_are_sent_first(self):
+        scheduling, (first, second) = start_scheduling(HISTORY, COLLECTION, workers=2)
+
+        # b.py (5 s) и a.py (2 s) уходят сразу, короткий c.py ждет воркера, который освободится первым
+        assert [COLLECTION[index] for index in first.sent] == ["b.py::test_1", "b.py::test_2"]
+        assert [COLLECTION[index] for index in second.sent] == ["a.py::test_1", "a.py::test_2"]
+        assert list(scheduling.workqueue) == ["c.py"]
+
+    def test_next_group_is_sent_when_worker_runs_last_test(self):
+        scheduling, (first, second) = start_scheduling(HISTORY, COLLECTION, workers=2)
+
+        scheduling.mark_test_complete(second, COLLECTION.index("a.py::test_1"))
+
+        assert [COLLECTION[index] for index in second.sent][-1] == "c.py::test_1"
+        assert [COLLECTION[index] for index in first.sent] == ["b.py::test_1", "b.py::test_2"]
+        assert not scheduling.workqueue
+
+    def test_extra_workers_get_no_tests(self):
+        _, nodes = start_scheduling(build_history({"a.py::test_1": 1.0}), ["a.py::test_1"], workers=3)
+
+        assert sorted(len(node.sent) for node in nodes) == [0, 0, 1]
+        assert all(node.shutting_down for node in nodes)
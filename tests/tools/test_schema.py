@@ -0,0 +1,45 @@
+import pytest
+from jsonschema.exceptions import SchemaError
+from pydantic import BaseModel
+
+from tools.assertions.schema import SchemaValidatorCache, get_schema_fingerprint
+
+
+class UserModel(BaseModel):
+    id: str
+    email: str
+
+
+@pytest.mark.tools
+class TestSchemaValidatorCache:
+    def test_model_validator_is_cached_by_class(self):
+        cache = SchemaValidatorCache()
+
+        first, second = cache.get_validator(UserModel), cache.get_validator(UserModel)
+
+        assert first is second
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_model_and_its_schema_share_validator(self):
+        cache = SchemaValidatorCache()
+
+        from_model = cache.get_validator(UserModel)
+        from_schema = cache.get_validator(UserModel.model_json_schema())
+
+        assert from_model is from_schema
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_schema_is_cached_by_fingerprint(self):
+        cache = SchemaValidatorCache()
+        schema = {"type": "object", "properties": {"id": {"type": "string"}}, "required": ["id"]}
+        reordered = {"required": ["id"], "properties": {"id": {"type": "string"}}, "type": "object"}
+
+        assert get_schema_fingerprint(schema) == get_schema_fingerprint(reordered)
+        assert cache.get_validator(schema) is cache.get_validator(reordered)
+        assert cache.get_validator({"type": "string"}) is not cache.get_validator(schema)
+        assert (cache.hits, cache.misses) == (2, 2)
+        assert cache.hit_ratio == 0.5
+
+    def test_invalid_schema_is_rejected(self):
+        with pytest.raises(SchemaError):
+            SchemaValidatorCache().get_validator({"type": "unknown"})
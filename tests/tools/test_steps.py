@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from tools.allure.steps import async_step
+
+
+@async_step("Request {name}")
+async def make_request(name: str, delay: float = 0.01) -> str:
+    await asyncio.sleep(delay)
+    return name
+
+
+@async_step("Scenario {name}")
+async def run_scenario(name: str) -> str:
+    return await make_request(name)
+
+
+@pytest.mark.tools
+class TestAsyncStep:
+    def test_sequential_steps_are_nested(self, recorder):
+        assert asyncio.run(run_scenario("first")) == "first"
+
+        assert recorder.steps == [("Scenario 'first'", None), ("Request 'first'", "Scenario 'first'")]
+
+    def test_concurrent_steps_are_not_nested_under_other_tasks(self, recorder):
+        async def run():
+            return await asyncio.gather(run_scenario("first"), run_scenario("second"))
+
+        assert asyncio.run(run()) == ["first", "second"]
+
+        # Шаг открывает только первая задача, шаги второй не попадают внутрь него
+        assert recorder.steps == [("Scenario 'first'", None), ("Request 'first'", "Scenario 'first'")]
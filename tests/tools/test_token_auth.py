@@ -0,0 +1,164 @@
+import asyncio
+import base64
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+import pytest
+from httpx import Client, AsyncClient, MockTransport, Request, Response
+
+import clients.authentication.token_auth
+from clients.authentication.authentication_client import AuthenticationClient, AsyncAuthenticationClient
+from clients.authentication.authentication_schema import LoginRequestSchema
+from clients.authentication.token_auth import TokenAuth, get_token_expiration
+from config import settings
+
+BASE_URL = "http://lms.test"
+
+
+def build_jwt(expires_at: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": expires_at}).encode()).decode().rstrip("=")
+    return f"header.{payload}.signature"
+
+
+class FakeAuthServer:
+    """
+    Сервер аутентификации для httpx.MockTransport: выдает JWT с заданным временем жизни и отвечает 401
+    на запросы с токенами, которые были отозваны.
+    """
+
+    def __init__(self, token_ttl: float = 3600, delay: float = 0.0):
+        self.token_ttl = token_ttl
+        self.delay = delay
+        self.logins = 0
+        self.refreshes = 0
+        self.refresh_status = HTTPStatus.OK
+        self.revoked: set[str] = set()
+        self.authorizations: list[str] = []
+        self._lock = threading.Lock()
+
+    def issue_token(self) -> dict:
+        access_token = build_jwt(time.time() + self.token_ttl)
+        return {"token": {"tokenType": "bearer", "accessToken": access_token, "refreshToken": "refresh"}}
+
+    def handle(self, request: Request) -> Response:
+        time.sleep(self.delay)
+        with self._lock:
+            if request.url.path.endswith("/login"):
+                self.logins += 1
+                return Response(HTTPStatus.OK, json=self.issue_token())
+
+            if request.url.path.endswith("/refresh"):
+                self.refreshes += 1
+                if self.refresh_status != HTTPStatus.OK:
+                    return Response(self.refresh_status)
+                return Response(HTTPStatus.OK, json=self.issue_token())
+
+            authorization = request.headers["Authorization"].removeprefix("Bearer ")
+            self.authorizations.append(authorization)
+            if authorization in self.revoked:
+                return Response(HTTPStatus.UNAUTHORIZED)
+            return Response(HTTPStatus.OK, json={})
+
+
+@pytest.fixture
+def server(monkeypatch) -> FakeAuthServer:
+    server = FakeAuthServer()
+    transport = MockTransport(server.handle)
+    monkeypatch.setattr(
+        clients.authentication.token_auth, "get_authentication_client",
+        lambda: AuthenticationClient(client=Client(base_url=BASE_URL, transport=transport))
+    )
+    monkeypatch.setattr(
+        clients.authentication.token_auth, "get_async_authentication_client",
+        lambda: AsyncAuthenticationClient(client=AsyncClient(base_url=BASE_URL, transport=transport))
+    )
+    monkeypatch.setattr(settings.http_client, "token_refresh_margin", 60)
+    return server
+
+
+def build_client(server: FakeAuthServer, auth: TokenAuth) -> Client:
+    return Client(base_url=BASE_URL, auth=auth, transport=MockTransport(server.handle))
+
+
+def build_auth() -> TokenAuth:
+    return TokenAuth(LoginRequestSchema(email="user@example.com", password="password"))
+
+
+@pytest.mark.tools
+class TestTokenAuth:
+    def test_get_token_expiration(self):
+        assert get_token_expiration(build_jwt(1700000000)) == 1700000000
+        assert get_token_expiration("not-a-jwt") is None
+
+    def test_token_is_reused_until_refresh_margin(self, server: FakeAuthServer):
+        client = build_client(server, build_auth())
+
+        for _ in range(3):
+            client.get("/api/v1/users/me")
+
+        assert (server.logins, server.refreshes) == (1, 0)
+
+    def test_token_is_refreshed_within_refresh_margin(self, server: FakeAuthServer):
+        # Токен живет 30 секунд, а обновляется за 60 секунд до истечения: каждый запрос сначала обновляет его
+        server.token_ttl = 30
+        client = build_client(server, build_auth())
+
+        for _ in range(3):
+            client.get("/api/v1/users/me")
+
+        assert (server.logins, server.refreshes) == (1, 2)
+
+    def test_concurrent_refreshes_are_single_flight(self, server: FakeAuthServer):
+        auth = build_auth()
+        auth.get_token()
+        # Токен истек: все потоки одновременно ждут его обновления, но refresh выполняется один раз
+        auth._expires_at = time.time()
+        server.delay = 0.05
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            tokens = list(executor.map(lambda _: auth.get_token(), range(8)))
+
+        assert server.refreshes == 1
+        assert len({token.access_token for token in tokens}) == 1
+
+    def test_unauthorized_request_is_retried_once_with_new_token(self, server: FakeAuthServer):
+        auth = build_auth()
+        client = build_client(server, auth)
+        client.get("/api/v1/users/me")
+
+        server.revoked.add(auth.token.access_token)
+        response = client.get("/api/v1/users/me")
+
+        assert response.status_code == HTTPStatus.OK
+        assert server.refreshes == 1
+        assert server.authorizations[-2] in server.revoked
+        assert server.authorizations[-1] == auth.token.access_token
+
+    def test_login_again_when_refresh_fails(self, server: FakeAuthServer):
+        auth = build_auth()
+        client = build_client(server, auth)
+        client.get("/api/v1/users/me")
+
+        server.revoked.add(auth.token.access_token)
+        server.refresh_status = HTTPStatus.UNAUTHORIZED
+        response = client.get("/api/v1/users/me")
+
+        assert response.status_code == HTTPStatus.OK
+        assert (server.logins, server.refreshes) == (2, 1)
+
+    def test_async_unauthorized_request_is_retried_once_with_new_token(self, server: FakeAuthServer):
+        auth = build_auth()
+
+        async def run() -> list[Response]:
+            async with AsyncClient(base_url=BASE_URL, auth=auth, transport=MockTransport(server.handle)) as client:
+                first = await client.get("/api/v1/users/me")
+                server.revoked.add(auth.token.access_token)
+                return [first, await client.get("/api/v1/users/me")]
+
+        responses = asyncio.run(run())
+
+        assert [response.status_code for response in responses] == [HTTPStatus.OK, HTTPStatus.OK]
+        assert (server.logins, server.refreshes) == (1, 1)
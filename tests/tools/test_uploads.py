@@ -0,0 +1,86 @@
+import io
+import mmap
+
+import pytest
+from httpx import Request
+
+from tools.http.uploads import MappedFileReader, UploadPayloadCache
+
+CONTENT = b"0123456789" * 100
+
+
+@pytest.fixture
+def upload_file(tmp_path):
+    path = tmp_path.joinpath("image.png")
+    path.write_bytes(CONTENT)
+    return path
+
+
+@pytest.fixture
+def cache():
+    cache = UploadPayloadCache(mmap_max_size=len(CONTENT))
+    yield cache
+    cache.close()
+
+
+@pytest.mark.tools
+class TestMappedFileReader:
+    def test_reads_in_chunks_and_seeks(self, upload_file, cache):
+        reader = MappedFileReader(cache.get_buffer(upload_file), name=str(upload_file))
+
+        assert reader.read(4) == b"0123"
+        assert reader.tell() == 4
+        assert reader.read() == CONTENT[4:]
+        assert reader.read(4) == b""
+
+        assert reader.seek(-5, io.SEEK_END) == len(CONTENT) - 5
+        assert reader.read() == b"56789"
+        assert reader.seek(2) == 2
+        assert reader.seek(3, io.SEEK_CUR) == 5
+        assert reader.read(3) == b"567"
+
+    def test_readers_have_independent_positions(self, upload_file, cache):
+        first = MappedFileReader(cache.get_buffer(upload_file), name=str(upload_file))
+        second = MappedFileReader(cache.get_buffer(upload_file), name=str(upload_file))
+
+        first.read(10)
+
+        assert second.read(3) == b"012"
+
+    def test_multipart_body_contains_whole_file(self, upload_file, cache):
+        with cache.open(upload_file) as file:
+            request = Request("POST", "http://lms.test/api/v1/files", files={"upload_file": ("image.png", file)})
+            body = request.read()
+
+        assert CONTENT in body
+
+
+@pytest.mark.tools
+class TestUploadPayloadCache:
+    def test_small_file_mapping_is_reused(self, upload_file, cache):
+        first, second = cache.open(upload_file), cache.open(upload_file)
+
+        assert isinstance(first, MappedFileReader)
+        assert first.buffer is second.buffer
+        assert first.name == str(upload_file.resolve())
+
+    def test_large_file_is_streamed_from_disk(self, upload_file):
+        cache = UploadPayloadCache(mmap_max_size=len(CONTENT) - 1)
+
+        with cache.open(upload_file) as file:
+            assert not isinstance(file, MappedFileReader)
+            assert file.read() == CONTENT
+
+    def test_empty_file_is_not_mapped(self, tmp_path, cache):
+        path = tmp_path.joinpath("empty.txt")
+        path.write_bytes(b"")
+
+        with cache.open(path) as file:
+            assert file.read() == b""
+
+    def test_close_releases_mappings(self, upload_file, cache):
+        buffer: mmap.mmap = cache.open(upload_file).buffer
+
+        cache.close()
+
+        assert buffer.closed
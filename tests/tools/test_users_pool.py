@@ -0,0 +1,86 @@
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config import settings
+from fixtures.users import UsersPool, is_users_pool_used
+from tools.http.cassette import cassette
+
+
+def build_pool(monkeypatch: pytest.MonkeyPatch, size: int) -> tuple[UsersPool, list[str]]:
+    # Вместо создания пользователей через API пул выдает строки "user-1", "user-2", ...
+    pool, created, counter = UsersPool(size=size, concurrency=2), [], itertools.count(1)
+
+    def create_user() -> str:
+        user = f"user-{next(counter)}"
+        created.append(user)
+        return user
+
+    monkeypatch.setattr(pool, "create_user", create_user)
+    pool.provision()
+    return pool, created
+
+
+@pytest.mark.tools
+class TestUsersPool:
+    def test_provision_creates_all_users(self, monkeypatch):
+        _, created = build_pool(monkeypatch, size=3)
+
+        assert sorted(created) == ["user-1", "user-2", "user-3"]
+
+    def test_leased_users_are_exclusive_and_returned(self, monkeypatch):
+        pool, _ = build_pool(monkeypatch, size=2)
+
+        with pool.lease() as first, pool.lease() as second:
+            assert first != second
+
+        with pool.lease() as third, pool.lease() as fourth:
+            assert {third, fourth} == {first, second}
+
+    def test_exhausted_pool_grows(self, monkeypatch):
+        pool, created = build_pool(monkeypatch, size=1)
+
+        with pool.lease() as first, pool.lease() as second:
+            assert second != first
+
+        # Дополнительный пользователь остается в пуле и выдается следующим тестам без создания нового
+        with pool.lease(), pool.lease():
+            pass
+
+        assert len(created) == 2
+
+    def test_concurrent_leases_never_share_user(self, monkeypatch):
+        pool, _ = build_pool(monkeypatch, size=4)
+
+        def lease_twice(_) -> bool:
+            with pool.lease() as first, pool.lease() as second:
+                return first != second
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            assert all(executor.map(lease_twice, range(20)))
+
+
+@pytest.mark.tools
+class TestIsUsersPoolUsed:
+    @pytest.fixture(autouse=True)
+    def enable_pool(self, monkeypatch):
+        monkeypatch.setattr(settings.users_pool, "size", 2)
+        monkeypatch.setattr(cassette, "mode", "off")
+
+    def test_pool_is_used_by_default(self, request):
+        assert is_users_pool_used(request.node)
+
+    @pytest.mark.fresh_user
+    def test_fresh_user_marker_bypasses_pool(self, request):
+        assert not is_users_pool_used(request.node)
+
+    def test_cassettes_bypass_pool(self, request, monkeypatch):
+        monkeypatch.setattr(cassette, "mode", "record")
+
+        assert not is_users_pool_used(request.node)
+
+    def test_empty_pool_is_not_used(self, request, monkeypatch):
+        monkeypatch.setattr(settings.users_pool, "size", 0)
+
+        assert not is_users_pool_used(request.node)
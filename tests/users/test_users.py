@@ -6,7 +6,9 @@ from allure_commons.types import Severity
 
 from clients.users.private_users_client import PrivateUsersClient
 from clients.users.public_users_client import PublicUsersClient
-from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema
+from clients.users.users_schema import CreateUserRequestSchema, CreateUserResponseSchema, GetUserResponseSchema, \
+    UpdateUserRequestSchema, UpdateUserResponseSchema
+from clients.parsed_response import parse_response
 from fixtures.users import UserFixture
 from tools.allure.epics import AllureEpic
 from tools.allure.features import AllureFeature
@@ -14,7 +16,8 @@ from tools.allure.stories import AllureStory
 from tools.allure.tags import AllureTag
 from tools.assertions.base import assert_status_code
 from tools.assertions.schema import validate_json_schema
-from tools.assertions.users import assert_create_user_response, assert_get_user_response
+from tools.assertions.users import assert_create_user_response, assert_get_user_response, \
+    assert_update_user_response
 from tools.fakers import fake
 
 
@@ -36,12 +39,12 @@ class TestUsers:
         allure.dynamic.title(f"Attempt to create user with email: {email}")
         request = CreateUserRequestSchema(email=fake.email(domain=email))
         response = public_users_client.create_user_api(request)
-        response_data = CreateUserResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, CreateUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_create_user_response(request, response_data)
+        assert_create_user_response(request, parsed_response.model)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, CreateUserResponseSchema)
 
     @allure.title("Get user me")
     @allure.tag(AllureTag.GET_ENTITY)
@@ -54,9 +57,44 @@ class TestUsers:
             private_users_client: PrivateUsersClient
     ):
         response = private_users_client.get_user_me_api()
-        response_data = GetUserResponseSchema.model_validate_json(response.text)
+        parsed_response = parse_response(response, GetUserResponseSchema)
 
         assert_status_code(response.status_code, HTTPStatus.OK)
-        assert_get_user_response(response_data, function_user.response)
+        assert_get_user_response(parsed_response.model, function_user.response)
 
-        validate_json_schema(response.json(), response_data.model_json_schema())
+        validate_json_schema(parsed_response.json, GetUserResponseSchema)
+
+    @pytest.mark.fresh_user  # Тест изменяет пользователя, поэтому пользователь из пула не подходит
+    @allure.title("Update user")
+    @allure.tag(AllureTag.UPDATE_ENTITY)
+    @allure.story(AllureStory.UPDATE_ENTITY)
+    @allure.severity(Severity.CRITICAL)
+    @allure.sub_suite(AllureStory.UPDATE_ENTITY)
+    def test_update_user(
+            self,
+            function_user: UserFixture,
+            private_users_client: PrivateUsersClient
+    ):
+        request = UpdateUserRequestSchema()
+        response = private_users_client.update_user_api(function_user.response.user.id, request)
+        parsed_response = parse_response(response, UpdateUserResponseSchema)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
+        assert_update_user_response(request, parsed_response.model)
+
+        validate_json_schema(parsed_response.json, UpdateUserResponseSchema)
+
+    @pytest.mark.fresh_user  # Тест удаляет пользователя, поэтому пользователь из пула не подходит
+    @allure.title("Delete user")
+    @allure.tag(AllureTag.DELETE_ENTITY)
+    @allure.story(AllureStory.DELETE_ENTITY)
+    @allure.severity(Severity.NORMAL)
+    @allure.sub_suite(AllureStory.DELETE_ENTITY)
+    def test_delete_user(
+            self,
+            function_user: UserFixture,
+            private_users_client: PrivateUsersClient
+    ):
+        response = private_users_client.delete_user_api(function_user.response.user.id)
+
+        assert_status_code(response.status_code, HTTPStatus.OK)
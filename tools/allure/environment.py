@@ -1,4 +1,5 @@
 from config import settings
+from tools.seeding import session_seed
 import platform
 import sys
 
@@ -12,6 +13,7 @@ def create_allure_environment_file():
         *[f'{key}={value}' for key, value in settings.model_dump().items()],
         f"os_info={os_info}",
         f"python_version={python_version}",
+        f"seed={session_seed.seed}",
     ]
 
     properties = '\n'.join(items)
@@ -0,0 +1,45 @@
+import hashlib
+import uuid
+from pathlib import Path
+
+from allure_commons.logger import AllureFileLogger
+from allure_commons.model2 import TestResult, Attachment, Label, Status
+from allure_commons.types import AttachmentType, LabelType
+from allure_commons.utils import now
+
+
+def create_allure_session_result(
+        directory: Path,
+        name: str,
+        attachments: list[tuple[str, str | bytes, AttachmentType]]
+) -> None:
+    """
+    Добавляет в отчет Allure результат уровня сессии с вложениями.
+
+    Вложения, созданные вне теста (например, в главном процессе xdist после завершения воркеров), Allure
+    никуда не прикрепляет. Поэтому они записываются в allure-results как отдельный результат со стабильным
+    historyId, который в отчете виден в наборе "Session".
+
+    :param directory: Папка allure-results.
+    :param name: Название результата в отчете.
+    :param attachments: Вложения: название, содержимое и тип.
+    """
+    logger = AllureFileLogger(directory)
+    timestamp = now()
+    result = TestResult(
+        uuid=str(uuid.uuid4()),
+        historyId=hashlib.md5(name.encode()).hexdigest(),
+        name=name,
+        fullName=name,
+        status=Status.PASSED,
+        start=timestamp,
+        stop=timestamp,
+        labels=[Label(name=LabelType.SUITE, value="Session")]
+    )
+
+    for title, body, attachment_type in attachments:
+        source = f"{uuid.uuid4()}-attachment.{attachment_type.extension}"
+        logger.report_attached_data(body, source)
+        result.attachments.append(Attachment(name=title, source=source, type=attachment_type.mime_type))
+
+    logger.report_result(result)
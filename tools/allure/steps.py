@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import threading
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Generator
+
+import allure
+from allure_commons.utils import func_parameters, represent
+
+# Задача asyncio, шаг которой сейчас открыт в потоке
+_step_owner = threading.local()
+
+
+@contextmanager
+def task_step(title: str) -> Generator[None, None, None]:
+    """
+    Открывает шаг Allure от имени текущей задачи asyncio на время блока `with`, внутри которого есть `await`.
+
+    Шаги Allure хранятся в стеке потока, а не задачи asyncio. Если в потоке уже открыт шаг другой задачи
+    (конкурентные корутины в `asyncio.gather`), шаг не создается: иначе он попал бы внутрь чужого шага.
+    Блок при этом выполняется как обычно.
+
+    :param title: Заголовок шага.
+    """
+    task = asyncio.current_task()
+    owner = getattr(_step_owner, "task", None)
+    if owner is not None and owner is not task:
+        yield
+        return
+
+    _step_owner.task = task
+    try:
+        with allure.step(title):
+            yield
+    finally:
+        _step_owner.task = owner
+
+
+def async_step(title: str):
+    """
+    Аналог декоратора `allure.step` для асинхронных функций.
+
+    Стандартный `allure.step` закрывает шаг сразу после создания корутины, поэтому для `async def`
+    шаг открывается вручную (см. task_step) и закрывается только после завершения `await`. Декоратор рассчитан
+    на последовательные вызовы (`await` один за другим): шаги конкурентных задач не вкладываются друг в друга,
+    но и не создаются, пока открыт шаг другой задачи.
+
+    :param title: Заголовок шага, поддерживает форматирование аргументами функции (например, "{url}").
+    :return: Декоратор для асинхронной функции.
+    """
+
+    def wrapper(func: Callable[..., Awaitable[Any]]):
+        @functools.wraps(func)
+        async def inner(*args, **kwargs):
+            params = func_parameters(func, *args, **kwargs)
+            arguments = [represent(argument) for argument in args]
+
+            with task_step(title.format(*arguments, **params)):
+                return await func(*args, **kwargs)
+
+        return inner
+
+    return wrapper
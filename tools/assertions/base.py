@@ -1,12 +1,22 @@
+import warnings
 from typing import Any, Sized
 
 import allure
+from httpx import Response
 
+from config import settings
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
+from tools.metrics.latency import get_response_key, get_response_time
 
 logger = get_logger("BASE_ASSERTIONS")  # Создаем логгер с именем "BASE_ASSERTIONS"
 
 
+class LatencyBudgetWarning(UserWarning):
+    """
+    Предупреждение о превышении бюджета времени ответа (режим warn).
+    """
+
+
 @allure.step("Check that response status code equals to {expected}")
 def assert_status_code(actual: int, expected: int):
     """
@@ -16,7 +26,7 @@ def assert_status_code(actual: int, expected: int):
     :param expected: Ожидаемый статус-код.
     :raises AssertionError: Если статус-коды не совпадают.
     """
-    logger.info(f"Check that response status code equals to {expected}")  # Логируем проверку
+    logger.info("Check that response status code equals to %s", expected)  # Логируем проверку
 
     assert actual == expected, (
         f'Incorrect response status code. '
@@ -35,7 +45,7 @@ def assert_equal(actual: Any, expected: Any, name: str):
     :param expected: Ожидаемое значение.
     :raises AssertionError: Если фактическое значение не равно ожидаемому.
     """
-    logger.info(f'Check that "{name}" equals to {expected}')  # Логируем проверку
+    logger.info('Check that "%s" equals to %s', name, expected)  # Логируем проверку
 
     assert actual == expected, (
         f'Incorrect value: "{name}". '
@@ -53,7 +63,7 @@ def assert_is_true(actual: Any, name: str):
     :param actual: Фактическое значение.
     :raises AssertionError: Если фактическое значение ложно.
     """
-    logger.info(f'Check that "{name}" is true')  # Логируем проверку
+    logger.info('Check that "%s" is true', name)  # Логируем проверку
 
     assert actual, (
         f'Incorrect value: "{name}". '
@@ -71,10 +81,56 @@ def assert_length(actual: Sized, expected: Sized, name: str):
     :raises AssertionError: Если длины не совпадают.
     """
     with allure.step(f"Check that length of {name} equals to {len(expected)}"):
-        logger.info(f'Check that length of "{name}" equals to {len(expected)}')  # Логируем проверку
+        logger.info('Check that length of "%s" equals to %s', name, len(expected))  # Логируем проверку
 
         assert len(actual) == len(expected), (
             f'Incorrect object length: "{name}". '
             f'Expected length: {len(expected)}. '
             f'Actual length: {len(actual)}'
         )
+
+
+def assert_response_time(response: Response, max_time: float, warn_only: bool = False):
+    """
+    Проверяет, что время ответа не превышает допустимое.
+
+    :param response: Ответ сервера.
+    :param max_time: Допустимое время ответа в миллисекундах.
+    :param warn_only: Вместо падения выдать предупреждение LatencyBudgetWarning.
+    :raises AssertionError: Если время ответа больше допустимого и warn_only=False.
+    """
+    key = get_response_key(response)
+    actual = get_response_time(response)
+
+    with allure.step(f"Check that response time of {key} ({actual:.1f} ms) is less than {max_time} ms"):
+        logger.info('Check that response time of "%s" is less than %s ms', key, max_time)  # Логируем проверку
+
+        if actual <= max_time:
+            return
+
+        message = (
+            f'Response time exceeded: "{key}". '
+            f'Expected time: <= {max_time} ms. '
+            f'Actual time: {actual:.1f} ms'
+        )
+        if not warn_only:
+            raise AssertionError(message)
+
+        logger.warning(message)
+        warnings.warn(message, LatencyBudgetWarning)
+
+
+def assert_response_time_budget(response: Response):
+    """
+    Проверяет время ответа по бюджету эндпоинта из настроек (LATENCY_BUDGET.BUDGETS).
+
+    Если бюджет для эндпоинта не задан, проверка пропускается.
+
+    :param response: Ответ сервера.
+    :raises AssertionError: Если бюджет превышен и LATENCY_BUDGET.MODE="fail".
+    """
+    budget = settings.latency_budget.budgets.get(get_response_key(response))
+    if budget is None:
+        return
+
+    assert_response_time(response, budget, warn_only=settings.latency_budget.mode == "warn")
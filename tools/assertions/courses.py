@@ -2,7 +2,7 @@ import allure
 
 from clients.courses.courses_schema import UpdateCourseRequestSchema, UpdateCourseResponseSchema, CourseSchema, \
     GetCoursesResponseSchema, CreateCourseResponseSchema, CreateCourseRequestSchema
-from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.base import assert_equal, assert_length, assert_is_true
 from tools.assertions.files import assert_file
 from tools.assertions.users import assert_user
 from tools.logger import get_logger
@@ -68,8 +68,12 @@ def assert_get_courses_response(
 
     assert_length(get_courses_response.courses, create_course_responses, "courses")
 
-    for index, create_course_response in enumerate(create_course_responses):
-        assert_course(get_courses_response.courses[index], create_course_response.course)
+    # Курсы могут создаваться параллельно, поэтому сопоставляем их по id, а не по позиции в списке
+    courses = {course.id: course for course in get_courses_response.courses}
+    for create_course_response in create_course_responses:
+        expected = create_course_response.course
+        assert_is_true(expected.id in courses, f"course {expected.id} in courses")
+        assert_course(courses[expected.id], expected)
 
 
 @allure.step("Check create course response")
@@ -4,7 +4,7 @@ from clients.errors_schema import InternalErrorResponseSchema
 from clients.exercises.exercises_schema import CreateExerciseRequestSchema, CreateExerciseResponseSchema, \
     ExerciseSchema, GetExerciseResponseSchema, UpdateExerciseRequestSchema, UpdateExerciseResponseSchema, \
     GetExercisesResponseSchema
-from tools.assertions.base import assert_equal, assert_length
+from tools.assertions.base import assert_equal, assert_length, assert_is_true
 from tools.assertions.errors import assert_internal_error_response
 from tools.logger import get_logger
 
@@ -121,6 +121,9 @@ def assert_get_exercises_response(
     # Проверяем количество
     assert_length(get_exercises_response.exercises, create_exercise_responses, "exercises")
 
-    # Проверяем каждое задание
-    for index, create_exercise_response in enumerate(create_exercise_responses):
-        assert_exercise(get_exercises_response.exercises[index], create_exercise_response.exercise)
\ No newline at end of file
+    # Проверяем каждое задание. Задания могут создаваться параллельно, поэтому сопоставляем их по id
+    exercises = {exercise.id: exercise for exercise in get_exercises_response.exercises}
+    for create_exercise_response in create_exercise_responses:
+        expected = create_exercise_response.exercise
+        assert_is_true(expected.id in exercises, f"exercise {expected.id} in exercises")
+        assert_exercise(exercises[expected.id], expected)
\ No newline at end of file
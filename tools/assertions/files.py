@@ -1,12 +1,16 @@
+from http import HTTPStatus
+from pathlib import Path
+
 import allure
 
 from clients.errors_schema import ValidationErrorResponseSchema, ValidationErrorSchema, InternalErrorResponseSchema
 from clients.files.files_schema import CreateFileResponseSchema, CreateFileRequestSchema, FileSchema, \
-    GetFileResponseSchema
+    GetFileResponseSchema, DownloadFileResultSchema
 from config import settings
 from tools.assertions.base import assert_equal
 from tools.assertions.errors import assert_validation_error_response, assert_internal_error_response
 from tools.logger import get_logger
+from tools.testdata.generator import SyntheticFileGenerator
 
 
 logger = get_logger("FILES_ASSERTIONS")
@@ -60,6 +64,23 @@ def assert_get_file_response(
 
     assert_file(get_file_response.file, create_file_response.file)
 
+
+@allure.step("Check downloaded file content")
+def assert_download_file(actual: DownloadFileResultSchema, upload_file: Path):
+    """
+    Проверяет, что скачанный файл совпадает с загруженным исходником по размеру и SHA-256.
+
+    :param actual: Результат потокового скачивания файла.
+    :param upload_file: Путь к исходному файлу, который загружался на сервер.
+    :raises AssertionError: Если статус, размер или хэш не совпадают.
+    """
+    logger.info("Check downloaded file content: %s bytes, %.2f MB/s", actual.size, actual.throughput)
+
+    assert_equal(actual.status_code, HTTPStatus.OK, "status_code")
+    assert_equal(actual.size, upload_file.stat().st_size, "size")
+    assert_equal(actual.sha256, SyntheticFileGenerator.get_hash(upload_file), "sha256")
+
+
 @allure.step("Check create file with empty filename response")
 def assert_create_file_with_empty_filename_response(actual: ValidationErrorResponseSchema):
     """
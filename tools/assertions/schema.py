@@ -1,28 +1,115 @@
+import hashlib
+import json
+import threading
 from typing import Any
 
 import allure
-from jsonschema import validate
+from jsonschema.exceptions import best_match
 from jsonschema.validators import Draft202012Validator
+from pydantic import BaseModel
 
 from tools.logger import get_logger  # Импортируем функцию для создания логгера
 
 logger = get_logger("SCHEMA_ASSERTIONS")  # Создаем логгер с именем "SCHEMA_ASSERTIONS"
 
 
+def get_schema_fingerprint(schema: dict) -> str:
+    """
+    Вычисляет отпечаток JSON-схемы, не зависящий от порядка ключей.
+
+    :param schema: JSON-схема.
+    :return: Хэш схемы в hex-формате.
+    """
+    return hashlib.sha1(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+
+
+class SchemaValidatorCache:
+    """
+    Кэш скомпилированных валидаторов JSON-схем в рамках процесса (xdist-воркера).
+
+    - Метасхема проверяется и валидатор создается один раз на схему.
+    - Для pydantic-моделей кэшируется и сама схема, чтобы не вызывать `model_json_schema()` на каждую проверку.
+    - Валидатор доступен и по классу модели, и по отпечатку ее схемы: модель и ее схема, переданная словарем,
+      используют один валидатор.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._schemas: dict[type[BaseModel], dict] = {}
+        self._validators: dict[type[BaseModel] | str, Draft202012Validator] = {}
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_schema(self, model: type[BaseModel]) -> dict:
+        """
+        Возвращает закэшированную JSON-схему модели.
+
+        :param model: Pydantic-модель.
+        :return: JSON-схема модели.
+        """
+        with self._lock:
+            if model not in self._schemas:
+                self._schemas[model] = model.model_json_schema()
+
+            return self._schemas[model]
+
+    def get_validator(self, schema: dict | type[BaseModel]) -> Draft202012Validator:
+        """
+        Возвращает скомпилированный валидатор для схемы или pydantic-модели.
+
+        :param schema: JSON-схема (ключ кэша — отпечаток схемы) или pydantic-модель (ключ кэша — класс модели).
+        :return: Валидатор Draft 2020-12.
+        """
+        key = schema if isinstance(schema, type) else get_schema_fingerprint(schema)
+
+        with self._lock:
+            if validator := self._validators.get(key):
+                self.hits += 1
+                return validator
+
+        json_schema = self.get_schema(schema) if isinstance(schema, type) else schema
+        fingerprint = get_schema_fingerprint(json_schema)
+
+        with self._lock:
+            # Схему модели уже могли проверить, когда она передавалась словарем
+            if validator := self._validators.get(fingerprint):
+                self.hits += 1
+                self._validators[key] = validator
+                return validator
+
+            self.misses += 1
+
+        Draft202012Validator.check_schema(json_schema)
+        validator = Draft202012Validator(json_schema, format_checker=Draft202012Validator.FORMAT_CHECKER)
+
+        with self._lock:
+            self._validators[key] = self._validators[fingerprint] = validator
+
+        return validator
+
+
+schema_validator_cache = SchemaValidatorCache()
+
+
 @allure.step("Validating JSON schema")
-def validate_json_schema(instance: Any, schema: dict) -> None:
+def validate_json_schema(instance: Any, schema: dict | type[BaseModel]) -> None:
     """
     Проверяет, соответствует ли JSON-объект (instance) заданной JSON-схеме (schema).
 
     :param instance: JSON-данные, которые нужно проверить.
-    :param schema: Ожидаемая JSON-schema.
+    :param schema: Ожидаемая JSON-schema или pydantic-модель, из которой она строится.
     :raises jsonschema.exceptions.ValidationError: Если instance не соответствует schema.
     """
     # Логируем факт начала валидации
     logger.info("Validating JSON schema")
 
-    validate(
-        schema=schema,
-        instance=instance,
-        format_checker=Draft202012Validator.FORMAT_CHECKER,
-    )
+    validator = schema_validator_cache.get_validator(schema)
+    # Как и jsonschema.validate, выбираем наиболее релевантную ошибку
+    if error := best_match(validator.iter_errors(instance)):
+        raise error
@@ -4,6 +4,8 @@ from clients.users.users_schema import (
     CreateUserRequestSchema,
     CreateUserResponseSchema,
     GetUserResponseSchema,
+    UpdateUserRequestSchema,
+    UpdateUserResponseSchema,
     UserSchema,
 )
 from tools.assertions.base import assert_equal
@@ -48,3 +50,20 @@ def assert_get_user_response(get_user_response: GetUserResponseSchema, create_us
     logger.info("Check get user response")
 
     assert_user(get_user_response.user, create_user_response.user)
+
+
+@allure.step("Check update user response")
+def assert_update_user_response(request: UpdateUserRequestSchema, response: UpdateUserResponseSchema):
+    """
+    Проверяет, что ответ на обновление пользователя соответствует данным из запроса.
+
+    :param request: Исходный запрос на обновление пользователя.
+    :param response: Ответ API с обновленными данными пользователя.
+    :raises AssertionError: Если хотя бы одно поле не совпадает.
+    """
+    logger.info("Check update user response")
+
+    assert_equal(response.user.email, request.email, "email")
+    assert_equal(response.user.last_name, request.last_name, "last_name")
+    assert_equal(response.user.first_name, request.first_name, "first_name")
+    assert_equal(response.user.middle_name, request.middle_name, "middle_name")
@@ -0,0 +1,375 @@
+import base64
+import json
+import re
+import threading
+import time
+import uuid
+from email import message_from_bytes
+from http import HTTPStatus
+from typing import Any, Callable
+
+from httpx import Request, Response
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+
+from clients.authentication.authentication_schema import LoginRequestSchema, RefreshRequestSchema, TokenSchema
+from clients.courses.courses_schema import CourseSchema, CreateCourseRequestSchema, UpdateCourseRequestSchema
+from clients.exercises.exercises_schema import ExerciseSchema, CreateExerciseRequestSchema, UpdateExerciseRequestSchema
+from clients.files.files_schema import FileSchema
+from clients.users.users_schema import UserSchema, CreateUserRequestSchema, UpdateUserRequestSchema
+from tools.routes import APIRoutes
+
+# Время жизни access token, выдаваемого фейковым сервером
+ACCESS_TOKEN_TTL = 30 * 60
+
+UUID_ADAPTER = TypeAdapter(uuid.UUID)
+
+
+class CreateFileFormSchema(BaseModel):
+    """
+    Форма создания файла с ограничениями, которые проверяет сервер.
+    """
+    filename: str = Field(min_length=1)
+    directory: str = Field(min_length=1)
+    upload_file: bytes
+
+
+class HTTPError(Exception):
+    def __init__(self, status: HTTPStatus, detail: Any):
+        self.status = status
+        self.detail = detail
+
+
+def build_validation_error(error: ValidationError, location: list[str]) -> HTTPError:
+    """
+    Преобразует ошибку pydantic в ответ 422 в формате FastAPI.
+
+    :param error: Ошибка валидации pydantic.
+    :param location: Часть запроса с ошибкой, например ["body"] или ["path", "file_id"].
+    """
+    details = [
+        {
+            "type": item["type"],
+            "loc": [*location, *item["loc"]],
+            "msg": item["msg"],
+            "input": item["input"],
+            "ctx": {key: value if isinstance(value, (str, int, float)) else str(value)
+                    for key, value in item.get("ctx", {}).items()},
+        }
+        for item in error.errors(include_url=False)
+    ]
+    return HTTPError(HTTPStatus.UNPROCESSABLE_ENTITY, details)
+
+
+def build_token(user_id: str, kind: str) -> str:
+    """
+    Формирует токен в формате JWT (без подписи) с claim exp, чтобы TokenAuth мог отслеживать его истечение.
+    """
+    payload = {"sub": user_id, "type": kind, "exp": int(time.time()) + ACCESS_TOKEN_TTL, "jti": uuid.uuid4().hex}
+    encoded = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip("=")
+    return f"fake.{encoded}.signature"
+
+
+class FakeLMS:
+    """
+    In-memory реализация LMS API для быстрых изолированных прогонов без сервера.
+
+    Подключается к httpx через MockTransport (см. HTTPClientRegistry) и реализует маршруты APIRoutes:
+    пользователи, аутентификация, файлы, курсы и задания. Запросы разбираются схемами из clients/*,
+    ответы формируются ими же, ошибки повторяют формат FastAPI (422 с detail-списком, 404 с detail-строкой).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.routes: list[tuple[str, re.Pattern, Callable[..., Any], bool]] = []
+
+        self.users: dict[str, dict] = {}
+        self.files: dict[str, FileSchema] = {}
+        # Содержимое загруженных файлов по пути "directory/filename", как в /static на сервере
+        self.static: dict[str, bytes] = {}
+        self.courses: dict[str, dict] = {}
+        self.exercises: dict[str, ExerciseSchema] = {}
+        self.tokens: dict[str, str] = {}
+        self.refresh_tokens: dict[str, str] = {}
+
+        self.add_route("POST", APIRoutes.USERS, self.create_user, private=False)
+        self.add_route("GET", f"{APIRoutes.USERS}/me", self.get_user_me)
+        self.add_route("GET", f"{APIRoutes.USERS}/{{user_id}}", self.get_user)
+        self.add_route("PATCH", f"{APIRoutes.USERS}/{{user_id}}", self.update_user)
+        self.add_route("DELETE", f"{APIRoutes.USERS}/{{user_id}}", self.delete_user)
+
+        self.add_route("POST", f"{APIRoutes.AUTHENTICATION}/login", self.login, private=False)
+        self.add_route("POST", f"{APIRoutes.AUTHENTICATION}/refresh", self.refresh, private=False)
+
+        self.add_route("POST", APIRoutes.FILES, self.create_file)
+        self.add_route("GET", f"{APIRoutes.FILES}/{{file_id}}", self.get_file)
+        self.add_route("DELETE", f"{APIRoutes.FILES}/{{file_id}}", self.delete_file)
+        self.add_route("GET", f"{APIRoutes.STATIC}/{{directory}}/{{filename}}", self.get_static_file, private=False)
+
+        self.add_route("GET", APIRoutes.COURSES, self.get_courses)
+        self.add_route("POST", APIRoutes.COURSES, self.create_course)
+        self.add_route("GET", f"{APIRoutes.COURSES}/{{course_id}}", self.get_course)
+        self.add_route("PATCH", f"{APIRoutes.COURSES}/{{course_id}}", self.update_course)
+        self.add_route("DELETE", f"{APIRoutes.COURSES}/{{course_id}}", self.delete_course)
+
+        self.add_route("GET", APIRoutes.EXERCISES, self.get_exercises)
+        self.add_route("POST", APIRoutes.EXERCISES, self.create_exercise)
+        self.add_route("GET", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.get_exercise)
+        self.add_route("PATCH", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.update_exercise)
+        self.add_route("DELETE", f"{APIRoutes.EXERCISES}/{{exercise_id}}", self.delete_exercise)
+
+    def add_route(self, method: str, template: str, handler: Callable[..., Any], private: bool = True) -> None:
+        """
+        :param method: HTTP-метод.
+        :param template: Шаблон пути, например "/api/v1/users/{user_id}". Параметры вида "*_id" — UUID.
+        :param handler: Обработчик, получает запрос, текущего пользователя и параметры пути.
+            Возвращает статус и тело JSON-ответа либо готовый httpx.Response.
+        :param private: Маршрут требует Bearer-токен.
+        """
+        pattern = re.compile("^" + re.sub(r"\{(\w+)}", r"(?P<\1>[^/]+)", str(template)) + "$")
+        self.routes.append((method, pattern, handler, private))
+
+    def handle(self, request: Request) -> Response:
+        """
+        Обработчик для httpx.MockTransport.
+        """
+        try:
+            with self._lock:
+                return self.dispatch(request)
+        except HTTPError as error:
+            return Response(error.status, json={"detail": error.detail})
+
+    def dispatch(self, request: Request) -> Response:
+        path_matched = False
+        for method, pattern, handler, private in self.routes:
+            match = pattern.match(request.url.path)
+            if not match:
+                continue
+
+            path_matched = True
+            if method != request.method:
+                continue
+
+            user = self.authenticate(request) if private else None
+            params = {
+                name: self.parse_uuid(name, value) if name.endswith("_id") else value
+                for name, value in match.groupdict().items()
+            }
+
+            result = handler(request, user, **params)
+            if isinstance(result, Response):
+                return result
+
+            status, body = result
+            return Response(status, json=body)
+
+        if path_matched:
+            raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, "Method Not Allowed")
+
+        raise HTTPError(HTTPStatus.NOT_FOUND, "Not Found")
+
+    def authenticate(self, request: Request) -> dict:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        user_id = self.tokens.get(token) if scheme.lower() == "bearer" else None
+        if user_id is None or user_id not in self.users:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Not authenticated")
+
+        return self.users[user_id]
+
+    @staticmethod
+    def parse_uuid(name: str, value: str) -> str:
+        try:
+            return str(UUID_ADAPTER.validate_python(value))
+        except ValidationError as error:
+            raise build_validation_error(error, ["path", name])
+
+    @staticmethod
+    def parse_body(request: Request, schema: type[BaseModel]) -> Any:
+        try:
+            return schema.model_validate(json.loads(request.content or b"{}"))
+        except ValidationError as error:
+            raise build_validation_error(error, ["body"])
+
+    @staticmethod
+    def get_updates(request: BaseModel) -> dict:
+        # В PATCH применяются только переданные поля (без значений по умолчанию схемы)
+        return {
+            name: value for name, value in request.model_dump(include=request.model_fields_set).items()
+            if value is not None
+        }
+
+    @staticmethod
+    def get_or_404(storage: dict[str, Any], entity_id: str, name: str) -> Any:
+        if entity_id not in storage:
+            raise HTTPError(HTTPStatus.NOT_FOUND, f"{name} not found")
+
+        return storage[entity_id]
+
+    # Пользователи
+
+    @staticmethod
+    def build_user(user: dict) -> dict:
+        return {"user": user["schema"].model_dump(by_alias=True)}
+
+    def create_user(self, request: Request, user: None):
+        data = self.parse_body(request, CreateUserRequestSchema)
+        if any(item["schema"].email == data.email for item in self.users.values()):
+            raise HTTPError(HTTPStatus.BAD_REQUEST, "User already exists")
+
+        schema = UserSchema(id=str(uuid.uuid4()), **data.model_dump(exclude={"password"}))
+        self.users[schema.id] = {"schema": schema, "password": data.password}
+        return HTTPStatus.OK, self.build_user(self.users[schema.id])
+
+    def get_user_me(self, request: Request, user: dict):
+        return HTTPStatus.OK, self.build_user(user)
+
+    def get_user(self, request: Request, user: dict, user_id: str):
+        return HTTPStatus.OK, self.build_user(self.get_or_404(self.users, user_id, "User"))
+
+    def update_user(self, request: Request, user: dict, user_id: str):
+        target = self.get_or_404(self.users, user_id, "User")
+        updates = self.get_updates(self.parse_body(request, UpdateUserRequestSchema))
+        target["schema"] = target["schema"].model_copy(update=updates)
+        return HTTPStatus.OK, self.build_user(target)
+
+    def delete_user(self, request: Request, user: dict, user_id: str):
+        self.get_or_404(self.users, user_id, "User")
+        del self.users[user_id]
+        return HTTPStatus.OK, None
+
+    # Аутентификация
+
+    def issue_token(self, user_id: str) -> dict:
+        token = TokenSchema(
+            tokenType="bearer",
+            accessToken=build_token(user_id, "access"),
+            refreshToken=build_token(user_id, "refresh"),
+        )
+        self.tokens[token.access_token] = user_id
+        self.refresh_tokens[token.refresh_token] = user_id
+        return {"token": token.model_dump(by_alias=True)}
+
+    def login(self, request: Request, user: None):
+        data = self.parse_body(request, LoginRequestSchema)
+        for item in self.users.values():
+            if item["schema"].email == data.email and item["password"] == data.password:
+                return HTTPStatus.OK, self.issue_token(item["schema"].id)
+
+        raise HTTPError(HTTPStatus.UNAUTHORIZED, "Wrong email or password")
+
+    def refresh(self, request: Request, user: None):
+        data = self.parse_body(request, RefreshRequestSchema)
+        user_id = self.refresh_tokens.pop(data.refresh_token, None)
+        if user_id is None or user_id not in self.users:
+            raise HTTPError(HTTPStatus.UNAUTHORIZED, "Invalid refresh token")
+
+        return HTTPStatus.OK, self.issue_token(user_id)
+
+    # Файлы
+
+    def create_file(self, request: Request, user: dict):
+        message = message_from_bytes(
+            b"Content-Type: " + request.headers["content-type"].encode() + b"\r\n\r\n" + request.content
+        )
+        form = {
+            part.get_param("name", header="content-disposition"): (
+                part.get_payload(decode=True) if part.get_filename() else part.get_payload(decode=True).decode()
+            )
+            for part in message.get_payload()
+        }
+
+        try:
+            data = CreateFileFormSchema.model_validate(form)
+        except ValidationError as error:
+            raise build_validation_error(error, ["body"])
+
+        url = f"{request.url.scheme}://{request.url.netloc.decode()}/static/{data.directory}/{data.filename}"
+        file = FileSchema(id=str(uuid.uuid4()), url=url, filename=data.filename, directory=data.directory)
+        self.files[file.id] = file
+        self.static[f"{data.directory}/{data.filename}"] = data.upload_file
+        return HTTPStatus.OK, {"file": file.model_dump(mode="json")}
+
+    def get_file(self, request: Request, user: dict, file_id: str):
+        file = self.get_or_404(self.files, file_id, "File")
+        return HTTPStatus.OK, {"file": file.model_dump(mode="json")}
+
+    def delete_file(self, request: Request, user: dict, file_id: str):
+        self.get_or_404(self.files, file_id, "File")
+        del self.files[file_id]
+        return HTTPStatus.OK, None
+
+    def get_static_file(self, request: Request, user: None, directory: str, filename: str):
+        content = self.static.get(f"{directory}/{filename}")
+        if content is None:
+            raise HTTPError(HTTPStatus.NOT_FOUND, "Not Found")
+
+        return Response(HTTPStatus.OK, content=content, headers={"content-type": "application/octet-stream"})
+
+    # Курсы
+
+    def build_course(self, course: dict) -> dict:
+        schema = CourseSchema(
+            **course,
+            preview_file=self.get_or_404(self.files, course["preview_file_id"], "File"),
+            created_by_user=self.get_or_404(self.users, course["created_by_user_id"], "User")["schema"],
+        )
+        return schema.model_dump(by_alias=True, mode="json")
+
+    def get_courses(self, request: Request, user: dict):
+        user_id = request.url.params.get("userId")
+        courses = [course for course in self.courses.values() if course["created_by_user_id"] == user_id]
+        return HTTPStatus.OK, {"courses": [self.build_course(course) for course in courses]}
+
+    def create_course(self, request: Request, user: dict):
+        data = self.parse_body(request, CreateCourseRequestSchema)
+        course = {"id": str(uuid.uuid4()), **data.model_dump()}
+
+        response = self.build_course(course)
+        self.courses[course["id"]] = course
+        return HTTPStatus.OK, {"course": response}
+
+    def get_course(self, request: Request, user: dict, course_id: str):
+        return HTTPStatus.OK, {"course": self.build_course(self.get_or_404(self.courses, course_id, "Course"))}
+
+    def update_course(self, request: Request, user: dict, course_id: str):
+        course = self.get_or_404(self.courses, course_id, "Course")
+        course.update(self.get_updates(self.parse_body(request, UpdateCourseRequestSchema)))
+        return HTTPStatus.OK, {"course": self.build_course(course)}
+
+    def delete_course(self, request: Request, user: dict, course_id: str):
+        self.get_or_404(self.courses, course_id, "Course")
+        del self.courses[course_id]
+        return HTTPStatus.OK, None
+
+    # Задания
+
+    def get_exercises(self, request: Request, user: dict):
+        course_id = request.url.params.get("courseId")
+        exercises = [exercise for exercise in self.exercises.values() if exercise.course_id == course_id]
+        return HTTPStatus.OK, {"exercises": [exercise.model_dump(by_alias=True) for exercise in exercises]}
+
+    def create_exercise(self, request: Request, user: dict):
+        data = self.parse_body(request, CreateExerciseRequestSchema)
+        self.get_or_404(self.courses, data.course_id, "Course")
+
+        exercise = ExerciseSchema(id=str(uuid.uuid4()), **data.model_dump())
+        self.exercises[exercise.id] = exercise
+        return HTTPStatus.OK, {"exercise": exercise.model_dump(by_alias=True)}
+
+    def get_exercise(self, request: Request, user: dict, exercise_id: str):
+        exercise = self.get_or_404(self.exercises, exercise_id, "Exercise")
+        return HTTPStatus.OK, {"exercise": exercise.model_dump(by_alias=True)}
+
+    def update_exercise(self, request: Request, user: dict, exercise_id: str):
+        exercise = self.get_or_404(self.exercises, exercise_id, "Exercise")
+        updates = self.get_updates(self.parse_body(request, UpdateExerciseRequestSchema))
+
+        self.exercises[exercise_id] = exercise.model_copy(update=updates)
+        return HTTPStatus.OK, {"exercise": self.exercises[exercise_id].model_dump(by_alias=True)}
+
+    def delete_exercise(self, request: Request, user: dict, exercise_id: str):
+        self.get_or_404(self.exercises, exercise_id, "Exercise")
+        del self.exercises[exercise_id]
+        return HTTPStatus.OK, None
+
+
+fake_lms = FakeLMS()
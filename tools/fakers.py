@@ -1,16 +1,110 @@
+import itertools
+import os
+import random
+import secrets
+import threading
+import uuid
+from typing import Any, Callable
+
 from faker import Faker
 
+from config import settings
+from tools.seeding import session_seed, derive_seed
+
+
+class ValuePool:
+    """
+    Пул значений одного провайдера Faker, сгенерированных заранее одной пачкой.
+    """
+
+    def __init__(self, generate: Callable[[], Any], size: int):
+        """
+        :param generate: Функция генерации одного значения.
+        :param size: Количество значений в пуле.
+        """
+        self.values = [generate() for _ in range(max(size, 1))]
+
+    def pick(self, rng: random.Random) -> Any:
+        return self.values[rng.randrange(len(self.values))]
+
 
 class Fake:
     """
     Класс для генерации случайных тестовых данных с использованием библиотеки Faker.
+
+    Медленные провайдеры Faker (текст, имена) вызываются не на каждое значение: при первом обращении
+    генерируется пул из `pool_size` значений, из которого значения затем выбираются генератором `random`.
+
+    Значения, которые должны быть уникальными (UUID и уникальная часть email), не зависят от seed:
+    иначе повтор теста (pytest-rerunfailures) или повторный запуск с тем же seed против той же базы данных
+    создавал бы пользователей с уже занятыми email.
+
+    Содержимое пулов зависит только от seed, переданного при создании, а выбор значений — от текущего seed
+    (см. `seed`), поэтому данные воспроизводятся независимо от того, какие пулы уже были созданы.
     """
 
-    def __init__(self, faker: Faker):
+    def __init__(self, faker: Faker, pool_size: int = 1024, seed: int | None = None):
         """
-        :param faker: Экземпляр класса Faker, который будет использоваться для генерации данных.
+        :param faker: Экземпляр класса Faker, который будет использоваться для генерации пулов.
+        :param pool_size: Размер пула заранее сгенерированных значений каждого провайдера.
+        :param seed: Seed для воспроизводимых данных. None — случайные данные.
         """
         self.faker = faker
+        self.pool_size = pool_size
+
+        self._lock = threading.Lock()
+        self._pools: dict[str, ValuePool] = {}
+        self._reset_unique()
+        # Дочерний процесс (например, процесс нагрузочного прогона) получает свой префикс email
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_unique)
+
+        self.reset(seed)
+
+    def _reset_unique(self) -> None:
+        # Уникальная часть email: случайный префикс процесса и счетчик, которые не сбрасываются при смене seed
+        self._email_prefix = secrets.token_hex(6)
+        self._email_counter = itertools.count()
+
+    def reset(self, seed: int | None) -> None:
+        """
+        Сбрасывает пулы (они будут созданы заново из нового seed) и генератор значений.
+
+        :param seed: Seed для воспроизводимых данных. None — случайные данные.
+        """
+        with self._lock:
+            self.pool_seed = seed if seed is not None else random.getrandbits(64)
+            self._pools.clear()
+
+        self.seed(seed)
+
+    def seed(self, seed: int | None) -> None:
+        """
+        Переинициализирует генератор значений (например, перед каждым тестом). Пулы сохраняются.
+
+        :param seed: Seed для воспроизводимых данных. None — случайные данные.
+        """
+        with self._lock:
+            self.random = random.Random(seed)
+
+    def pool(self, name: str, generate: Callable[[], Any]) -> Any:
+        """
+        Возвращает случайное значение из пула провайдера, создавая пул при первом обращении.
+
+        :param name: Название провайдера.
+        :param generate: Функция генерации одного значения.
+        :return: Значение из пула.
+        """
+        pool = self._pools.get(name)
+        if pool is None:
+            with self._lock:
+                if name not in self._pools:
+                    self.faker.seed_instance(derive_seed(self.pool_seed, name))
+                    self._pools[name] = ValuePool(generate, self.pool_size)
+
+                pool = self._pools[name]
+
+        return pool.pick(self.random)
 
     def text(self) -> str:
         """
@@ -18,15 +112,15 @@ class Fake:
 
         :return: Случайный текст.
         """
-        return self.faker.text()
+        return self.pool("text", self.faker.text)
 
     def uuid4(self) -> str:
         """
-        Генерирует случайный UUID4.
+        Генерирует случайный UUID4 (не зависит от seed).
 
         :return: Случайный UUID4.
         """
-        return self.faker.uuid4()
+        return str(uuid.uuid4())
 
     def email(self, domain: str | None = None) -> str:
         """
@@ -34,9 +128,11 @@ class Fake:
 
         :param domain: Домен электронной почты (например, "example.com").
         Если не указан, будет использован случайный домен.
-        :return: Случайный email.
+        :return: Уникальный email. Имя пользователя и домен зависят от seed, уникальная часть — нет.
         """
-        return self.faker.email(domain=domain)
+        user_name = self.pool("user_name", self.faker.user_name)
+        domain = domain or self.pool("domain_name", self.faker.free_email_domain)
+        return f"{user_name}.{self._email_prefix}.{next(self._email_counter)}@{domain}"
 
     def sentence(self) -> str:
         """
@@ -44,7 +140,7 @@ class Fake:
 
         :return: Случайное предложение.
         """
-        return self.faker.sentence()
+        return self.pool("sentence", self.faker.sentence)
 
     def password(self) -> str:
         """
@@ -52,7 +148,7 @@ class Fake:
 
         :return: Случайный пароль.
         """
-        return self.faker.password()
+        return self.pool("password", self.faker.password)
 
     def last_name(self) -> str:
         """
@@ -60,7 +156,7 @@ class Fake:
 
         :return: Случайная фамилия.
         """
-        return self.faker.last_name()
+        return self.pool("last_name", self.faker.last_name)
 
     def first_name(self) -> str:
         """
@@ -68,7 +164,7 @@ class Fake:
 
         :return: Случайное имя.
         """
-        return self.faker.first_name()
+        return self.pool("first_name", self.faker.first_name)
 
     def middle_name(self) -> str:
         """
@@ -76,7 +172,7 @@ class Fake:
 
         :return: Случайное отчество.
         """
-        return self.faker.first_name()
+        return self.pool("first_name", self.faker.first_name)
 
     def estimated_time(self) -> str:
         """
@@ -94,7 +190,7 @@ class Fake:
         :param end: Конец диапазона (включительно).
         :return: Случайное целое число.
         """
-        return self.faker.random_int(start, end)
+        return self.random.randint(start, end)
 
     def max_score(self) -> int:
         """
@@ -114,4 +210,10 @@ class Fake:
 
 
 # Создаем экземпляр класса Fake с использованием Faker
-fake = Fake(faker=Faker())
+fake = Fake(
+    faker=Faker(),
+    pool_size=settings.faker.pool_size,
+    seed=session_seed.seed
+)
+# Пулы у всех воркеров одинаковые, а значения без пересева перед тестом — разные
+fake.seed(session_seed.worker_seed)
@@ -0,0 +1,426 @@
+import base64
+import hashlib
+import json
+import re
+import threading
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qsl
+
+from httpx import Request, Response, BaseTransport, AsyncBaseTransport, Headers, RequestNotRead
+
+from clients.api_coverage import current_endpoint
+from config import settings
+
+# Секреты заменяются при записи и не попадают в кассеты. Кроме того, токены без exp
+# не "истекают" при воспроизведении (см. TokenAuth)
+REDACTED_FIELDS = {"password", "accessToken", "refreshToken"}
+
+# Поля-идентификаторы, значения которых сопоставляются при воспроизведении: id, email, имя файла и ссылки
+# на другие сущности (courseId, preview_file_id и т.д.)
+IDENTIFIER_FIELD_PATTERN = re.compile(r"^(id|email|filename|directory)$|(Id|_id)$")
+# Поля со ссылками, в которых идентификаторы заменяются как подстроки
+LINK_FIELDS = {"url"}
+# Идентификаторы короче не заменяются как подстроки
+MIN_SUBSTRING_LENGTH = 8
+# Файл кассет с seed тестовых данных записи
+SEED_FILE = "seed.json"
+
+MULTIPART_FIELD_PATTERN = re.compile(
+    rb'Content-Disposition: form-data; name="(?P<name>[^"]+)"(?P<file>; filename="[^"]*")?[^\r\n]*\r\n'
+    rb'(?:[^\r\n]+\r\n)*\r\n(?P<value>.*?)\r\n--',
+    re.DOTALL
+)
+
+
+class CassetteMissError(Exception):
+    """
+    В кассетах нет записанного взаимодействия для запроса.
+    """
+
+
+def get_file_digest(file: Any) -> str:
+    """
+    Считает SHA-256 загружаемого файла, читая его кусками: содержимое файла не буферизуется в памяти.
+
+    После чтения позиция файла возвращается в начало, чтобы httpx отправил файл целиком.
+
+    :param file: Содержимое файла (bytes/str) или файловый объект multipart-поля httpx.
+    :return: Хэш в виде "sha256:<hex>" или пустая строка, если файл нельзя перечитать.
+    """
+    if isinstance(file, (bytes, str)):
+        return "sha256:" + hashlib.sha256(file.encode() if isinstance(file, str) else file).hexdigest()
+
+    if not (hasattr(file, "seekable") and file.seekable()):
+        return ""
+
+    file.seek(0)
+    digest = hashlib.file_digest(file, "sha256").hexdigest()
+    file.seek(0)
+    return f"sha256:{digest}"
+
+
+def get_multipart_fields(fields: list, digest: bool) -> dict[str, str]:
+    """
+    Разбирает поля потокового multipart-тела httpx (MultipartStream) без чтения тела запроса.
+
+    :param fields: Поля multipart-тела (DataField и FileField).
+    :param digest: Записывать ли вместо файлов их хэш. Без хэша файлы представлены пустой строкой.
+    :return: Значения текстовых полей и хэши (или пустые строки) файлов.
+    """
+    result = {}
+    for field in fields:
+        if hasattr(field, "file"):
+            result[field.name] = get_file_digest(field.file) if digest else ""
+        else:
+            result[field.name] = field.value if isinstance(field.value, str) else field.value.decode(errors="replace")
+
+    return result
+
+
+def get_request_fields(request: Request, digest: bool = False) -> dict[str, Any] | list | None:
+    """
+    Разбирает тело запроса: JSON, multipart (текстовые поля, файлы — хэшем или пустой строкой) или форму.
+
+    Тела JSON и форм httpx хранит в памяти, а потоковые тела (загрузка файлов) не вычитываются:
+    multipart-поля берутся из потока, а остальные потоки не разбираются.
+
+    :param request: HTTP-запрос httpx.
+    :param digest: Считать ли хэши загружаемых файлов (нужно только при записи кассеты).
+    :return: Данные тела или None, если тела нет или его не удалось разобрать.
+    """
+    try:
+        content = request.content
+    except RequestNotRead:
+        # Поля есть только у multipart-тела httpx (MultipartStream)
+        if fields := getattr(request.stream, "fields", None):
+            return get_multipart_fields(fields, digest)
+
+        return None
+
+    if not content:
+        return None
+
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith("application/json"):
+        return json.loads(content)
+
+    if content_type.startswith("multipart/form-data"):
+        return {
+            match["name"].decode(): "" if match["file"] else match["value"].decode(errors="replace")
+            for match in MULTIPART_FIELD_PATTERN.finditer(content)
+        }
+
+    if content_type.startswith("application/x-www-form-urlencoded"):
+        return dict(parse_qsl(content.decode()))
+
+    return None
+
+
+def get_shape(value: Any) -> Any:
+    """
+    Возвращает "форму" значения: ключи словарей и типы значений без самих значений.
+    """
+    if isinstance(value, dict):
+        return {key: get_shape(item) for key, item in sorted(value.items())}
+
+    if isinstance(value, list):
+        return sorted({json.dumps(get_shape(item), sort_keys=True) for item in value})
+
+    return type(value).__name__
+
+
+def get_interaction_key(method: str, endpoint: str, query: list[str], fields: Any) -> str:
+    """
+    Ключ сопоставления запроса с записью: метод, шаблон эндпоинта, имена query-параметров и форма тела.
+    """
+    return json.dumps([method, endpoint, sorted(query), get_shape(fields)], sort_keys=True)
+
+
+def redact(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: f"cassette-{key}" if key in REDACTED_FIELDS else redact(item)
+            for key, item in value.items()
+        }
+
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+
+    return value
+
+
+def is_identifier_field(field: str | None) -> bool:
+    return field is not None and IDENTIFIER_FIELD_PATTERN.search(field) is not None
+
+
+class Substitutions:
+    """
+    Карта подстановок идентификаторов "записанное значение -> значение текущего прогона".
+
+    Остальные данные запросов (названия, тексты, числа) при воспроизведении совпадают с записанными,
+    потому что генерируются из seed записи (см. `Cassette.save_seed`). Уникальные значения (email, UUID,
+    имена файлов) от seed не зависят, поэтому сопоставляются только поля-идентификаторы из запроса
+    (IDENTIFIER_FIELD_PATTERN) и параметры пути из шаблона эндпоинта. В ответе заменяются только значения
+    полей-идентификаторов, а в полях со ссылками (url) — подстроки с идентификаторами.
+    """
+
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    def learn(self, recorded: Any, live: Any, field: str | None = None) -> None:
+        """
+        Сопоставляет записанные идентификаторы с текущими (рекурсивно для словарей и списков).
+        """
+        if isinstance(recorded, dict) and isinstance(live, dict):
+            for key in recorded.keys() & live.keys():
+                self.learn(recorded[key], live[key], key)
+        elif isinstance(recorded, list) and isinstance(live, list):
+            for recorded_item, live_item in zip(recorded, live):
+                self.learn(recorded_item, live_item, field)
+        elif isinstance(recorded, str) and isinstance(live, str) and recorded != live and is_identifier_field(field):
+            self.values[recorded] = live
+
+    def learn_path(self, endpoint: str, recorded: str, live: str) -> None:
+        """
+        Сопоставляет параметры пути, например file_id в "/api/v1/files/{file_id}".
+        """
+        for name, recorded_part, live_part in zip(endpoint.split("/"), recorded.split("/"), live.split("/")):
+            if name.startswith("{") and name.endswith("}"):
+                self.learn(recorded_part, live_part, name[1:-1])
+
+    def apply(self, value: Any, field: str | None = None) -> Any:
+        """
+        Заменяет записанные идентификаторы на текущие.
+        """
+        if isinstance(value, dict):
+            return {key: self.apply(item, key) for key, item in value.items()}
+
+        if isinstance(value, list):
+            return [self.apply(item, field) for item in value]
+
+        if not isinstance(value, str):
+            return value
+
+        if is_identifier_field(field):
+            return self.values.get(value, value)
+
+        if field in LINK_FIELDS:
+            for recorded, live in self.values.items():
+                if len(recorded) >= MIN_SUBSTRING_LENGTH:
+                    value = value.replace(recorded, live)
+
+        return value
+
+
+class Cassette:
+    """
+    Хранилище записанных взаимодействий (запрос + ответ) в файлах JSON Lines, по файлу на тест.
+
+    - record — запросы уходят на сервер, пары запрос/ответ дописываются в кассету текущего теста;
+    - replay — ответы берутся из кассет без сервера. Сначала используются записи текущего теста
+      (в порядке записи), затем — записи с тем же ключом из любых кассет.
+
+    Запросы вне теста (сессионные фикстуры) в record не сохраняются, а в replay подбираются из всех кассет.
+    """
+
+    def __init__(self, mode: str, directory: Path):
+        self.mode = mode
+        self.directory = directory
+
+        self._lock = threading.Lock()
+        self._name: str | None = None
+        self._recorded: list[dict] = []
+        self._queues: dict[str, deque[dict]] = {}
+        self._library: dict[str, list[dict]] | None = None
+        self._library_index: dict[str, int] = defaultdict(int)
+        self._substitutions = Substitutions()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.mode in ("record", "replay")
+
+    def save_seed(self, seed: int) -> None:
+        """
+        Сохраняет seed тестовых данных записи: при воспроизведении с тем же seed тесты генерируют те же данные.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.directory.joinpath(SEED_FILE).write_text(json.dumps({"seed": seed}))
+
+    def load_seed(self) -> int | None:
+        file = self.directory.joinpath(SEED_FILE)
+        return json.loads(file.read_text())["seed"] if file.exists() else None
+
+    def get_file(self, name: str) -> Path:
+        return self.directory.joinpath(re.sub(r"[^\w.\-\[\]/]+", "_", name.replace("::", "/")) + ".jsonl")
+
+    @staticmethod
+    def read_file(file: Path) -> list[dict]:
+        if not file.exists():
+            return []
+
+        return [json.loads(line) for line in file.read_text(encoding="utf-8").splitlines() if line]
+
+    def get_library(self) -> dict[str, list[dict]]:
+        # Все записи из всех кассет, загружаются один раз при первом промахе
+        if self._library is None:
+            self._library = defaultdict(list)
+            for file in sorted(self.directory.rglob("*.jsonl")):
+                for interaction in self.read_file(file):
+                    self._library[interaction["key"]].append(interaction)
+
+        return self._library
+
+    def use(self, name: str) -> None:
+        """
+        Включает кассету теста.
+
+        :param name: Имя кассеты (например, nodeid теста).
+        """
+        with self._lock:
+            self._name = name
+            self._recorded = []
+            self._substitutions = Substitutions()
+            self._queues = defaultdict(deque)
+
+            if self.mode == "replay":
+                for interaction in self.read_file(self.get_file(name)):
+                    self._queues[interaction["key"]].append(interaction)
+
+    def eject(self) -> None:
+        """
+        Выключает кассету теста. В режиме record сохраняет записанные взаимодействия.
+        """
+        with self._lock:
+            if self.mode == "record" and self._name is not None:
+                file = self.get_file(self._name)
+                file.parent.mkdir(parents=True, exist_ok=True)
+                lines = [json.dumps(item, separators=(",", ":"), ensure_ascii=False) for item in self._recorded]
+                file.write_text("".join(line + "\n" for line in lines), encoding="utf-8")
+
+            self._name = None
+
+    @staticmethod
+    def build_request_record(request: Request, digest: bool = False) -> dict:
+        fields = get_request_fields(request, digest)
+        endpoint = current_endpoint.get() or request.url.path
+        query = list(request.url.params.keys())
+
+        return {
+            "key": get_interaction_key(request.method, endpoint, query, fields),
+            "path": request.url.path,
+            "query": dict(request.url.params),
+            "body": redact(fields),
+        }
+
+    def record(self, request: Request, response: Response, content: bytes) -> None:
+        # Хэши загружаемых файлов не участвуют в сопоставлении (ключ строится по форме тела),
+        # но показывают в кассете, какой файл был загружен
+        interaction = self.build_request_record(request, digest=True)
+
+        content_type = response.headers.get("content-type", "")
+        if content_type.startswith("application/json"):
+            body = {"json": redact(json.loads(content))} if content else {"text": ""}
+        else:
+            body = {"base64": base64.b64encode(content).decode()}
+
+        interaction["response"] = {"status": response.status_code, "content_type": content_type, **body}
+
+        with self._lock:
+            if self._name is not None:
+                self._recorded.append(interaction)
+
+    def find(self, key: str) -> dict:
+        with self._lock:
+            if queue := self._queues.get(key):
+                return queue.popleft()
+
+            candidates = self.get_library().get(key)
+            if not candidates:
+                raise CassetteMissError(f"No recorded interaction for request: {key}")
+
+            # Записи из других кассет используются по кругу
+            index = self._library_index[key]
+            self._library_index[key] += 1
+            return candidates[index % len(candidates)]
+
+    def replay(self, request: Request) -> Response:
+        live = self.build_request_record(request)
+        interaction = self.find(live["key"])
+
+        with self._lock:
+            substitutions = self._substitutions
+            substitutions.learn(interaction["body"], live["body"])
+            substitutions.learn(interaction["query"], live["query"])
+            substitutions.learn_path(current_endpoint.get() or "", interaction["path"], live["path"])
+
+        recorded = interaction["response"]
+        headers = Headers({"content-type": recorded["content_type"]} if recorded["content_type"] else {})
+
+        if "json" in recorded:
+            content = json.dumps(substitutions.apply(recorded["json"])).encode()
+        elif "text" in recorded:
+            content = recorded["text"].encode()
+        else:
+            content = base64.b64decode(recorded["base64"])
+
+        return Response(recorded["status"], headers=headers, content=content, request=request)
+
+
+class CassetteTransport(BaseTransport, AsyncBaseTransport):
+    """
+    Транспорт httpx, записывающий или воспроизводящий взаимодействия через Cassette.
+
+    В режиме replay вложенный транспорт не используется и соединения с сервером не открываются.
+    Тело запроса транспорт не вычитывает: потоковые загрузки файлов уходят на сервер кусками,
+    а для сопоставления и записи берутся поля multipart-потока (см. get_request_fields).
+    """
+
+    def __init__(self, cassette: Cassette, transport: BaseTransport | AsyncBaseTransport):
+        self.cassette = cassette
+        self.transport = transport
+
+    def handle_request(self, request: Request) -> Response:
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(request)
+
+        response = self.transport.handle_request(request)
+        if self.cassette.mode != "record":
+            return response
+
+        content = response.read()
+        response.close()
+        self.cassette.record(request, response, content)
+        return self.build_response(response, content)
+
+    async def handle_async_request(self, request: Request) -> Response:
+        if self.cassette.mode == "replay":
+            return self.cassette.replay(request)
+
+        response = await self.transport.handle_async_request(request)
+        if self.cassette.mode != "record":
+            return response
+
+        content = await response.aread()
+        await response.aclose()
+        self.cassette.record(request, response, content)
+        return self.build_response(response, content)
+
+    @staticmethod
+    def build_response(response: Response, content: bytes) -> Response:
+        # Тело уже прочитано и распаковано, поэтому заголовки сжатия и длины не переносятся
+        headers = [
+            (name, value) for name, value in response.headers.multi_items()
+            if name.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+        ]
+        return Response(response.status_code, headers=headers, content=content, extensions=response.extensions)
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+cassette = Cassette(mode=settings.cassette.mode, directory=settings.cassette.directory)
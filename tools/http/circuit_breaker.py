@@ -0,0 +1,146 @@
+import threading
+import time
+
+from httpx import BaseTransport, AsyncBaseTransport, Request, Response, TransportError, ConnectError, \
+    TimeoutException
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("CIRCUIT_BREAKER")
+
+# Ошибки, по которым сервер считается недоступным: соединение не устанавливается или ответ не приходит вовремя
+FAILURE_ERRORS = (ConnectError, TimeoutException)
+
+
+class CircuitOpenError(TransportError):
+    """
+    Запрос не отправлен: сервер недоступен, автоматический выключатель разомкнут.
+    """
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель, общий для всех клиентов процесса (xdist-воркера).
+
+    - closed — запросы выполняются, подряд идущие ошибки соединения и таймауты считаются;
+    - open — после `failure_threshold` ошибок подряд запросы сразу завершаются CircuitOpenError,
+      а не ждут таймаута каждый;
+    - half-open — через `reset_timeout` секунд пропускается один пробный запрос: успех замыкает выключатель,
+      ошибка снова размыкает его.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        """
+        :param failure_threshold: Количество ошибок подряд, после которого выключатель размыкается.
+        :param reset_timeout: Через сколько секунд после размыкания пропустить пробный запрос.
+        """
+        self.failure_threshold = max(failure_threshold, 1)
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.last_error: Exception | None = None
+
+        self._lock = threading.Lock()
+        self._trial_in_progress = False
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+    def before_request(self, request: Request) -> None:
+        """
+        Пропускает запрос или завершает его ошибкой, если выключатель разомкнут.
+
+        :raises CircuitOpenError: Если выключатель разомкнут и время пробного запроса не наступило.
+        """
+        with self._lock:
+            if self.opened_at is None:
+                return
+
+            if not self._trial_in_progress and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._trial_in_progress = True
+                return
+
+        raise CircuitOpenError(
+            f"Circuit breaker is open: {self.failures} consecutive connection failures or timeouts, "
+            f"last error: {self.last_error!r}. Request {request.method} {request.url} is not sent",
+            request=request
+        )
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.opened_at is not None:
+                logger.info("Server is available again, circuit breaker is closed")
+
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_progress = False
+
+    def release_trial(self) -> None:
+        # Пробный запрос завершился другой ошибкой: состояние не меняется, следующий запрос снова будет пробным
+        with self._lock:
+            self._trial_in_progress = False
+
+    def on_failure(self, error: Exception) -> None:
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self._trial_in_progress = False
+
+            if self.failures >= self.failure_threshold:
+                if self.opened_at is None:
+                    logger.error("Circuit breaker is open after %s consecutive failures: %r", self.failures, error)
+
+                self.opened_at = time.monotonic()
+
+
+class CircuitBreakerTransport(BaseTransport, AsyncBaseTransport):
+    """
+    Транспорт, пропускающий запросы через автоматический выключатель.
+    """
+
+    def __init__(self, transport: BaseTransport | AsyncBaseTransport, breaker: CircuitBreaker):
+        self.transport = transport
+        self.breaker = breaker
+
+    def handle_request(self, request: Request) -> Response:
+        self.breaker.before_request(request)
+        try:
+            response = self.transport.handle_request(request)
+        except FAILURE_ERRORS as error:
+            self.breaker.on_failure(error)
+            raise
+        except Exception:
+            self.breaker.release_trial()
+            raise
+
+        self.breaker.on_success()
+        return response
+
+    async def handle_async_request(self, request: Request) -> Response:
+        self.breaker.before_request(request)
+        try:
+            response = await self.transport.handle_async_request(request)
+        except FAILURE_ERRORS as error:
+            self.breaker.on_failure(error)
+            raise
+        except Exception:
+            self.breaker.release_trial()
+            raise
+
+        self.breaker.on_success()
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.circuit_breaker.failure_threshold,
+    reset_timeout=settings.circuit_breaker.reset_timeout
+)
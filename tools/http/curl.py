@@ -1,26 +1,167 @@
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+
 from httpx import Request, RequestNotRead
 
+# Имя файла с телом запроса, на который ссылается команда cURL. Файл прикладывается к отчету рядом с командой
+BODY_FILE = "request_body_{index}.bin"
+# Заголовки, которые cURL формирует сам при отправке формы (-F): граница multipart и длина тела
+FORM_HEADERS = frozenset({"content-type", "content-length"})
+
+# Номера файлов тел в рамках процесса, чтобы имена вложений одного теста не совпадали
+_body_file_index = itertools.count(1)
+
+
+@dataclass(frozen=True)
+class CurlCommand:
+    # Команда cURL
+    command: str
+    # Имя файла, на который ссылается команда (--data-binary @file), и его содержимое
+    body_file: str | None = None
+    body: bytes | None = None
+
+
+def quote(value: str) -> str:
+    """
+    Экранирует строку для shell одинарными кавычками.
+    """
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+def quote_binary(body: bytes) -> str:
+    """
+    Экранирует бинарные данные для bash в виде ANSI-C строки `$'...'`: непечатаемые байты записываются как `\\xHH`.
+    """
+    return "$'" + "".join(
+        chr(byte) if 0x20 <= byte < 0x7f and byte not in b"'\\" else f"\\x{byte:02x}" for byte in body
+    ) + "'"
+
+
+def make_curl_form(fields: list) -> list[str]:
+    """
+    Формирует аргументы cURL `-F` для потокового multipart-тела (загрузки файла).
+
+    Содержимое файлов не вычитывается: команда ссылается на загружаемый файл по его пути.
+
+    :param fields: Поля multipart-тела httpx (DataField и FileField).
+    :return: Аргументы cURL, по одному на поле формы.
+    """
+    arguments: list[str] = []
+    for field in fields:
+        if hasattr(field, "file"):
+            path = getattr(field.file, "name", field.filename)
+            value = f"{field.name}=@{path};filename={field.filename}"
+            if content_type := field.headers.get("Content-Type"):
+                value += f";type={content_type}"
+        else:
+            data = field.value if isinstance(field.value, str) else field.value.decode("utf-8")
+            value = f"{field.name}={data}"
+
+        arguments.append(f"-F {quote(value)}")
+
+    return arguments
+
+
+def make_curl_body(request: Request, max_body_size: int | None = None) -> CurlCommand:
+    """
+    Формирует аргумент cURL для тела запроса.
+
+    - Текстовые тела до `max_body_size` байт подставляются как есть через `-d`.
+    - Небольшие бинарные тела подставляются через `--data-binary $'...'`.
+    - Большие тела и тела с нулевыми байтами (их не передать строкой bash) заменяются на `--data-binary @file`,
+      а сами байты возвращаются, чтобы приложить их к отчету под этим именем.
+    - Потоковые multipart-тела (загрузка файла) не вычитываются, а передаются через `-F` со ссылкой на файл.
 
-def make_curl_from_request(request: Request) -> str:
+    :param request: HTTP-запрос httpx.
+    :param max_body_size: Максимальный размер тела в байтах, которое подставляется в команду целиком.
+    :return: Аргумент cURL для тела (пустая команда, если тела нет) и тело для файла, если оно не подставлено.
+    """
+    try:
+        body = request.content
+    except RequestNotRead:
+        # Поля есть только у multipart-тела httpx (MultipartStream)
+        if fields := getattr(request.stream, "fields", None):
+            return CurlCommand(" \\\n  ".join(make_curl_form(fields)))
+
+        # Произвольный поток без копии данных воспроизвести нельзя
+        return CurlCommand("")
+
+    if not body:
+        return CurlCommand("")
+
+    if max_body_size is None or len(body) <= max_body_size:
+        try:
+            return CurlCommand(f"-d {quote(body.decode('utf-8'))}")
+        except UnicodeDecodeError:
+            if b"\x00" not in body:
+                return CurlCommand(f"--data-binary {quote_binary(body)}")
+
+    body_file = BODY_FILE.format(index=next(_body_file_index))
+    return CurlCommand(f"--data-binary '@{body_file}'", body_file=body_file, body=body)
+
+
+def make_curl_from_request(request: Request, max_body_size: int | None = None) -> CurlCommand:
     """
     Генерирует команду cURL из HTTP-запроса httpx.
 
     :param request: HTTP-запрос, из которого будет сформирована команда cURL.
-    :return: Строка с командой cURL, содержащая метод запроса, URL, заголовки и тело (если есть).
+    :param max_body_size: Максимальный размер тела в байтах, которое подставляется в команду целиком.
+    :return: Команда cURL, содержащая метод запроса, URL, заголовки и тело (если есть), и файл тела,
+    если тело не подставлено в команду.
     """
+    body = make_curl_body(request, max_body_size)
+    is_form = body.command.startswith("-F ")
+
     # Создаем список с основной командой cURL, включая метод и URL
     result: list[str] = [f"curl -X '{request.method}'", f"'{request.url}'"]
 
     # Добавляем заголовки в формате -H "Header: Value"
     for header, value in request.headers.items():
-        result.append(f"-H '{header}: {value}'")
+        if not (is_form and header.lower() in FORM_HEADERS):
+            result.append(f"-H {quote(f'{header}: {value}')}")
 
     # Добавляем тело запроса, если оно есть (например, для POST, PUT)
-    try:
-        if body := request.content:
-            result.append(f"-d '{body.decode('utf-8')}'")
-    except RequestNotRead:
-        pass
+    if body.command:
+        result.append(body.command)
 
     # Объединяем части с переносами строк, исключая завершающий `\`
-    return " \\\n  ".join(result)
+    return CurlCommand(" \\\n  ".join(result), body_file=body.body_file, body=body.body)
+
+
+class CurlHistory:
+    """
+    Кольцевой буфер последних запросов текущего теста.
+
+    Запросы сохраняются как есть, а команды cURL формируются только по требованию
+    (например, когда тест упал).
+    """
+
+    def __init__(self, size: int):
+        """
+        :param size: Максимальное количество хранимых запросов.
+        """
+        self._lock = threading.Lock()
+        self._requests: deque[Request] = deque(maxlen=size)
+
+    def append(self, request: Request) -> None:
+        with self._lock:
+            self._requests.append(request)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._requests.clear()
+
+    def render(self, max_body_size: int | None = None) -> list[CurlCommand]:
+        """
+        Формирует команды cURL для всех сохраненных запросов и очищает буфер.
+
+        :param max_body_size: Максимальный размер тела в байтах, которое подставляется в команду целиком.
+        :return: Список команд cURL в порядке отправки запросов.
+        """
+        with self._lock:
+            requests = list(self._requests)
+            self._requests.clear()
+
+        return [make_curl_from_request(request, max_body_size) for request in requests]
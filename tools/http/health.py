@@ -0,0 +1,29 @@
+from httpx import Client, TransportError
+
+from tools.logger import get_logger
+
+logger = get_logger("HEALTH_CHECK")
+
+
+def check_server_health(url: str, timeout: float, log_errors: bool = True) -> str | None:
+    """
+    Проверяет, что сервер принимает соединения и отвечает за `timeout` секунд.
+
+    Любой HTTP-ответ (в том числе 404) означает, что сервер доступен.
+
+    :param url: Адрес сервера.
+    :param timeout: Таймаут проверки в секундах.
+    :param log_errors: Логировать недоступность сервера (не нужно, если сервер опрашивается до готовности).
+    :return: None, если сервер доступен, иначе описание ошибки.
+    """
+    try:
+        with Client(timeout=timeout) as client:
+            response = client.get(url)
+    except TransportError as error:
+        if log_errors:
+            logger.error("Server %s is not available: %r", url, error)
+
+        return repr(error)
+
+    logger.info("Server %s is available: %s %s", url, response.status_code, response.reason_phrase)
+    return None
@@ -0,0 +1,229 @@
+import asyncio
+import fnmatch
+import os
+import struct
+import time
+from contextvars import ContextVar
+from contextlib import contextmanager, asynccontextmanager
+from pathlib import Path
+from typing import Generator, AsyncGenerator
+
+from httpx import URL
+
+from clients.api_coverage import current_endpoint
+from config import settings, RateLimitGroupConfig
+from tools.logger import get_logger
+from tools.metrics.latency import latency_collector
+
+try:
+    import fcntl
+except ImportError:  # Windows: блокировки файлов между процессами через fcntl недоступны
+    fcntl = None
+
+logger = get_logger("RATE_LIMITER")
+
+# Состояние token bucket в файле: количество токенов и время последнего пополнения
+BUCKET_STATE = struct.Struct("dd")
+# Пауза между попытками занять слот конкурентности, когда все слоты заняты
+SLOT_POLL_INTERVAL = 0.005
+
+# Группы, слот которых уже занят текущим потоком/задачей. Запрос, выполняемый внутри другого запроса
+# той же группы (например, обновление токена из TokenAuth), не ждет второй слот: иначе при concurrency=1
+# он ждал бы слот, который держит он сам
+held_groups: ContextVar[frozenset[str]] = ContextVar("held_groups", default=frozenset())
+
+
+class RouteGroupLimiter:
+    """
+    Ограничитель одной группы эндпоинтов, общий для всех процессов (xdist-воркеров) хоста.
+
+    Состояние хранится в файлах каталога `directory` и защищается блокировками fcntl.flock, которые
+    ОС снимает сама, если процесс завершился аварийно:
+
+    - rate — token bucket: файл с количеством токенов, пополняемых со скоростью `rate` в секунду
+      (не больше `burst`). Запрос резервирует токен под блокировкой и, если токенов нет, ждет
+      без блокировки ровно до момента, когда зарезервированный токен появится;
+    - concurrency — `concurrency` файлов-слотов: запрос держит эксклюзивную блокировку одного слота
+      на время выполнения.
+    """
+
+    def __init__(self, name: str, config: RateLimitGroupConfig, directory: Path):
+        """
+        :param name: Название группы.
+        :param config: Настройки группы.
+        :param directory: Каталог файлов состояния, общий для всех воркеров.
+        """
+        self.name = name
+        self.config = config
+        self.bucket_file = directory.joinpath(f"{name}.bucket")
+        self.slot_files = [directory.joinpath(f"{name}.slot{index}") for index in range(config.concurrency or 0)]
+
+    def matches(self, key: str) -> bool:
+        return any(fnmatch.fnmatchcase(key, route) for route in self.config.routes)
+
+    def reserve_token(self) -> float:
+        """
+        Резервирует токен запроса.
+
+        :return: Сколько секунд нужно подождать до отправки запроса.
+        """
+        rate, burst = self.config.rate, max(self.config.burst, 1)
+        with open(self.bucket_file, "a+b") as file:
+            fcntl.flock(file, fcntl.LOCK_EX)
+            try:
+                file.seek(0)
+                data = file.read(BUCKET_STATE.size)
+                now = time.time()
+                tokens, updated = BUCKET_STATE.unpack(data) if len(data) == BUCKET_STATE.size else (burst, now)
+
+                # Токены могут уйти в минус: это запросы, которые уже ждут своей очереди
+                tokens = min(burst, tokens + (now - updated) * rate) - 1
+
+                file.seek(0)
+                file.truncate()
+                file.write(BUCKET_STATE.pack(tokens, now))
+            finally:
+                fcntl.flock(file, fcntl.LOCK_UN)
+
+        return -tokens / rate if tokens < 0 else 0.0
+
+    def try_acquire_slot(self) -> int | None:
+        """
+        Пытается занять свободный слот конкурентности.
+
+        :return: Дескриптор файла занятого слота или None, если все слоты заняты.
+        """
+        for slot_file in self.slot_files:
+            descriptor = os.open(slot_file, os.O_RDWR | os.O_CREAT)
+            try:
+                fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return descriptor
+            except BlockingIOError:
+                os.close(descriptor)
+
+        return None
+
+    @staticmethod
+    def release_slot(descriptor: int) -> None:
+        # Закрытие дескриптора снимает блокировку
+        os.close(descriptor)
+
+
+class RateLimiter:
+    """
+    Ограничитель запросов к серверу, общий для всех xdist-воркеров одного хоста.
+
+    Группы эндпоинтов задаются в настройках (RATE_LIMIT.GROUPS) шаблонами ключей вида
+    "METHOD шаблон эндпоинта" (как у метрик задержек), например "POST /api/v1/files". Запрос ограничивается
+    первой подходящей группой. Время ожидания попадает в метрику "throttle" эндпоинта (в миллисекундах).
+    """
+
+    def __init__(self, enabled: bool, directory: Path, groups: dict[str, RateLimitGroupConfig]):
+        """
+        :param enabled: Включено ли ограничение.
+        :param directory: Каталог файлов состояния, общий для всех воркеров.
+        :param groups: Настройки групп эндпоинтов по названию группы.
+        """
+        if enabled and groups and fcntl is None:
+            logger.warning("Rate limiting requires fcntl file locks and is disabled on this platform")
+            enabled = False
+
+        self.enabled = enabled and bool(groups)
+        self.directory = directory
+        self.groups = [RouteGroupLimiter(name, config, directory) for name, config in groups.items()]
+
+        if self.enabled:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def get_key(method: str, url: URL | str) -> str:
+        endpoint = current_endpoint.get() or URL(url).path
+        return f"{method} {endpoint}"
+
+    def get_group(self, key: str) -> RouteGroupLimiter | None:
+        return next((group for group in self.groups if group.matches(key)), None)
+
+    @staticmethod
+    def report_throttle(group: RouteGroupLimiter, key: str, throttled: float) -> None:
+        logger.debug("Request %s is throttled by group '%s' for %.1f ms", key, group.name, throttled * 1000)
+        latency_collector.record_value(key, "throttle", throttled * 1000)
+
+    @contextmanager
+    def limit(self, method: str, url: URL | str) -> Generator[None, None, None]:
+        """
+        Ждет разрешения на запрос и держит слот конкурентности группы, пока выполняется запрос.
+        Вложенный запрос той же группы выполняется в уже занятом слоте.
+
+        :param method: HTTP-метод запроса.
+        :param url: URL-адрес эндпоинта.
+        """
+        key = self.get_key(method, url)
+        group = self.get_group(key) if self.enabled else None
+        if group is None:
+            yield
+            return
+
+        started, throttled = time.perf_counter(), False
+        if group.config.rate and (delay := group.reserve_token()) > 0:
+            throttled = True
+            time.sleep(delay)
+
+        slot, token = None, None
+        if group.slot_files and group.name not in held_groups.get():
+            while (slot := group.try_acquire_slot()) is None:
+                throttled = True
+                time.sleep(SLOT_POLL_INTERVAL)
+
+            token = held_groups.set(held_groups.get() | {group.name})
+
+        if throttled:
+            self.report_throttle(group, key, time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            if slot is not None:
+                held_groups.reset(token)
+                group.release_slot(slot)
+
+    @asynccontextmanager
+    async def async_limit(self, method: str, url: URL | str) -> AsyncGenerator[None, None]:
+        """
+        Асинхронный аналог `limit`: ожидание не блокирует event loop.
+
+        :param method: HTTP-метод запроса.
+        :param url: URL-адрес эндпоинта.
+        """
+        key = self.get_key(method, url)
+        group = self.get_group(key) if self.enabled else None
+        if group is None:
+            yield
+            return
+
+        started, throttled = time.perf_counter(), False
+        if group.config.rate and (delay := group.reserve_token()) > 0:
+            throttled = True
+            await asyncio.sleep(delay)
+
+        slot, token = None, None
+        if group.slot_files and group.name not in held_groups.get():
+            while (slot := group.try_acquire_slot()) is None:
+                throttled = True
+                await asyncio.sleep(SLOT_POLL_INTERVAL)
+
+            token = held_groups.set(held_groups.get() | {group.name})
+
+        if throttled:
+            self.report_throttle(group, key, time.perf_counter() - started)
+        try:
+            yield
+        finally:
+            if slot is not None:
+                held_groups.reset(token)
+                group.release_slot(slot)
+
+
+rate_limiter = RateLimiter(
+    enabled=settings.rate_limit.enabled,
+    directory=settings.rate_limit.directory,
+    groups=settings.rate_limit.groups
+)
@@ -0,0 +1,186 @@
+import asyncio
+import random
+import threading
+import time
+from http import HTTPStatus
+
+import allure
+from httpx import BaseTransport, AsyncBaseTransport, Request, Response, ConnectError, ConnectTimeout, \
+    RemoteProtocolError
+
+from clients.api_coverage import current_endpoint
+from config import settings
+from tools.allure.steps import task_step
+from tools.logger import get_logger
+from tools.metrics.latency import latency_collector
+
+logger = get_logger("RETRY_TRANSPORT")
+
+# Ответы, при которых повтор имеет смысл: сервер или прокси перед ним временно недоступны
+RETRY_STATUSES = (HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT)
+# Ошибки соединения, при которых запрос не дошел до сервера или соединение из пула оказалось закрытым
+RETRY_ERRORS = (ConnectError, ConnectTimeout, RemoteProtocolError)
+# Безопасные и идемпотентные методы. POST не повторяется никогда: повтор создал бы сущность дважды
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+
+
+class RetryBudget:
+    """
+    Общий на процесс (xdist-воркер) лимит повторов за сессию.
+
+    Если бэкенд лежит, повторы только удлиняют прогон, поэтому после исчерпания бюджета
+    запросы выполняются без повторов.
+    """
+
+    def __init__(self, size: int):
+        """
+        :param size: Максимальное количество повторов за сессию.
+        """
+        self.size = size
+        self.used = 0
+
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        """
+        Занимает один повтор из бюджета.
+
+        :return: False, если бюджет исчерпан.
+        """
+        with self._lock:
+            if self.used >= self.size:
+                return False
+
+            self.used += 1
+            if self.used == self.size:
+                logger.warning("Retry budget of %s retries is exhausted, further requests are not retried", self.size)
+
+            return True
+
+
+class RetryTransport(BaseTransport, AsyncBaseTransport):
+    """
+    Транспорт, повторяющий идемпотентные запросы при ошибках соединения и ответах 502/503/504.
+
+    Пауза перед повтором — экспоненциальная с полным джиттером: случайное значение от 0 до
+    min(max_backoff, backoff * 2 ** (номер попытки - 1)). Каждый повтор отображается шагом Allure
+    и попадает в метрику "retry" эндпоинта (пауза в миллисекундах).
+    """
+
+    def __init__(
+            self,
+            transport: BaseTransport | AsyncBaseTransport,
+            budget: RetryBudget,
+            max_attempts: int,
+            backoff: float,
+            max_backoff: float,
+            retry_patch: bool = False
+    ):
+        """
+        :param transport: Транспорт, который выполняет запросы.
+        :param budget: Бюджет повторов сессии.
+        :param max_attempts: Максимальное количество попыток, включая первую.
+        :param backoff: Базовая пауза перед повтором в секундах.
+        :param max_backoff: Максимальная пауза перед повтором в секундах.
+        :param retry_patch: Повторять PATCH (идемпотентен, если обновляет поля фиксированными значениями).
+        """
+        self.transport = transport
+        self.budget = budget
+        self.max_attempts = max(max_attempts, 1)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.methods = (IDEMPOTENT_METHODS | {"PATCH"}) if retry_patch else IDEMPOTENT_METHODS
+
+    def get_delay(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+    def should_retry(self, request: Request, response: Response | None, attempt: int) -> bool:
+        """
+        Проверяет, нужно ли повторить запрос. Повтор занимает место в бюджете сессии.
+
+        :param request: Запрос.
+        :param response: Ответ или None, если запрос завершился ошибкой соединения.
+        :param attempt: Номер завершившейся попытки.
+        """
+        if response is not None and response.status_code not in RETRY_STATUSES:
+            return False
+
+        return request.method in self.methods and attempt < self.max_attempts and self.budget.acquire()
+
+    @staticmethod
+    def get_reason(response: Response | None, error: Exception | None) -> str:
+        return f"{response.status_code} {response.reason_phrase}" if response is not None else repr(error)
+
+    @staticmethod
+    def report_retry(request: Request, attempt: int, reason: str, delay: float) -> str:
+        """
+        Логирует повтор и добавляет паузу в метрики эндпоинта.
+
+        :return: Заголовок шага Allure.
+        """
+        logger.warning(
+            "Retry %s %s after %s (attempt %s, delay %.2f s)", request.method, request.url, reason, attempt + 1, delay
+        )
+        endpoint = current_endpoint.get() or request.url.path
+        latency_collector.record_value(f"{request.method} {endpoint}", "retry", delay * 1000)
+        return f"Retry {request.method} {request.url} after {reason} (attempt {attempt + 1})"
+
+    def handle_request(self, request: Request) -> Response:
+        attempt = 1
+        while True:
+            response, error = None, None
+            try:
+                response = self.transport.handle_request(request)
+            except RETRY_ERRORS as exception:
+                error = exception
+
+            if not self.should_retry(request, response, attempt):
+                if error is not None:
+                    raise error
+
+                return response
+
+            reason = self.get_reason(response, error)
+            if response is not None:
+                response.close()
+
+            delay = self.get_delay(attempt)
+            with allure.step(self.report_retry(request, attempt, reason, delay)):
+                time.sleep(delay)
+
+            attempt += 1
+
+    async def handle_async_request(self, request: Request) -> Response:
+        attempt = 1
+        while True:
+            response, error = None, None
+            try:
+                response = await self.transport.handle_async_request(request)
+            except RETRY_ERRORS as exception:
+                error = exception
+
+            if not self.should_retry(request, response, attempt):
+                if error is not None:
+                    raise error
+
+                return response
+
+            reason = self.get_reason(response, error)
+            if response is not None:
+                await response.aclose()
+
+            delay = self.get_delay(attempt)
+            # allure.step привязан к потоку: шаг повтора одной задачи попал бы внутрь шагов других задач
+            with task_step(self.report_retry(request, attempt, reason, delay)):
+                await asyncio.sleep(delay)
+
+            attempt += 1
+
+    def close(self) -> None:
+        self.transport.close()
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+retry_budget = RetryBudget(size=settings.retry.budget)
@@ -0,0 +1,105 @@
+import io
+import mmap
+import threading
+from pathlib import Path
+from typing import BinaryIO
+
+from config import settings
+
+
+class MappedFileReader(io.RawIOBase):
+    """
+    Файловый объект только для чтения поверх общего mmap.
+
+    У каждого читателя своя позиция, а данные файла не копируются в память процесса целиком:
+    httpx читает их кусками при отправке multipart-запроса.
+    """
+
+    def __init__(self, buffer: mmap.mmap, name: str):
+        """
+        :param buffer: Отображение файла в память.
+        :param name: Путь к файлу: httpx берет из него имя загружаемого файла, а cURL — ссылку на файл.
+        """
+        super().__init__()
+        self.buffer = buffer
+        self.name = name
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, target) -> int:
+        size = min(len(target), len(self.buffer) - self.position)
+        target[:size] = self.buffer[self.position:self.position + size]
+        self.position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        match whence:
+            case io.SEEK_SET:
+                self.position = offset
+            case io.SEEK_CUR:
+                self.position += offset
+            case io.SEEK_END:
+                self.position = len(self.buffer) + offset
+
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
+
+class UploadPayloadCache:
+    """
+    Кэш загружаемых файлов воркера.
+
+    Небольшие файлы (до `mmap_max_size` байт) отображаются в память один раз и переиспользуются всеми
+    загрузками, поэтому фикстуры не перечитывают один и тот же файл с диска. Большие файлы каждый раз
+    открываются заново и отправляются потоком с диска — память не зависит от размера файла.
+    """
+
+    def __init__(self, mmap_max_size: int):
+        """
+        :param mmap_max_size: Максимальный размер файла в байтах, который отображается в память.
+        """
+        self.mmap_max_size = mmap_max_size
+
+        self._lock = threading.Lock()
+        self._buffers: dict[Path, mmap.mmap] = {}
+
+    def get_buffer(self, path: Path) -> mmap.mmap:
+        with self._lock:
+            if path not in self._buffers:
+                with path.open("rb") as file:
+                    self._buffers[path] = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            return self._buffers[path]
+
+    def open(self, path: Path) -> BinaryIO:
+        """
+        Открывает файл для потоковой загрузки.
+
+        :param path: Путь к файлу.
+        :return: Файловый объект, который нужно закрыть после отправки запроса.
+        """
+        path = path.resolve()
+        size = path.stat().st_size
+
+        # mmap не поддерживает пустые файлы
+        if 0 < size <= self.mmap_max_size:
+            return MappedFileReader(self.get_buffer(path), name=str(path))
+
+        return path.open("rb")
+
+    def close(self) -> None:
+        with self._lock:
+            for buffer in self._buffers.values():
+                buffer.close()
+
+            self._buffers.clear()
+
+
+upload_payload_cache = UploadPayloadCache(mmap_max_size=settings.uploads.mmap_max_size)
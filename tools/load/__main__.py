@@ -0,0 +1,58 @@
+import argparse
+import json
+from pathlib import Path
+
+from tools.load.runner import LoadOptions, run_load_processes
+from tools.load.scenarios import SCENARIOS
+from tools.load.stats import format_load_report
+
+
+def parse_weight(value: str) -> tuple[str, float]:
+    name, _, weight = value.partition("=")
+    return name, float(weight or 1)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.load",
+        description="Load testing of the LMS API with the same clients as the functional tests"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="number of virtual users")
+    parser.add_argument("-d", "--duration", type=float, default=30, help="run duration in seconds")
+    parser.add_argument("-r", "--rps", type=float, default=None, help="target requests per second")
+    parser.add_argument("-p", "--processes", type=int, default=1, help="number of worker processes")
+    parser.add_argument(
+        "-s", "--scenario",
+        type=parse_weight,
+        action="append",
+        default=[],
+        metavar="NAME[=WEIGHT]",
+        help=f"scenario and its weight, can be repeated. Available: {', '.join(SCENARIOS)}"
+    )
+    parser.add_argument("--seed", type=int, default=None, help="seed for scenario selection")
+    parser.add_argument("--log-level", default="WARNING", help="minimal log level during the run")
+    parser.add_argument("--report", type=Path, default=None, help="path to save the JSON report")
+    return parser
+
+
+def main() -> None:
+    args = build_parser().parse_args()
+
+    options = LoadOptions(
+        concurrency=args.concurrency,
+        duration=args.duration,
+        rps=args.rps,
+        weights=dict(args.scenario),
+        seed=args.seed,
+        log_level=args.log_level.upper(),
+    )
+    report = run_load_processes(options, args.processes).build_report()
+
+    print(format_load_report(report))
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
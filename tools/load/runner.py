@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import math
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+
+from clients.api_coverage import tracker
+from tools.fakers import fake
+from tools.load.scenarios import LoadSession, Scenario, ScenarioPicker, get_scenarios
+from tools.load.stats import LoadStats
+from tools.logger import get_logger
+from tools.resources import resource_tracker
+from tools.seeding import derive_seed, generate_seed
+
+logger = get_logger("LOAD_RUNNER")
+
+
+@dataclass(frozen=True)
+class LoadOptions:
+    # Количество виртуальных пользователей (одновременных запросов)
+    concurrency: int = 10
+    # Длительность прогона в секундах
+    duration: float = 30.0
+    # Целевая частота запросов в секунду. None — без ограничения, нагрузка определяется concurrency
+    rps: float | None = None
+    # Веса сценариев по названию. Пустой словарь — все сценарии с весами по умолчанию
+    weights: dict[str, float] = field(default_factory=dict)
+    # Зерно для выбора сценариев и тестовых данных, чтобы прогоны были воспроизводимы
+    seed: int | None = None
+    # Минимальный уровень логов во время прогона (логи каждого запроса заметно снижают пропускную способность)
+    log_level: str = "WARNING"
+
+
+class RatePacer:
+    """
+    Ограничивает частоту запросов: выдает слоты с равным интервалом 1 / rps.
+    """
+
+    def __init__(self, rps: float):
+        self.interval = 1 / rps
+        self.next_slot = time.monotonic()
+
+    async def wait(self) -> None:
+        now = time.monotonic()
+        slot = max(self.next_slot, now)
+        self.next_slot = slot + self.interval
+        await asyncio.sleep(slot - now)
+
+
+class LoadRunner:
+    """
+    Выполняет сценарии нагрузки в одном event loop.
+
+    Каждый виртуальный пользователь (LoadSession) в цикле выбирает сценарий по весам и выполняет его,
+    пока не истечет время прогона. Если задан rps, запуск сценариев ограничивается общим RatePacer.
+    """
+
+    def __init__(self, scenarios: list[Scenario], options: LoadOptions):
+        self.options = options
+        self.picker = ScenarioPicker(scenarios, seed=options.seed)
+        self.pacer = RatePacer(options.rps) if options.rps else None
+        self.stats = LoadStats()
+
+    async def run_session(self, session: LoadSession, deadline: float) -> None:
+        while time.monotonic() < deadline:
+            if self.pacer:
+                await self.pacer.wait()
+                if time.monotonic() >= deadline:
+                    return
+
+            scenario = self.picker.pick()
+            started = time.perf_counter()
+            try:
+                response = await scenario.run(session)
+                is_error = response.is_error
+            except Exception as error:
+                logger.warning("Scenario %s failed: %r", scenario.name, error)
+                is_error = True
+
+            self.stats.record(scenario.name, (time.perf_counter() - started) * 1000, is_error)
+
+    async def run(self) -> LoadStats:
+        sessions = [LoadSession() for _ in range(self.options.concurrency)]
+        try:
+            # Подготовка данных не входит в замер
+            await asyncio.gather(*(session.start() for session in sessions))
+
+            self.stats = LoadStats()
+            if self.pacer:
+                self.pacer.next_slot = time.monotonic()
+
+            deadline = time.monotonic() + self.options.duration
+            await asyncio.gather(*(self.run_session(session, deadline) for session in sessions))
+        finally:
+            await asyncio.gather(*(session.close() for session in sessions))
+
+        return self.stats
+
+
+def run_load(options: LoadOptions) -> dict:
+    """
+    Выполняет нагрузочный прогон в текущем процессе.
+
+    :param options: Параметры прогона.
+    :return: Статистика прогона в виде словаря (`LoadStats.to_dict`), чтобы ее можно было передать между процессами.
+    """
+    # Нагрузочные запросы не должны попадать в покрытие функциональных тестов
+    tracker.enabled = False
+    # Созданные нагрузкой сущности не удаляются, поэтому и запоминать их не нужно
+    resource_tracker.enabled = False
+    logging.disable(getattr(logging, options.log_level) - 1)
+    # Процессы, созданные fork, наследуют состояние генератора fake: без своего seed они генерировали бы
+    # одинаковые данные
+    if options.seed is not None:
+        fake.seed(derive_seed(options.seed, "fake"))
+
+    runner = LoadRunner(get_scenarios(options.weights), options)
+    return asyncio.run(runner.run()).to_dict()
+
+
+def run_load_processes(options: LoadOptions, processes: int) -> LoadStats:
+    """
+    Распределяет прогон по нескольким процессам и объединяет их статистику.
+
+    Concurrency и rps делятся между процессами поровну. Каждый процесс получает свой seed, выведенный
+    из общего (или случайного, если seed не задан).
+
+    :param options: Общие параметры прогона.
+    :param processes: Количество процессов.
+    :return: Объединенная статистика.
+    """
+    if processes <= 1:
+        return LoadStats.from_dict(run_load(options))
+
+    seed = options.seed if options.seed is not None else generate_seed()
+    process_options = [
+        replace(
+            options,
+            concurrency=math.ceil(options.concurrency / processes),
+            rps=options.rps / processes if options.rps else None,
+            seed=derive_seed(seed, str(index)),
+        )
+        for index in range(processes)
+    ]
+
+    stats = LoadStats()
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        for result in executor.map(run_load, process_options):
+            stats.merge(LoadStats.from_dict(result))
+
+    return stats
@@ -0,0 +1,201 @@
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+from httpx import AsyncClient, Response
+
+from clients.courses.courses_client import AsyncCoursesClient
+from clients.courses.courses_schema import CreateCourseRequestSchema, GetCoursesQuerySchema, \
+    UpdateCourseRequestSchema
+from clients.exercises.exercises_client import AsyncExercisesClient
+from clients.exercises.exercises_schema import CreateExerciseRequestSchema, GetExercisesQuerySchema, \
+    UpdateExerciseRequestSchema
+from clients.files.files_client import AsyncFilesClient
+from clients.files.files_schema import CreateFileRequestSchema
+from clients.private_http_builder import get_async_private_http_client, AuthenticationUserSchema
+from clients.users.private_users_client import AsyncPrivateUsersClient
+from clients.users.public_users_client import AsyncPublicUsersClient, get_async_public_users_client
+from clients.users.users_schema import CreateUserRequestSchema
+from config import settings
+
+
+class LoadSession:
+    """
+    Виртуальный пользователь нагрузочного прогона.
+
+    При старте создает пользователя и по одной сущности каждого типа (файл, курс, задание), чтобы сценарии
+    чтения и обновления работали с существующими данными. Все приватные клиенты используют один httpx.AsyncClient,
+    поэтому вход выполняется один раз на сессию.
+    """
+
+    def __init__(self):
+        self.public_users_client: AsyncPublicUsersClient | None = None
+        self.http_client: AsyncClient | None = None
+
+        self.user_id: str | None = None
+        self.file_id: str | None = None
+        self.course_id: str | None = None
+        self.exercise_id: str | None = None
+
+    async def start(self) -> None:
+        self.public_users_client = get_async_public_users_client()
+
+        request = CreateUserRequestSchema()
+        response = await self.public_users_client.create_user(request)
+        self.user_id = response.model.user.id
+
+        self.http_client = await get_async_private_http_client(
+            AuthenticationUserSchema(email=request.email, password=request.password)
+        )
+
+        file = await self.files_client.create_file(
+            CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        )
+        self.file_id = file.model.file.id
+
+        course = await self.courses_client.create_course(
+            CreateCourseRequestSchema(preview_file_id=self.file_id, created_by_user_id=self.user_id)
+        )
+        self.course_id = course.model.course.id
+
+        exercise = await self.exercises_client.create_exercise(CreateExerciseRequestSchema(course_id=self.course_id))
+        self.exercise_id = exercise.model.exercise.id
+
+    async def close(self) -> None:
+        for client in (self.public_users_client, self.http_client):
+            if client is not None:
+                await getattr(client, "client", client).aclose()
+
+    @property
+    def private_users_client(self) -> AsyncPrivateUsersClient:
+        return AsyncPrivateUsersClient(client=self.http_client)
+
+    @property
+    def files_client(self) -> AsyncFilesClient:
+        return AsyncFilesClient(client=self.http_client)
+
+    @property
+    def courses_client(self) -> AsyncCoursesClient:
+        return AsyncCoursesClient(client=self.http_client)
+
+    @property
+    def exercises_client(self) -> AsyncExercisesClient:
+        return AsyncExercisesClient(client=self.http_client)
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    weight: float
+    run: Callable[[LoadSession], Awaitable[Response]]
+
+
+# Сценарии строятся из *_api методов доменных клиентов, веса по умолчанию отражают долю чтений в реальном трафике
+SCENARIOS: dict[str, Scenario] = {scenario.name: scenario for scenario in (
+    Scenario(
+        name="create_user",
+        weight=1,
+        run=lambda session: session.public_users_client.create_user_api(CreateUserRequestSchema())
+    ),
+    Scenario(
+        name="get_user_me",
+        weight=3,
+        run=lambda session: session.private_users_client.get_user_me_api()
+    ),
+    Scenario(
+        name="get_user",
+        weight=2,
+        run=lambda session: session.private_users_client.get_user_api(session.user_id)
+    ),
+    Scenario(
+        name="create_file",
+        weight=1,
+        run=lambda session: session.files_client.create_file_api(
+            CreateFileRequestSchema(upload_file=settings.test_data.image_png_file)
+        )
+    ),
+    Scenario(
+        name="get_file",
+        weight=2,
+        run=lambda session: session.files_client.get_file_api(session.file_id)
+    ),
+    Scenario(
+        name="create_course",
+        weight=1,
+        run=lambda session: session.courses_client.create_course_api(
+            CreateCourseRequestSchema(preview_file_id=session.file_id, created_by_user_id=session.user_id)
+        )
+    ),
+    Scenario(
+        name="get_courses",
+        weight=5,
+        run=lambda session: session.courses_client.get_courses_api(GetCoursesQuerySchema(user_id=session.user_id))
+    ),
+    Scenario(
+        name="get_course",
+        weight=5,
+        run=lambda session: session.courses_client.get_course_api(session.course_id)
+    ),
+    Scenario(
+        name="update_course",
+        weight=1,
+        run=lambda session: session.courses_client.update_course_api(session.course_id, UpdateCourseRequestSchema())
+    ),
+    Scenario(
+        name="create_exercise",
+        weight=1,
+        run=lambda session: session.exercises_client.create_exercise_api(
+            CreateExerciseRequestSchema(course_id=session.course_id)
+        )
+    ),
+    Scenario(
+        name="get_exercises",
+        weight=5,
+        run=lambda session: session.exercises_client.get_exercises_api(
+            GetExercisesQuerySchema(course_id=session.course_id)
+        )
+    ),
+    Scenario(
+        name="get_exercise",
+        weight=5,
+        run=lambda session: session.exercises_client.get_exercise_api(session.exercise_id)
+    ),
+    Scenario(
+        name="update_exercise",
+        weight=1,
+        run=lambda session: session.exercises_client.update_exercise_api(
+            session.exercise_id, UpdateExerciseRequestSchema()
+        )
+    ),
+)}
+
+
+class ScenarioPicker:
+    """
+    Выбирает сценарии случайно пропорционально их весам.
+    """
+
+    def __init__(self, scenarios: list[Scenario], seed: int | None = None):
+        self.scenarios = scenarios
+        self.weights = [scenario.weight for scenario in scenarios]
+        self.random = random.Random(seed)
+
+    def pick(self) -> Scenario:
+        return self.random.choices(self.scenarios, weights=self.weights)[0]
+
+
+def get_scenarios(weights: dict[str, float] | None = None) -> list[Scenario]:
+    """
+    Возвращает список сценариев с переопределенными весами.
+
+    :param weights: Веса по названию сценария. Если переданы, используются только перечисленные сценарии.
+    :raises ValueError: Если сценарий с таким названием не существует.
+    """
+    if not weights:
+        return list(SCENARIOS.values())
+
+    unknown = set(weights) - set(SCENARIOS)
+    if unknown:
+        raise ValueError(f"Unknown scenarios: {', '.join(sorted(unknown))}. Available: {', '.join(SCENARIOS)}")
+
+    return [Scenario(name=name, weight=weight, run=SCENARIOS[name].run) for name, weight in weights.items()]
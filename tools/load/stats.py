@@ -0,0 +1,125 @@
+import time
+
+from tools.metrics.histogram import LatencyHistogram
+
+
+class ScenarioStats:
+    """
+    Статистика одного сценария нагрузки: количество запросов, ошибок и гистограмма задержек.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        self.requests = 0
+        self.errors = 0
+        self.histogram = LatencyHistogram(precision)
+
+    def record(self, duration: float, is_error: bool) -> None:
+        """
+        :param duration: Время выполнения сценария в миллисекундах.
+        :param is_error: Сценарий завершился исключением или ответом со статусом >= 400.
+        """
+        self.requests += 1
+        self.errors += is_error
+        self.histogram.record(duration)
+
+    def merge(self, other: "ScenarioStats") -> None:
+        self.requests += other.requests
+        self.errors += other.errors
+        self.histogram.merge(other.histogram)
+
+    def to_dict(self) -> dict:
+        return {"requests": self.requests, "errors": self.errors, "histogram": self.histogram.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScenarioStats":
+        stats = cls()
+        stats.requests = data["requests"]
+        stats.errors = data["errors"]
+        stats.histogram = LatencyHistogram.from_dict(data["histogram"])
+        return stats
+
+
+class LoadStats:
+    """
+    Статистика нагрузочного прогона по сценариям. Статистики процессов объединяются через `merge`.
+    """
+
+    def __init__(self, precision: float = 0.01):
+        self.precision = precision
+        self.scenarios: dict[str, ScenarioStats] = {}
+        self.started = time.time()
+        self.finished = self.started
+
+    @property
+    def duration(self) -> float:
+        return max(self.finished - self.started, 0.001)
+
+    def record(self, scenario: str, duration: float, is_error: bool) -> None:
+        stats = self.scenarios.setdefault(scenario, ScenarioStats(self.precision))
+        stats.record(duration, is_error)
+        self.finished = time.time()
+
+    def merge(self, other: "LoadStats") -> None:
+        for name, stats in other.scenarios.items():
+            self.scenarios.setdefault(name, ScenarioStats(self.precision)).merge(stats)
+
+        self.started = min(self.started, other.started)
+        self.finished = max(self.finished, other.finished)
+
+    def to_dict(self) -> dict:
+        return {
+            "started": self.started,
+            "finished": self.finished,
+            "scenarios": {name: stats.to_dict() for name, stats in self.scenarios.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LoadStats":
+        stats = cls()
+        stats.started = data["started"]
+        stats.finished = data["finished"]
+        stats.scenarios = {name: ScenarioStats.from_dict(item) for name, item in data["scenarios"].items()}
+        return stats
+
+    def build_report(self) -> dict:
+        """
+        Формирует отчет: пропускная способность (RPS), доля ошибок и перцентили задержек по сценариям и в целом.
+        """
+        total = ScenarioStats(self.precision)
+        scenarios = {}
+        for name, stats in sorted(self.scenarios.items()):
+            total.merge(stats)
+            scenarios[name] = self.build_scenario_report(stats)
+
+        return {"duration": self.duration, "total": self.build_scenario_report(total), "scenarios": scenarios}
+
+    def build_scenario_report(self, stats: ScenarioStats) -> dict:
+        return {
+            "requests": stats.requests,
+            "errors": stats.errors,
+            "error_rate": stats.errors / stats.requests if stats.requests else 0.0,
+            "rps": stats.requests / self.duration,
+            **stats.histogram.summary(),
+        }
+
+
+def format_load_report(report: dict) -> str:
+    """
+    Форматирует отчет нагрузочного прогона в текстовую таблицу.
+
+    :param report: Отчет из `LoadStats.build_report`.
+    """
+    header = f"{'Scenario':<20} {'requests':>9} {'error %':>7} {'rps':>8} {'p50, ms':>9} {'p95, ms':>9} {'p99, ms':>9}"
+    rows = [*report["scenarios"].items(), ("TOTAL", report["total"])]
+
+    lines = [f"Duration: {report['duration']:.1f} s", header]
+    for name, item in rows:
+        if not item["requests"]:
+            continue
+
+        lines.append(
+            f"{name:<20} {item['requests']:>9} {item['error_rate']:>7.1%} {item['rps']:>8.1f} "
+            f"{item['p50']:>9.1f} {item['p95']:>9.1f} {item['p99']:>9.1f}"
+        )
+
+    return "\n".join(lines)
@@ -0,0 +1,155 @@
+import os
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from tools.http.health import check_server_health
+from tools.logger import get_logger
+
+logger = get_logger("LOCAL_SERVER")
+
+
+def get_free_port(host: str) -> int:
+    """
+    Возвращает свободный TCP-порт, выбранный ОС.
+
+    :param host: Адрес, на котором будет слушать сервер.
+    :return: Номер порта.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
+
+
+class LocalServerError(RuntimeError):
+    """
+    Локальный сервер не запустился или не ответил за отведенное время.
+    """
+
+
+class LocalServer:
+    """
+    Отдельный процесс uvicorn с LMS API и собственной базой SQLite.
+
+    Используется для запуска своего сервера на каждом xdist-воркере: воркеры не делят одну базу SQLite
+    и не упираются в ее блокировку на запись. Вывод сервера пишется в файл `server-{name}.log`
+    рядом с базой данных.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            app_dir: Path,
+            app: str,
+            host: str,
+            directory: Path,
+            env: dict[str, str]
+    ):
+        """
+        :param name: Имя экземпляра (идентификатор xdist-воркера), используется в именах файлов.
+        :param app_dir: Каталог с приложением сервера.
+        :param app: ASGI-приложение в формате uvicorn, например "main:app".
+        :param host: Адрес, на котором слушает сервер.
+        :param directory: Каталог для базы данных и лога сервера.
+        :param env: Дополнительные переменные окружения сервера (например, настройки JWT).
+        """
+        self.name = name
+        self.app_dir = app_dir
+        self.app = app
+        self.host = host
+        self.env = env
+
+        self.database_file = directory.joinpath(f"lms-{name}.db")
+        self.log_file = directory.joinpath(f"server-{name}.log")
+
+        self.port: int | None = None
+        self.process: subprocess.Popen | None = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def build_env(self) -> dict[str, str]:
+        return {
+            **os.environ,
+            **self.env,
+            "APP_HOST": self.url,
+            "DATABASE_URL": f"sqlite+aiosqlite:///{self.database_file.resolve()}",
+        }
+
+    def build_command(self) -> list[str]:
+        return [
+            sys.executable, "-m", "uvicorn", self.app,
+            "--host", self.host,
+            "--port", str(self.port),
+            "--app-dir", str(self.app_dir),
+        ]
+
+    def start(self, startup_timeout: float) -> None:
+        """
+        Запускает сервер на свободном порту с чистой базой данных и ждет, пока он начнет отвечать.
+
+        :param startup_timeout: Сколько секунд ждать готовности сервера.
+        :raises LocalServerError: Если сервер завершился или не ответил за `startup_timeout` секунд.
+        """
+        self.database_file.parent.mkdir(parents=True, exist_ok=True)
+        self.database_file.unlink(missing_ok=True)
+
+        self.port = get_free_port(self.host)
+        with open(self.log_file, "wb") as log:
+            self.process = subprocess.Popen(
+                self.build_command(), env=self.build_env(), stdout=log, stderr=subprocess.STDOUT
+            )
+
+        logger.info("Starting LMS server %s (pid %s), log: %s", self.url, self.process.pid, self.log_file)
+        self.wait_ready(startup_timeout)
+
+    def wait_ready(self, startup_timeout: float) -> None:
+        deadline = time.monotonic() + startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise LocalServerError(
+                    f"LMS server {self.url} exited with code {self.process.returncode}, "
+                    f"see {self.log_file}:\n{self.read_log_tail()}"
+                )
+
+            if check_server_health(self.url, timeout=1.0, log_errors=False) is None:
+                logger.info("LMS server %s is ready", self.url)
+                return
+
+            time.sleep(0.1)
+
+        self.stop()
+        raise LocalServerError(
+            f"LMS server {self.url} is not ready after {startup_timeout} s, see {self.log_file}:\n"
+            f"{self.read_log_tail()}"
+        )
+
+    def read_log_tail(self, lines: int = 20) -> str:
+        if not self.log_file.exists():
+            return ""
+
+        return "\n".join(self.log_file.read_text(errors="replace").splitlines()[-lines:])
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """
+        Останавливает сервер (SIGTERM, затем SIGKILL через `timeout` секунд) и удаляет его базу данных.
+
+        :param timeout: Сколько секунд ждать корректного завершения.
+        """
+        if self.process is None:
+            return
+
+        if self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+
+        logger.info("Stopped LMS server %s", self.url)
+        self.process = None
+        self.database_file.unlink(missing_ok=True)
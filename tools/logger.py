@@ -1,25 +1,116 @@
+import atexit
+import json
 import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
+
+from config import settings
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler, который не форматирует запись в вызывающем потоке.
+
+    Стандартный QueueHandler.prepare форматирует сообщение до постановки в очередь. Очередь живет внутри
+    процесса, поэтому запись можно передать как есть: форматирование и запись в поток выполняет QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JSONLinesFormatter(logging.Formatter):
+    """
+    Форматирует запись лога в одну строку JSON.
+    """
+
+    def __init__(self, worker: str):
+        """
+        :param worker: Идентификатор xdist-воркера, добавляемый в каждую запись.
+        """
+        super().__init__()
+        self.worker = worker
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "worker": self.worker,
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+
+        return json.dumps(data, ensure_ascii=False)
+
+
+def get_worker_id() -> str:
+    """
+    Возвращает идентификатор текущего xdist-воркера (gw0, gw1, ...) или "main" без xdist.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def build_queue_listener(log_queue: queue.SimpleQueue) -> QueueListener:
+    """
+    Создает QueueListener с обработчиками из настроек: консоль и (опционально) JSON-lines файл воркера.
+
+    :param log_queue: Очередь, из которой читаются записи лога.
+    :return: Объект QueueListener (еще не запущенный).
+    """
+    handlers: list[logging.Handler] = []
+
+    if settings.logging.console:
+        # Создаем обработчик, который будет выводить логи в консоль
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setLevel(settings.logging.level)
+        # Задаем форматирование лог-сообщений: включаем время, имя логгера, уровень и сообщение
+        console_handler.setFormatter(logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s'))
+        handlers.append(console_handler)
+
+    if settings.logging.json_dir is not None:
+        # Каждый воркер пишет в свой файл, чтобы не было конкурентной записи из разных процессов
+        settings.logging.json_dir.mkdir(parents=True, exist_ok=True)
+        worker = get_worker_id()
+
+        json_handler = logging.FileHandler(settings.logging.json_dir.joinpath(f"{worker}.jsonl"), encoding="utf-8")
+        json_handler.setLevel(settings.logging.json_level)
+        json_handler.setFormatter(JSONLinesFormatter(worker=worker))
+        handlers.append(json_handler)
+
+    return QueueListener(log_queue, *handlers, respect_handler_level=True)
+
+
+# Все логгеры пишут в одну очередь, а в консоль/файл записи выводит отдельный поток QueueListener
+log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler = DeferredQueueHandler(log_queue)
+
+queue_listener = build_queue_listener(log_queue)
+queue_listener.start()
+# При завершении процесса дожидаемся, пока все записи из очереди будут выведены
+atexit.register(queue_listener.stop)
 
 
 def get_logger(name: str) -> logging.Logger:
+    """
+    Возвращает логгер с указанным именем.
+
+    Повторный вызов с тем же именем не добавляет новый обработчик, поэтому строки лога не дублируются.
+    Сообщения стоит передавать в %-стиле (`logger.info("Got %s", value)`), тогда форматирование
+    выполняется только для записей, которые действительно будут выведены.
+
+    :param name: Имя логгера.
+    :return: Настроенный объект logging.Logger.
+    """
     # Инициализация логгера с указанным именем
     logger = logging.getLogger(name)
-    # Устанавливаем уровень логирования DEBUG для логгера,
-    # чтобы он обрабатывал все сообщения от DEBUG и выше
-    logger.setLevel(logging.DEBUG)
-
-    # Создаем обработчик, который будет выводить логи в консоль
-    handler = logging.StreamHandler()
-    # Устанавливаем уровень логирования DEBUG для обработчика,
-    # чтобы он обрабатывал все сообщения от DEBUG и выше
-    handler.setLevel(logging.DEBUG)
-
-    # Задаем форматирование лог-сообщений: включаем время, имя логгера, уровень и сообщение
-    formatter = logging.Formatter('%(asctime)s | %(name)s | %(levelname)s | %(message)s')
-    handler.setFormatter(formatter)  # Применяем форматтер к обработчику
-
-    # Добавляем обработчик к логгеру
-    logger.addHandler(handler)
+    logger.setLevel(settings.logging.level)
+
+    if queue_handler not in logger.handlers:
+        logger.addHandler(queue_handler)
 
     # Возвращаем настроенный логгер
     return logger
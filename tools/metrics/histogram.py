@@ -0,0 +1,110 @@
+import math
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек в стиле HDR Histogram с логарифмическими корзинами.
+
+    Значение попадает в корзину с номером floor(log(value) / log(1 + precision)), поэтому относительная
+    погрешность перцентилей не превышает `precision`, а память не зависит от количества значений.
+    Гистограммы с одинаковой точностью объединяются сложением корзин (например, с разных воркеров).
+    """
+
+    def __init__(self, precision: float = 0.01):
+        """
+        :param precision: Относительная погрешность значений (0.01 — 1%).
+        """
+        self.precision = precision
+
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.buckets: dict[int, int] = {}
+
+        self._log_base = math.log1p(precision)
+
+    def record(self, value: float) -> None:
+        """
+        Добавляет значение в гистограмму.
+
+        :param value: Значение задержки в миллисекундах.
+        """
+        value = max(value, 0.001)  # log(0) не определен, поэтому нулевые значения округляем до микросекунды
+        index = math.floor(math.log(value) / self._log_base)
+
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """
+        Добавляет значения другой гистограммы с той же точностью.
+
+        :param other: Объединяемая гистограмма.
+        """
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float | None:
+        """
+        Возвращает значение перцентиля.
+
+        :param percent: Перцентиль в процентах (например, 95).
+        :return: Значение в миллисекундах или None, если значений нет.
+        """
+        if self.count == 0:
+            return None
+
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                # Верхняя граница корзины, но не больше фактического максимума
+                return min((1 + self.precision) ** (index + 1), self.max)
+
+        return self.max
+
+    def summary(self) -> dict:
+        """
+        Формирует сводку по гистограмме: количество, min/max/mean и p50/p95/p99.
+        """
+        return {
+            "count": self.count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.total / self.count if self.count else None,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "p99": self.percentile(99),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "precision": self.precision,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LatencyHistogram":
+        histogram = cls(precision=data["precision"])
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        histogram.buckets = {int(index): count for index, count in data["buckets"].items()}
+        return histogram
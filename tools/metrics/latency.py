@@ -0,0 +1,256 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Generator
+
+from httpx import Response
+
+from clients.api_coverage import current_endpoint
+from config import settings
+from tools.metrics.histogram import LatencyHistogram
+
+# Фазы запроса, которые собираются в гистограммы.
+# DNS отдельно не измеряется: httpcore не публикует событие резолва, оно входит в connect.
+# throughput — скорость чтения тела в МБ/с, есть только у потоковых скачиваний файлов.
+# retry — пауза перед повтором запроса в мс (tools/http/retry.py), количество значений — число повторов
+# throttle — ожидание ограничителя запросов в мс (tools/http/rate_limit.py), есть только у задержанных запросов
+LATENCY_METRICS = ("total", "connect", "tls", "ttfb", "throughput", "retry", "throttle")
+# Байт в мегабайте для throughput
+BYTES_PER_MB = 1024 * 1024
+
+
+class RequestTimer:
+    """
+    Засекает фазы одного запроса через trace-расширение httpx (события httpcore).
+
+    - connect — установка TCP-соединения (только если соединение не взято из пула);
+    - tls — TLS-рукопожатие;
+    - ttfb — от начала отправки заголовков запроса до получения заголовков ответа.
+    """
+
+    def __init__(self):
+        self.created = time.perf_counter()
+        self.started: dict[str, float] = {}
+        self.durations: dict[str, float] = {}
+
+    @property
+    def extensions(self) -> dict:
+        return {"trace": self.trace}
+
+    @property
+    def async_extensions(self) -> dict:
+        return {"trace": self.async_trace}
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """
+        Обработчик событий httpcore вида "http11.send_request_headers.started".
+
+        :param event_name: Название события.
+        :param info: Данные события (не используются).
+        """
+        now = time.perf_counter()
+        prefix, _, stage = event_name.rpartition(".")
+        name = prefix.rpartition(".")[2]
+
+        if stage == "started":
+            self.started.setdefault(name, now)
+        elif stage != "complete":
+            return
+
+        match name:
+            case "connect_tcp":
+                self.durations["connect"] = (now - self.started[name]) * 1000
+            case "start_tls":
+                self.durations["tls"] = (now - self.started[name]) * 1000
+            case "receive_response_headers" if "send_request_headers" in self.started:
+                self.durations["ttfb"] = (now - self.started["send_request_headers"]) * 1000
+
+    def get_total(self, response: Response) -> float:
+        """
+        Возвращает полное время запроса в миллисекундах.
+
+        Берется из `response.elapsed`. Транспорты без потока ответа (например, httpx.MockTransport) его
+        не заполняют, тогда используется время с момента создания таймера.
+        """
+        try:
+            return response.elapsed.total_seconds() * 1000
+        except RuntimeError:
+            return (time.perf_counter() - self.created) * 1000
+
+    def add_throughput(self, response: Response) -> None:
+        """
+        Добавляет скорость чтения тела потокового ответа (МБ/с). Вызывается после чтения тела.
+
+        :param response: Закрытый потоковый ответ.
+        """
+        duration = self.get_total(response) / 1000
+        self.durations["throughput"] = response.num_bytes_downloaded / BYTES_PER_MB / duration if duration > 0 else 0.0
+
+    def finish(self, response: Response) -> None:
+        """
+        Сохраняет шаблон эндпоинта и задержки в `response.extensions` ("endpoint" и "latency").
+
+        :param response: Ответ сервера на запрос, который засекал таймер.
+        """
+        response.extensions["endpoint"] = current_endpoint.get() or response.request.url.path
+        response.extensions["latency"] = {**self.durations, "total": self.get_total(response)}
+
+    async def async_trace(self, event_name: str, info: dict) -> None:
+        self.trace(event_name, info)
+
+
+def get_response_key(response: Response) -> str:
+    """
+    Возвращает ключ эндпоинта ответа вида "GET /api/v1/users/{user_id}".
+    """
+    endpoint = response.extensions.get("endpoint") or response.request.url.path
+    return f"{response.request.method} {endpoint}"
+
+
+def get_response_time(response: Response) -> float:
+    """
+    Возвращает полное время запроса в миллисекундах.
+    """
+    if latency := response.extensions.get("latency"):
+        return latency["total"]
+
+    return response.elapsed.total_seconds() * 1000
+
+
+class LatencyCollector:
+    """
+    Потокобезопасный сборщик задержек запросов воркера.
+
+    Задержки группируются по ключу "METHOD шаблон эндпоинта" (например, "GET /api/v1/users/{user_id}"),
+    поэтому запросы к разным сущностям одного эндпоинта попадают в одну гистограмму.
+    """
+
+    def __init__(self, enabled: bool = True, precision: float = 0.01):
+        self.enabled = enabled
+        self.precision = precision
+        self.histograms: dict[str, dict[str, LatencyHistogram]] = {}
+
+        self._lock = threading.Lock()
+        self._observed: list[Response] | None = None
+
+    @contextmanager
+    def observe(self) -> Generator[list[Response], None, None]:
+        """
+        Собирает ответы на запросы, выполненные внутри блока (например, в теле теста).
+        """
+        self._observed = []
+        try:
+            yield self._observed
+        finally:
+            self._observed = None
+
+    def record(self, response: Response, timer: RequestTimer) -> None:
+        """
+        Добавляет задержки запроса в гистограммы его эндпоинта.
+
+        :param response: Ответ сервера.
+        :param timer: Таймер с фазами запроса.
+        """
+        timer.finish(response)
+        if self._observed is not None:
+            self._observed.append(response)
+
+        if not self.enabled:
+            return
+
+        key = get_response_key(response)
+        with self._lock:
+            histograms = self.histograms.setdefault(key, {})
+            for metric, value in response.extensions["latency"].items():
+                histograms.setdefault(metric, LatencyHistogram(self.precision)).record(value)
+
+    def record_value(self, key: str, metric: str, value: float) -> None:
+        """
+        Добавляет значение метрики, которое не берется из ответа (например, паузу перед повтором запроса).
+
+        :param key: Ключ эндпоинта вида "GET /api/v1/users/{user_id}".
+        :param metric: Название метрики.
+        :param value: Значение.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            histograms = self.histograms.setdefault(key, {})
+            histograms.setdefault(metric, LatencyHistogram(self.precision)).record(value)
+
+    def merge(self, data: dict) -> None:
+        """
+        Добавляет гистограммы, сохраненные методом `to_dict` (например, другим воркером).
+        """
+        with self._lock:
+            for key, metrics in data.items():
+                histograms = self.histograms.setdefault(key, {})
+                for metric, histogram in metrics.items():
+                    histogram = LatencyHistogram.from_dict(histogram)
+                    if metric in histograms:
+                        histograms[metric].merge(histogram)
+                    else:
+                        histograms[metric] = histogram
+
+    def clear(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                key: {metric: histogram.to_dict() for metric, histogram in metrics.items()}
+                for key, metrics in self.histograms.items()
+            }
+
+    def build_report(self) -> dict:
+        """
+        Формирует отчет: для каждого эндпоинта и фазы — количество, min/max/mean и p50/p95/p99
+        (в миллисекундах, для throughput — в МБ/с).
+        """
+        with self._lock:
+            return {
+                key: {metric: metrics[metric].summary() for metric in LATENCY_METRICS if metric in metrics}
+                for key, metrics in sorted(self.histograms.items())
+            }
+
+    def dump(self, file: Path) -> None:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(json.dumps(self.to_dict()))
+
+    def load(self, file: Path) -> None:
+        self.merge(json.loads(file.read_text()))
+
+
+def format_latency_report(report: dict) -> str:
+    """
+    Форматирует отчет о задержках в текстовую таблицу.
+
+    :param report: Отчет из `LatencyCollector.build_report`.
+    :return: Таблица с количеством запросов, повторов, временем ожидания ограничителя
+    и перцентилями total по эндпоинтам.
+    """
+    lines = [
+        f"{'Endpoint':<50} {'count':>7} {'retries':>7} {'throttled, s':>12} "
+        f"{'p50, ms':>10} {'p95, ms':>10} {'p99, ms':>10}"
+    ]
+    for key, metrics in report.items():
+        # Запросы, которые так и не получили ответ, есть только в метрике retry
+        if "total" not in metrics:
+            continue
+
+        total = metrics["total"]
+        retries = metrics["retry"]["count"] if "retry" in metrics else 0
+        throttled = metrics["throttle"]["count"] * metrics["throttle"]["mean"] / 1000 if "throttle" in metrics else 0
+        lines.append(
+            f"{key:<50} {total['count']:>7} {retries:>7} {throttled:>12.2f} "
+            f"{total['p50']:>10.1f} {total['p95']:>10.1f} {total['p99']:>10.1f}"
+        )
+
+    return "\n".join(lines)
+
+
+latency_collector = LatencyCollector(enabled=settings.metrics.enabled, precision=settings.metrics.precision)
@@ -0,0 +1,168 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Callable, Literal
+
+from httpx import Client, AsyncClient, Response
+from pydantic import BaseModel
+
+from clients.private_http_builder import AuthenticationUserSchema
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("RESOURCE_TRACKER")
+
+ResourceKind = Literal["exercise", "course", "file", "user"]
+
+# Порядок удаления: сначала сущности, которые ссылаются на другие (задание -> курс -> файл -> пользователь)
+DELETION_ORDER: tuple[ResourceKind, ...] = ("exercise", "course", "file", "user")
+
+
+class Resource(BaseModel, frozen=True):
+    """
+    Сущность, созданная во время прогона.
+
+    Удаляется от имени пользователя-владельца, токен которого использовался при создании.
+    """
+    kind: ResourceKind
+    id: str
+    owner: AuthenticationUserSchema
+
+
+class CleanupSummary(BaseModel):
+    """
+    Итог удаления сущностей в конце сессии.
+    """
+    # Включая сущности, которые к моменту очистки уже были удалены (404)
+    deleted: int = 0
+    # Сущность и причина ошибки удаления
+    failed: list[tuple[Resource, str]] = []
+
+
+def get_client_owner(client: Client | AsyncClient) -> AuthenticationUserSchema | None:
+    """
+    Возвращает пользователя, от имени которого работает приватный HTTP-клиент (TokenAuth).
+
+    :param client: Объект httpx.Client или httpx.AsyncClient.
+    :return: Email и пароль пользователя или None для публичного клиента.
+    """
+    login_request = getattr(client.auth, "login_request", None)
+    if login_request is None:
+        return None
+
+    return AuthenticationUserSchema(email=login_request.email, password=login_request.password)
+
+
+class ResourceTracker:
+    """
+    Потокобезопасный реестр сущностей, созданных через create_* методы клиентов.
+
+    Сущности, успешно удаленные через delete_*_api (например, в тестах удаления), из реестра убираются.
+    В конце сессии оставшиеся сущности удаляются пачками по типам в порядке DELETION_ORDER,
+    внутри одного типа — параллельно.
+    """
+
+    def __init__(self, enabled: bool, concurrency: int):
+        """
+        :param enabled: Запоминать созданные сущности.
+        :param concurrency: Максимальное количество параллельных запросов удаления.
+        """
+        self.enabled = enabled
+        self.concurrency = max(concurrency, 1)
+
+        self._lock = threading.Lock()
+        self._resources: dict[str, Resource] = {}
+
+    def track(self, kind: ResourceKind, entity_id: str, owner: AuthenticationUserSchema | None) -> None:
+        """
+        Запоминает созданную сущность.
+
+        :param kind: Тип сущности.
+        :param entity_id: Идентификатор сущности.
+        :param owner: Пользователь, от имени которого сущность будет удалена.
+        """
+        if not self.enabled or owner is None:
+            return
+
+        with self._lock:
+            self._resources[entity_id] = Resource(kind=kind, id=entity_id, owner=owner)
+
+    def untrack(self, entity_id: str) -> None:
+        with self._lock:
+            self._resources.pop(entity_id, None)
+
+    def change_owner_email(self, user_id: str, email: str) -> None:
+        """
+        Обновляет email пользователя-владельца после изменения пользователя, чтобы при очистке логин выполнялся
+        с новым email. Владелец определяется по идентификатору измененного пользователя, а не по клиенту,
+        который выполнил изменение.
+
+        :param user_id: Идентификатор измененного пользователя.
+        :param email: Новый email.
+        """
+        with self._lock:
+            user = self._resources.get(user_id)
+            if user is None or user.kind != "user" or user.owner.email == email:
+                return
+
+            owner, new_owner = user.owner, user.owner.model_copy(update={"email": email})
+            for entity_id, resource in self._resources.items():
+                if resource.owner == owner:
+                    self._resources[entity_id] = resource.model_copy(update={"owner": new_owner})
+
+    @property
+    def resources(self) -> list[Resource]:
+        with self._lock:
+            return list(self._resources.values())
+
+    def delete(self, resource: Resource, deleter: Callable[[Resource], Response]) -> str | None:
+        """
+        Удаляет одну сущность.
+
+        :param resource: Сущность.
+        :param deleter: Функция удаления сущности этого типа.
+        :return: Причина ошибки или None, если сущность удалена (в том числе ранее, ответ 404).
+        """
+        try:
+            response = deleter(resource)
+        except Exception as error:
+            return repr(error)
+
+        if not response.is_success and response.status_code != HTTPStatus.NOT_FOUND:
+            return f"{response.status_code} {response.text[:200]}"
+
+        if response.status_code == HTTPStatus.NOT_FOUND:
+            logger.debug("%s %s is already deleted", resource.kind, resource.id)
+
+        self.untrack(resource.id)
+        return None
+
+    def cleanup(self, deleters: dict[ResourceKind, Callable[[Resource], Response]]) -> CleanupSummary:
+        """
+        Удаляет все запомненные сущности.
+
+        :param deleters: Функции удаления по типам сущностей (вызывают delete_*_api клиентов).
+        :return: Итог удаления.
+        """
+        summary = CleanupSummary()
+        resources = self.resources
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for kind in DELETION_ORDER:
+                batch = [resource for resource in resources if resource.kind == kind]
+                # Следующий тип удаляется только после завершения всех удалений текущего
+                reasons = executor.map(lambda resource: self.delete(resource, deleters[kind]), batch)
+                for resource, reason in zip(batch, reasons):
+                    if reason is None:
+                        summary.deleted += 1
+                    else:
+                        summary.failed.append((resource, reason))
+
+        logger.info("Cleanup: deleted %s, failed %s", summary.deleted, len(summary.failed))
+        for resource, reason in summary.failed:
+            logger.warning("Failed to delete %s %s: %s", resource.kind, resource.id, reason)
+
+        return summary
+
+
+resource_tracker = ResourceTracker(enabled=settings.cleanup.enabled, concurrency=settings.cleanup.concurrency)
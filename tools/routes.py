@@ -7,6 +7,7 @@ class APIRoutes(str, Enum):
     COURSES = "/api/v1/courses"
     EXERCISES = "/api/v1/exercises"
     AUTHENTICATION = "/api/v1/authentication"
+    STATIC = "/static"
 
     def __str__(self):
         return self.value
\ No newline at end of file
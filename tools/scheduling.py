@@ -0,0 +1,202 @@
+import json
+from collections import OrderedDict
+from pathlib import Path
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling
+
+from config import settings
+from tools.logger import get_logger
+
+logger = get_logger("SCHEDULING")
+
+# Фазы теста, длительность которых сохраняется в истории. setup — стоимость подготовки фикстур теста
+TEST_PHASES = ("setup", "call", "teardown")
+# Области видимости фикстур, экземпляр которых разделяют несколько тестов одного воркера.
+# Фикстуры уровня session создаются один раз на воркер и на группировку не влияют
+SHARED_SCOPES = ("package", "module", "class")
+
+
+def get_shared_scope(item: pytest.Item) -> str | None:
+    """
+    Возвращает самую широкую область видимости фикстур теста, экземпляр которых разделяется с другими тестами.
+
+    :param item: Тест.
+    :return: "package", "module", "class" или None, если все фикстуры теста уровня function или session.
+    """
+    fixture_info = getattr(item, "_fixtureinfo", None)
+    if fixture_info is None:
+        return None
+
+    scopes = {
+        fixturedefs[-1].scope
+        for fixturedefs in fixture_info.name2fixturedefs.values()
+        if fixturedefs
+    }
+    return next((scope for scope in SHARED_SCOPES if scope in scopes), None)
+
+
+def get_group(nodeid: str, scope: str | None) -> str:
+    """
+    Возвращает группу теста: тесты одной группы выполняются одним воркером подряд и разделяют фикстуры.
+
+    :param nodeid: Nodeid теста, например "tests/users/test_users.py::TestUsers::test_get_user_me".
+    :param scope: Самая широкая разделяемая область видимости фикстур теста (см. get_shared_scope).
+    :return: Nodeid пакета, модуля или класса. Тест без разделяемых фикстур образует отдельную группу.
+    """
+    path, _, name = nodeid.partition("::")
+    match scope:
+        case "package":
+            return str(Path(path).parent)
+        case "module":
+            return path
+        case "class" if "::" in name:
+            return f"{path}::{name.split('::')[0]}"
+        case _:
+            return nodeid
+
+
+class DurationHistory:
+    """
+    История длительностей тестов из предыдущих запусков (по аналогии с coverage-history.json).
+
+    Для каждого теста хранятся длительности фаз setup/call/teardown в секундах и разделяемая область
+    видимости фикстур. Длительность сглаживается экспоненциальным скользящим средним, чтобы один медленный
+    запуск не перестраивал расписание целиком.
+    """
+
+    def __init__(self, smoothing: float = 0.5):
+        """
+        :param smoothing: Вес длительности последнего запуска в скользящем среднем (от 0 до 1).
+        """
+        self.smoothing = smoothing
+        self.tests: dict[str, dict] = {}
+
+    def load(self, file: Path) -> None:
+        if not file.exists():
+            return
+
+        try:
+            self.tests = json.loads(file.read_text())
+        except (ValueError, OSError) as error:
+            logger.warning("Duration history %s is not loaded: %r", file, error)
+            self.tests = {}
+
+    def dump(self, file: Path) -> None:
+        file.write_text(json.dumps(self.tests, indent=2, sort_keys=True))
+
+    def record(self, nodeid: str, phase: str, duration: float, scope: str | None = None) -> None:
+        """
+        Добавляет длительность фазы теста из последнего запуска.
+
+        :param nodeid: Nodeid теста.
+        :param phase: Фаза теста: setup, call или teardown.
+        :param duration: Длительность фазы в секундах.
+        :param scope: Разделяемая область видимости фикстур теста (передается с фазой setup).
+        """
+        test = self.tests.setdefault(nodeid, {})
+        previous = test.get(phase)
+        test[phase] = duration if previous is None else \
+            round(self.smoothing * duration + (1 - self.smoothing) * previous, 6)
+
+        if phase == "setup":
+            test["scope"] = scope
+
+    def get_duration(self, nodeid: str) -> float | None:
+        test = self.tests.get(nodeid)
+        if test is None:
+            return None
+
+        return sum(test.get(phase, 0.0) for phase in TEST_PHASES)
+
+    def get_scope(self, nodeid: str) -> str | None:
+        return self.tests.get(nodeid, {}).get("scope")
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    Планировщик pytest-xdist, распределяющий тесты по воркерам с учетом их длительности в прошлых запусках.
+
+    Тесты объединяются в группы по разделяемым фикстурам (см. get_group), группы отправляются воркерам
+    по убыванию суммарной длительности (longest processing time first): следующую группу получает воркер,
+    который первым освободился. Длинные группы стартуют в начале запуска, а короткие заполняют хвост,
+    поэтому воркеры завершают работу почти одновременно. Тесты без истории оцениваются средней длительностью.
+    """
+
+    def __init__(self, config: pytest.Config, history: DurationHistory, log=None):
+        super().__init__(config, log)
+        self.history = history
+        self.groups: dict[str, str] = {}
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self.groups.get(nodeid) or get_group(nodeid, self.history.get_scope(nodeid))
+
+    def _reschedule(self, node) -> None:
+        if node.shutting_down:
+            return
+
+        if not self.workqueue:
+            node.shutdown()
+            return
+
+        # В отличие от loadscope, воркер получает следующую группу, только когда выполняет последний тест:
+        # иначе длинные группы оседают в очереди занятого воркера, пока другой воркер простаивает
+        if self._pending_of(self.assigned_work[node]) > 1:
+            return
+
+        self._assign_work_unit(node)
+
+    def get_durations(self, collection: list[str]) -> dict[str, float]:
+        known = {nodeid: self.history.get_duration(nodeid) for nodeid in collection}
+        measured = [duration for duration in known.values() if duration is not None]
+        default = sum(measured) / len(measured) if measured else 1.0
+
+        return {nodeid: default if duration is None else duration for nodeid, duration in known.items()}
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        durations = self.get_durations(self.collection)
+        units: dict[str, dict[str, bool]] = {}
+        unit_durations: dict[str, float] = {}
+        for nodeid in self.collection:
+            group = self.groups[nodeid] = self._split_scope(nodeid)
+            units.setdefault(group, {})[nodeid] = False
+            unit_durations[group] = unit_durations.get(group, 0.0) + durations[nodeid]
+
+        self.workqueue = OrderedDict(
+            (group, units[group]) for group in sorted(units, key=lambda group: -unit_durations[group])
+        )
+
+        estimate = sum(unit_durations.values())
+        logger.info(
+            "Scheduled %s tests in %s groups on %s workers, estimated duration %.1f s (%.1f s per worker)",
+            len(self.collection), len(units), len(self.nodes), estimate, estimate / max(len(self.nodes), 1)
+        )
+
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        for _ in range(max(extra_nodes, 0)):
+            unused_node, _ = self.assigned_work.popitem()
+            unused_node.shutdown()
+
+        for node in self.nodes:
+            self._assign_work_unit(node)
+
+        for node in self.nodes:
+            self._reschedule(node)
+
+
+duration_history = DurationHistory(smoothing=settings.scheduling.smoothing)
@@ -0,0 +1,44 @@
+import hashlib
+import secrets
+
+from config import settings
+from tools.logger import get_worker_id
+
+
+def derive_seed(seed: int, *parts: str) -> int:
+    """
+    Детерминированно выводит дочерний seed из родительского и идентификаторов (воркера, теста).
+
+    :param seed: Родительский seed.
+    :param parts: Идентификаторы, например "gw0" или nodeid теста.
+    :return: 64-битный seed.
+    """
+    digest = hashlib.sha256(":".join([str(seed), *parts]).encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def generate_seed() -> int:
+    return secrets.randbits(32)
+
+
+class SessionSeed:
+    """
+    Seed запуска, из которого выводятся seed воркеров и тестов.
+
+    Seed теста зависит только от seed запуска и nodeid теста, поэтому данные теста воспроизводятся
+    при повторном запуске с тем же seed независимо от количества xdist-воркеров и порядка тестов.
+    """
+
+    def __init__(self, seed: int):
+        self.seed = seed
+
+    @property
+    def worker_seed(self) -> int:
+        return derive_seed(self.seed, get_worker_id())
+
+    def get_test_seed(self, nodeid: str) -> int:
+        return derive_seed(self.seed, nodeid)
+
+
+# Seed из настроек (FAKER.SEED) или случайный. В pytest переопределяется опцией --seed
+session_seed = SessionSeed(settings.faker.seed if settings.faker.seed is not None else generate_seed())
@@ -0,0 +1,213 @@
+import hashlib
+import math
+import os
+import random
+import struct
+import zlib
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+from config import settings
+
+KB = 1024
+MB = 1024 * KB
+GB = 1024 * MB
+
+FileKind = Literal["png", "jpeg", "pdf", "binary"]
+
+FILE_EXTENSIONS: dict[FileKind, str] = {"png": ".png", "jpeg": ".jpg", "pdf": ".pdf", "binary": ".bin"}
+
+# Меняется при изменении алгоритмов генерации, чтобы не использовать устаревший кэш
+GENERATOR_VERSION = 1
+
+# Файлы генерируются кусками, поэтому память не зависит от размера файла
+CHUNK_SIZE = MB
+
+
+class HashingWriter:
+    """
+    Записывает данные в файл, одновременно считая их SHA-256 и размер.
+    """
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> None:
+        self.file.write(data)
+        self.hash.update(data)
+        self.size += len(data)
+
+
+def iter_random_chunks(rng: random.Random, size: int):
+    while size > 0:
+        chunk = min(size, CHUNK_SIZE)
+        yield rng.randbytes(chunk)
+        size -= chunk
+
+
+def write_binary(writer: HashingWriter, size: int, rng: random.Random) -> None:
+    for chunk in iter_random_chunks(rng, size):
+        writer.write(chunk)
+
+
+def write_png_chunk(writer: HashingWriter, kind: bytes, data: bytes) -> None:
+    writer.write(struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data)))
+
+
+def write_png(writer: HashingWriter, size: int, rng: random.Random) -> None:
+    """
+    RGB-изображение из случайного шума. Данные не сжимаются (deflate level 0), поэтому размер файла
+    близок к запрошенному, а IDAT пишется несколькими чанками по мере накопления данных.
+    """
+    width = max(1, min(1024, int(math.sqrt(size / 3))))
+    row_size = 1 + width * 3  # Байт фильтра + пиксели строки
+    height = max(1, (size - 64) // row_size)
+
+    writer.write(b"\x89PNG\r\n\x1a\n")
+    write_png_chunk(writer, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+
+    compressor = zlib.compressobj(level=0)
+    buffer = bytearray()
+    for _ in range(height):
+        buffer += compressor.compress(b"\x00" + rng.randbytes(width * 3))
+        if len(buffer) >= CHUNK_SIZE:
+            write_png_chunk(writer, b"IDAT", bytes(buffer))
+            buffer.clear()
+
+    buffer += compressor.flush()
+    write_png_chunk(writer, b"IDAT", bytes(buffer))
+    write_png_chunk(writer, b"IEND", b"")
+
+
+def write_jpeg(writer: HashingWriter, size: int, rng: random.Random) -> None:
+    """
+    Baseline JPEG 8x8 серого цвета, дополненный до нужного размера COM-сегментами со случайными данными.
+    """
+    segment = lambda marker, data: marker + struct.pack(">H", len(data) + 2) + data
+
+    writer.write(b"\xff\xd8")  # SOI
+    writer.write(segment(b"\xff\xe0", b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"))
+    writer.write(segment(b"\xff\xdb", b"\x00" + b"\x01" * 64))  # Таблица квантования из единиц
+    writer.write(segment(b"\xff\xc0", b"\x08\x00\x08\x00\x08\x01\x01\x11\x00"))  # 8x8, одна компонента
+    # Таблицы Хаффмана с единственным кодом "0": категория DC 0 и EOB для AC
+    writer.write(segment(b"\xff\xc4", b"\x00" + b"\x01" + b"\x00" * 15 + b"\x00"))
+    writer.write(segment(b"\xff\xc4", b"\x10" + b"\x01" + b"\x00" * 15 + b"\x00"))
+
+    padding = max(size - 110, 0)
+    while padding > 0:
+        length = min(padding, 65533 - 2)
+        writer.write(segment(b"\xff\xfe", rng.randbytes(length)))
+        padding -= length + 4
+
+    writer.write(segment(b"\xff\xda", b"\x01\x01\x00\x00\x3f\x00"))  # SOS
+    writer.write(b"\x3f")  # DC = 0, EOB, добивка единицами
+    writer.write(b"\xff\xd9")  # EOI
+
+
+def write_pdf(writer: HashingWriter, size: int, rng: random.Random) -> None:
+    """
+    PDF из одной страницы, поток содержимого которой дополнен до нужного размера строками-комментариями.
+    """
+    offsets = []
+
+    def write_object(data: bytes) -> None:
+        offsets.append(writer.size)
+        writer.write(f"{len(offsets)} 0 obj\n".encode() + data + b"\nendobj\n")
+
+    writer.write(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    write_object(b"<< /Type /Catalog /Pages 2 0 R >>")
+    write_object(b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+    write_object(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R >>")
+
+    line_size = 64
+    lines = max((size - 640) // line_size, 0)
+    offsets.append(writer.size)
+    writer.write(f"4 0 obj\n<< /Length {lines * line_size} >>\nstream\n".encode())
+    for _ in range(lines):
+        writer.write(b"%" + rng.randbytes((line_size - 2) // 2).hex().encode() + b"\n")
+    writer.write(b"\nendstream\nendobj\n")
+
+    xref = writer.size
+    writer.write(f"xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n".encode())
+    for offset in offsets:
+        writer.write(f"{offset:010d} 00000 n \n".encode())
+    writer.write(f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode())
+
+
+WRITERS = {"png": write_png, "jpeg": write_jpeg, "pdf": write_pdf, "binary": write_binary}
+
+
+class SyntheticFileGenerator:
+    """
+    Генератор тестовых файлов заданного типа и размера с кэшем на диске.
+
+    Содержимое файла полностью определяется типом, размером и seed, поэтому файл генерируется один раз
+    и затем переиспользуется всеми воркерами и запусками. Имя файла — хэш этих параметров, рядом
+    хранится SHA-256 содержимого (файл .sha256) для проверки загруженных файлов.
+    """
+
+    def __init__(self, directory: Path, seed: int):
+        """
+        :param directory: Папка кэша сгенерированных файлов.
+        :param seed: Seed по умолчанию.
+        """
+        self.directory = directory
+        self.seed = seed
+
+    def get_path(self, kind: FileKind, size: int, seed: int) -> Path:
+        key = hashlib.sha256(f"{GENERATOR_VERSION}:{kind}:{size}:{seed}".encode()).hexdigest()
+        return self.directory.joinpath(f"{key[:32]}{FILE_EXTENSIONS[kind]}")
+
+    def get(self, kind: FileKind = "png", size: int = 64 * KB, seed: int | None = None) -> Path:
+        """
+        Возвращает путь к сгенерированному файлу, создавая его при первом обращении.
+
+        :param kind: Тип файла: png, jpeg, pdf или binary.
+        :param size: Примерный размер файла в байтах (для binary — точный).
+        :param seed: Seed генерации. По умолчанию используется seed генератора.
+        :return: Путь к файлу, подходящий для CreateFileRequestSchema.upload_file.
+        """
+        seed = self.seed if seed is None else seed
+        path = self.get_path(kind, size, seed)
+        if path.exists():
+            return path
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+        # Файл пишется во временный и переименовывается атомарно: параллельные воркеры не увидят недописанный файл
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with temp_path.open("wb") as file:
+            writer = HashingWriter(file)
+            WRITERS[kind](writer, size, random.Random(f"{kind}:{size}:{seed}"))
+
+        temp_path.with_suffix(".sha256").write_text(writer.hash.hexdigest())
+        os.replace(temp_path.with_suffix(".sha256"), path.with_name(f"{path.name}.sha256"))
+        os.replace(temp_path, path)
+        return path
+
+    @staticmethod
+    def get_hash(path: Path) -> str:
+        """
+        Возвращает SHA-256 содержимого файла. Для сгенерированных файлов берется из кэша.
+
+        :param path: Путь к файлу.
+        :return: Хэш в шестнадцатеричном виде.
+        """
+        hash_path = path.with_name(f"{path.name}.sha256")
+        if hash_path.exists():
+            return hash_path.read_text()
+
+        digest = hashlib.sha256()
+        with path.open("rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+
+synthetic_files = SyntheticFileGenerator(
+    directory=settings.test_data.generated_files_dir,
+    seed=settings.test_data.seed
+)